@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import warnings
 
+from continuum._version import __version__
+
 # Torch emits this when importing NVML bindings via the legacy module name.
 # Keep CLI output clean while leaving unrelated warnings visible.
 warnings.filterwarnings(
@@ -0,0 +1,4 @@
+from __future__ import annotations
+
+# Compatibility shim: launch implementation moved to continuum.launch.
+from continuum.launch.actions.command import *  # noqa: F401,F403
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import json
-from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
 
 import typer
 
+from continuum import __version__
+
 # Import registers built-in checks via decorators.
 from continuum.doctor.checks import cuda as _cuda_checks  # noqa: F401
 from continuum.doctor.checks import environment as _environment_checks  # noqa: F401
@@ -20,12 +21,7 @@ from continuum.doctor.runner import DoctorRunner
 
 
 def _resolve_hydra_version() -> str:
-    for dist_name in ("continuum-intelligence", "continuum"):
-        try:
-            return version(dist_name)
-        except PackageNotFoundError:
-            continue
-    return "0.0.0"
+    return __version__
 
 
 def _parse_csv_values(value: str | None) -> set[str]:
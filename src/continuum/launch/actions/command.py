@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import subprocess
+
+
+def run_command(
+    command: list[str],
+    timeout: float = 15,
+    env: dict[str, str] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(  # noqa: S603
+        command,
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+        check=False,
+        env=env,
+    )
+
+
+__all__ = ["run_command"]
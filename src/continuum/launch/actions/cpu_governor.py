@@ -1,13 +1,28 @@
 from __future__ import annotations
 
+import atexit
+import os
 import shutil
-import subprocess
 from pathlib import Path
 from typing import Any
 
+from continuum.launch.actions.command import run_command
 from continuum.launch.models import AccelerationAction, AccelerationActionResult, ExecutionContext, profile_gte
 
 _SCALING_GOVERNOR = Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor")
+_GOVERNOR_FD: int | None = None
+
+
+def _governor_fd() -> int | None:
+    # sysfs attributes regenerate on every read at offset 0, so one fd serves all re-reads.
+    global _GOVERNOR_FD
+    if _GOVERNOR_FD is None:
+        try:
+            _GOVERNOR_FD = os.open(_SCALING_GOVERNOR, os.O_RDONLY)
+        except OSError:
+            return None
+        atexit.register(os.close, _GOVERNOR_FD)
+    return _GOVERNOR_FD
 
 
 class CpuGovernorAction(AccelerationAction):
@@ -21,10 +36,11 @@ class CpuGovernorAction(AccelerationAction):
     profile_min = "minimal"
 
     def _read_governor(self) -> str | None:
-        if not _SCALING_GOVERNOR.exists():
+        fd = _governor_fd()
+        if fd is None:
             return None
         try:
-            return _SCALING_GOVERNOR.read_text(encoding="utf-8", errors="ignore").strip()
+            return os.pread(fd, 64, 0).decode("utf-8", errors="ignore").strip()
         except OSError:
             return None
 
@@ -95,7 +111,7 @@ class CpuGovernorAction(AccelerationAction):
 
         command = ["cpupower", "frequency-set", "-g", "performance"]
         try:
-            completed = subprocess.run(command, capture_output=True, text=True, timeout=15, check=False)
+            completed = run_command(command)
         except Exception as exc:  # noqa: BLE001
             return AccelerationActionResult(
                 action_id=self.id,
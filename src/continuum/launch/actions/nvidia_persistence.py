@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import re
-import subprocess
 from typing import Any
 
+from continuum.launch.actions.command import run_command
 from continuum.launch.models import AccelerationAction, AccelerationActionResult, ExecutionContext, profile_gte
 
 _PERSISTENCE_PATTERN = re.compile(r"Persistence Mode\s*:\s*(Enabled|Disabled)", re.IGNORECASE)
@@ -21,13 +21,7 @@ class NvidiaPersistenceAction(AccelerationAction):
 
     def _read_persistence(self) -> tuple[bool, dict[str, Any], list[str]]:
         try:
-            completed = subprocess.run(
-                ["nvidia-smi", "-q", "-d", "PERFORMANCE"],
-                capture_output=True,
-                text=True,
-                timeout=15,
-                check=False,
-            )
+            completed = run_command(["nvidia-smi", "-q", "-d", "PERFORMANCE"])
         except Exception as exc:  # noqa: BLE001
             return False, {}, [f"nvidia-smi failed: {type(exc).__name__}: {exc}"]
 
@@ -103,7 +97,7 @@ class NvidiaPersistenceAction(AccelerationAction):
 
         command = ["nvidia-smi", "-pm", "1"]
         try:
-            completed = subprocess.run(command, capture_output=True, text=True, timeout=15, check=False)
+            completed = run_command(command)
         except Exception as exc:  # noqa: BLE001
             return AccelerationActionResult(
                 action_id=self.id,
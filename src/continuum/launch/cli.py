@@ -256,8 +256,8 @@ def _run_plan_mode(
 
     results: list[AccelerationActionResult] = []
     for item in internal_data:
-        action = item["action"]
-        supported = bool(item["supported"])
+        action = item.action
+        supported = item.supported
 
         if action.id not in selected_ids:
             results.append(
@@ -269,9 +269,9 @@ def _run_plan_mode(
                     skipped_reason="Not selected",
                     requires_root=action.requires_root,
                     risk=action.risk,
-                    before=item.get("before", {}),
-                    after=item.get("after_preview", {}),
-                    commands=list(item.get("commands", [])),
+                    before=item.before,
+                    after=item.after_preview,
+                    commands=list(item.commands),
                     errors=[],
                 )
             )
@@ -287,9 +287,9 @@ def _run_plan_mode(
                     skipped_reason="Unsupported on this environment",
                     requires_root=action.requires_root,
                     risk=action.risk,
-                    before=item.get("before", {}),
-                    after=item.get("before", {}),
-                    commands=list(item.get("commands", [])),
+                    before=item.before,
+                    after=item.before,
+                    commands=list(item.commands),
                     errors=[],
                 )
             )
@@ -307,9 +307,9 @@ def _run_plan_mode(
                     skipped_reason="Action apply raised an exception",
                     requires_root=action.requires_root,
                     risk=action.risk,
-                    before=item.get("before", {}),
-                    after=item.get("before", {}),
-                    commands=list(item.get("commands", [])),
+                    before=item.before,
+                    after=item.before,
+                    commands=list(item.commands),
                     errors=[f"{type(exc).__name__}: {exc}"],
                 )
             )
@@ -14,6 +14,7 @@ from typing import Any
 from continuum.launch.reporting import write_json
 
 _CHECKPOINT_PATTERNS = ("*.ckpt", "*.pt", "*.pth", "*.safetensors")
+_STDOUT_TAIL_LINES = 40
 
 
 def _utc_now() -> str:
@@ -111,7 +112,8 @@ def _run_once(
     started = _utc_now()
     started_mono = monotonic()
     checkpoint_seen = known_checkpoint
-    recent_lines: deque[str] = deque(maxlen=200)
+    # Only the tail reaches the report, so keep just that many lines however long the child runs.
+    recent_lines: deque[str] = deque(maxlen=_STDOUT_TAIL_LINES)
     checkpoint_poll_mono = monotonic()
 
     _stderr_print(f"[launch] starting: {' '.join(command)}", quiet)
@@ -161,7 +163,7 @@ def _run_once(
         "command_argv": command,
         "return_code": return_code,
         "checkpoint_seen": str(checkpoint_seen) if checkpoint_seen else None,
-        "stdout_tail": list(recent_lines)[-40:],
+        "stdout_tail": list(recent_lines),
     }
 
     return return_code, attempt_report, checkpoint_seen
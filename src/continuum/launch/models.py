@@ -191,6 +191,18 @@ class AccelerationAction(ABC):
         return None
 
 
+@dataclass(frozen=True, slots=True)
+class PlannedAction:
+    action: AccelerationAction
+    supported: bool
+    recommended: bool
+    before: dict[str, Any] = field(default_factory=dict)
+    after_preview: dict[str, Any] = field(default_factory=dict)
+    check_notes: list[str] = field(default_factory=list)
+    plan_notes: list[str] = field(default_factory=list)
+    commands: list[str] = field(default_factory=list)
+
+
 def profile_gte(profile: str, minimum: str) -> bool:
     return PROFILE_ORDER.get(profile, -1) >= PROFILE_ORDER.get(minimum, -1)
 
@@ -222,6 +234,7 @@ __all__ = [
     "AccelerationPlan",
     "AccelerationActionResult",
     "AccelerationAction",
+    "PlannedAction",
     "profile_gte",
     "normalize_profile",
     "parse_csv_set",
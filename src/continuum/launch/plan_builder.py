@@ -4,11 +4,20 @@ import json
 import os
 import platform
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from continuum.launch.actions import register_builtin_actions
-from continuum.launch.models import ActionDescriptor, AccelerationAction, AccelerationPlan, ExecutionContext, normalize_profile
+from continuum.launch.models import (
+    ActionDescriptor,
+    AccelerationAction,
+    AccelerationPlan,
+    ExecutionContext,
+    PlannedAction,
+    normalize_profile,
+)
 from continuum.launch.plugins.loader import PluginLoadResult, load_plugins
 from continuum.launch.registry import clear_registry, filter_actions, get_actions, register_action
 
@@ -50,6 +59,39 @@ def build_context(cwd: Path | None = None) -> ExecutionContext:
     )
 
 
+def _evaluate_action(action: AccelerationAction, ctx: ExecutionContext, expert_mode: bool) -> PlannedAction:
+    supported = False
+    before: dict[str, Any] = {}
+    check_notes: list[str] = []
+    plan_notes: list[str] = []
+    commands: list[str] = []
+    after_preview: dict[str, Any] = {}
+    recommended = False
+
+    try:
+        supported, before, check_notes = action.check(ctx)
+        if supported:
+            recommended, commands, after_preview, plan_notes = action.plan(ctx)
+    except Exception as exc:  # noqa: BLE001
+        supported = False
+        check_notes = [f"{type(exc).__name__}: {exc}"]
+
+    if action.risk.lower() == "high" and not expert_mode:
+        recommended = False
+        plan_notes.append("High risk action is disabled unless expert profile is used")
+
+    return PlannedAction(
+        action=action,
+        supported=supported,
+        recommended=recommended,
+        before=before,
+        after_preview=after_preview,
+        check_notes=check_notes,
+        plan_notes=plan_notes,
+        commands=commands,
+    )
+
+
 def build_plan(
     profile: str,
     only: set[str] | None,
@@ -57,13 +99,14 @@ def build_plan(
     expert_mode: bool = False,
     include_timestamp: bool = True,
     cwd: Path | None = None,
-) -> tuple[AccelerationPlan, list[dict[str, Any]], ExecutionContext, PluginLoadResult]:
+) -> tuple[AccelerationPlan, list[PlannedAction], ExecutionContext, PluginLoadResult]:
     base = cwd if cwd is not None else Path.cwd()
     ctx = build_context(base)
     normalized_profile = normalize_profile(profile)
 
     clear_registry()
     register_builtin_actions()
+    builtin_actions = {id(action) for action in get_actions()}
 
     plugin_result = load_plugins(register_action, cwd=base)
 
@@ -76,9 +119,6 @@ def build_plan(
         categories=None,
     )
 
-    descriptors: list[ActionDescriptor] = []
-    internal_data: list[dict[str, Any]] = []
-
     runtime_ctx = ExecutionContext(
         os_name=ctx.os_name,
         is_linux=ctx.is_linux,
@@ -92,53 +132,31 @@ def build_plan(
         repo_root=ctx.repo_root,
     )
 
-    for action in filtered_actions:
-        supported = False
-        before: dict[str, Any] = {}
-        check_notes: list[str] = []
-        plan_notes: list[str] = []
-        commands: list[str] = []
-        after_preview: dict[str, Any] = {}
-        recommended = False
-
-        try:
-            supported, before, check_notes = action.check(runtime_ctx)
-            if supported:
-                recommended, commands, after_preview, plan_notes = action.plan(runtime_ctx)
-        except Exception as exc:  # noqa: BLE001
-            supported = False
-            check_notes = [f"{type(exc).__name__}: {exc}"]
-
-        if action.risk.lower() == "high" and not expert_mode:
-            recommended = False
-            plan_notes.append("High risk action is disabled unless expert profile is used")
-
-        descriptors.append(
-            ActionDescriptor(
-                action_id=action.id,
-                title=action.title,
-                category=action.category,
-                recommended=recommended,
-                risk=action.risk,
-                requires_root=action.requires_root,
-                supported=supported,
-                why=action.why,
-                commands=commands,
-            )
-        )
-
-        internal_data.append(
-            {
-                "action": action,
-                "supported": supported,
-                "recommended": recommended,
-                "before": before,
-                "after_preview": after_preview,
-                "check_notes": check_notes,
-                "plan_notes": plan_notes,
-                "commands": commands,
-            }
+    # Built-in probes are independent and mostly blocked on sysfs/subprocess I/O
+    # (nvidia-smi dominates), so they run concurrently. Plugin actions never agreed to be
+    # thread-safe: they are evaluated one at a time on this thread, in registry order.
+    evaluate = partial(_evaluate_action, ctx=runtime_ctx, expert_mode=expert_mode)
+    concurrent = [index for index, action in enumerate(filtered_actions) if id(action) in builtin_actions]
+    with ThreadPoolExecutor(max_workers=max(1, len(concurrent))) as executor:
+        futures = {index: executor.submit(evaluate, filtered_actions[index]) for index in concurrent}
+        internal_data = [
+            futures[index].result() if index in futures else evaluate(action) for index, action in enumerate(filtered_actions)
+        ]
+
+    descriptors = [
+        ActionDescriptor(
+            action_id=item.action.id,
+            title=item.action.title,
+            category=item.action.category,
+            recommended=item.recommended,
+            risk=item.action.risk,
+            requires_root=item.action.requires_root,
+            supported=item.supported,
+            why=item.action.why,
+            commands=item.commands,
         )
+        for item in internal_data
+    ]
 
     plan = AccelerationPlan.create(
         profile=normalized_profile,
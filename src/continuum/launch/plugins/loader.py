@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import importlib.util
-import subprocess
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
 
+from continuum.launch.actions.command import run_command
+
 PrePostHook = Callable[[dict[str, Any], dict[str, Any], set[str]], None]
 
 
@@ -38,6 +39,9 @@ def _load_module(file_path: Path) -> Any:
 
 
 def load_plugins(register_action: Callable[[Any], None], cwd: Path | None = None) -> PluginLoadResult:
+    # Plugin actions' check()/plan() are called serially from the planning thread, so they
+    # need not be thread-safe; they may still run while built-in probes are in flight and
+    # must treat the shared ExecutionContext as read-only.
     base = cwd if cwd is not None else Path.cwd()
     plugin_dir = base / ".hydra" / "launch.d"
     hooks = HookBundle()
@@ -102,12 +106,9 @@ def run_shell_hooks(paths: list[Path], ctx: dict[str, Any], plan: dict[str, Any]
     warnings: list[str] = []
     for path in paths:
         try:
-            completed = subprocess.run(
+            completed = run_command(
                 ["sh", str(path)],
-                capture_output=True,
-                text=True,
                 timeout=20,
-                check=False,
                 env={**ctx.get("env", {}), "ACCELERATE_SELECTED_IDS": ",".join(sorted(selected_ids))},
             )
             if completed.returncode != 0:
@@ -5,19 +5,33 @@ from typing import Iterable
 from continuum.launch.models import PROFILE_ORDER, AccelerationAction
 
 _REGISTRY: dict[str, AccelerationAction] = {}
+# Sorted view of _REGISTRY, rebuilt lazily after the registry changes.
+_SORTED: tuple[AccelerationAction, ...] | None = None
 
 
 def register_action(action: AccelerationAction | type[AccelerationAction]) -> None:
-    instance = action() if isinstance(action, type) else action
-    _REGISTRY[instance.id] = instance
+    register_actions((action,))
+
+
+def register_actions(actions: Iterable[AccelerationAction | type[AccelerationAction]]) -> None:
+    global _SORTED
+    for action in actions:
+        instance = action() if isinstance(action, type) else action
+        _REGISTRY[instance.id] = instance
+    _SORTED = None
 
 
 def get_actions() -> list[AccelerationAction]:
-    return [_REGISTRY[key] for key in sorted(_REGISTRY.keys())]
+    global _SORTED
+    if _SORTED is None:
+        _SORTED = tuple(_REGISTRY[key] for key in sorted(_REGISTRY.keys()))
+    return list(_SORTED)
 
 
 def clear_registry() -> None:
+    global _SORTED
     _REGISTRY.clear()
+    _SORTED = None
 
 
 def filter_actions(
@@ -57,6 +71,7 @@ def filter_actions(
 
 __all__ = [
     "register_action",
+    "register_actions",
     "get_actions",
     "clear_registry",
     "filter_actions",
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
@@ -14,13 +15,39 @@ except Exception:  # pragma: no cover
         def print(self, *args, **kwargs) -> None:  # noqa: ANN002, ANN003
             print(*args)
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
 from continuum.launch.models import ACCELERATE_SCHEMA_VERSION, AccelerationActionResult, AccelerationPlan, ExecutionContext
 from continuum.launch.plugins.loader import PluginLoadResult
 
 
 def write_json(path: Path, data: dict[str, Any]) -> None:
+    # Written to a sibling temp file and renamed so observers never read a partial report.
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n", encoding="utf-8")
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        with open(tmp_path, "wb") as handle:
+            handle.write(_dump_json(data))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _dump_json(data: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. ints beyond 64 bits).
+            pass
+    return (json.dumps(data, indent=2, sort_keys=True, ensure_ascii=False) + "\n").encode("utf-8")
 
 
 def write_state_report(report: dict[str, Any], out: Path | None = None, cwd: Path | None = None) -> Path:
@@ -65,17 +65,12 @@ def select_actions_interactively(
     if raw.lower() == "none":
         return set()
 
-    selected_ids: set[str] = set()
-    by_index = {str(i): rec.action_id for i, rec in enumerate(recommendations, start=1)}
-    known_ids = {rec.action_id for rec in recommendations}
+    # Indexes take precedence over ids, so they are merged last.
+    resolver = {rec.action_id: rec.action_id for rec in recommendations}
+    resolver.update((str(i), rec.action_id) for i, rec in enumerate(recommendations, start=1))
 
-    for part in [token.strip() for token in raw.split(",") if token.strip()]:
-        if part in by_index:
-            selected_ids.add(by_index[part])
-        elif part in known_ids:
-            selected_ids.add(part)
-
-    return selected_ids
+    tokens = (token.strip() for token in raw.split(","))
+    return {resolver[token] for token in tokens if token in resolver}
 
 
 __all__ = ["select_actions_interactively"]
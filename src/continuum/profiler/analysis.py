@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+import heapq
+from operator import itemgetter
 from typing import Any
 
+# Memory floors are STREAM Copy figures, i.e. read + write traffic (2x the bytes copied),
+# matching what the memory bandwidth benchmark reports.
+_MEM_FLOOR_GBPS = 50.0
+_MEM_FLOOR_APPLE_SILICON_GBPS = 120.0
+
 
 def classify_bottleneck(report: dict[str, Any]) -> dict[str, Any]:
     static_profile = _as_dict(report.get("static_profile"))
@@ -15,6 +22,9 @@ def classify_bottleneck(report: dict[str, Any]) -> dict[str, Any]:
     cpu_mean = _to_float(cpu.get("mean_iter_per_sec"))
     cpu_std = _to_float(cpu.get("std_iter_per_sec"))
     cpu_p95 = _to_float(cpu.get("p95_iter_per_sec"))
+    cpu_hw = _as_dict(cpu.get("hw_counters"))
+    cpu_ipc = _to_float(cpu_hw.get("ipc"))
+    cpu_cache_mpki = _to_float(cpu_hw.get("cache_mpki"))
 
     mem_mean = _to_float(mem.get("mean_gbps"))
     mem_std = _to_float(mem.get("std_gbps"))
@@ -38,7 +48,7 @@ def classify_bottleneck(report: dict[str, Any]) -> dict[str, Any]:
     arch = str(cpu_info.get("arch") or "")
     storage = _as_dict(static_profile.get("storage"))
 
-    mem_floor = 60.0 if ("darwin" in os_name.lower() and "arm" in arch.lower()) else 25.0
+    mem_floor = _MEM_FLOOR_APPLE_SILICON_GBPS if ("darwin" in os_name.lower() and "arm" in arch.lower()) else _MEM_FLOOR_GBPS
     disk_floor = _disk_floor(storage)
 
     signals: dict[str, Any] = {
@@ -48,6 +58,8 @@ def classify_bottleneck(report: dict[str, Any]) -> dict[str, Any]:
         "cpu_stability_ratio": _rounded(cpu_stability_ratio),
         "mem_stability_ratio": _rounded(mem_stability_ratio),
         "gpu_stability_ratio": _rounded(gpu_stability_ratio),
+        "cpu_ipc": _rounded(cpu_ipc),
+        "cpu_cache_mpki": _rounded(cpu_cache_mpki),
         "mem_expected_floor_gbps": mem_floor,
         "disk_expected_floor_mb_s": disk_floor,
         "disk_mean_read_mb_s": _rounded(disk_mean),
@@ -87,6 +99,14 @@ def classify_bottleneck(report: dict[str, Any]) -> dict[str, Any]:
         else:
             scores["memory_bandwidth"] += 0.1
 
+    # Hardware counters are direct evidence: a GEMM that retires few instructions per cycle
+    # while missing cache often is stalled on memory, whatever the throughput numbers say.
+    if cpu_ipc is not None and cpu_cache_mpki is not None and cpu_ipc < 1.0 and cpu_cache_mpki >= 10.0:
+        scores["memory_bandwidth"] += 0.5
+        reasons.append(
+            f"CPU benchmark IPC {cpu_ipc:.2f} with {cpu_cache_mpki:.1f} cache misses per 1k instructions indicates memory stalls."
+        )
+
     if cpu_mean is not None:
         cpu_iters = _to_float(cpu.get("iterations"))
         low_cpu = cpu_mean < 0.12
@@ -122,9 +142,8 @@ def classify_bottleneck(report: dict[str, Any]) -> dict[str, Any]:
         reasons.append("CPU, memory, GPU, and disk sustained benchmark signals are missing.")
         scores["unknown"] += 0.4
 
-    ordered = sorted(scores.items(), key=lambda item: item[1], reverse=True)
-    best_name, best_score = ordered[0]
-    second_name, second_score = ordered[1]
+    # Only the top two scores matter; nlargest keeps sorted()'s tie order.
+    (best_name, best_score), (second_name, second_score) = heapq.nlargest(2, scores.items(), key=itemgetter(1))
 
     primary: str | None = None
     secondary: str | None = None
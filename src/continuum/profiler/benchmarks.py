@@ -3,6 +3,9 @@ from __future__ import annotations
 from time import perf_counter
 from typing import Any
 
+_TARGET_MS = 200.0
+_CPU_PILOT_ITERATIONS = 10_000
+
 
 def run_benchmarks(static_only: bool) -> list[dict[str, Any]]:
     if static_only:
@@ -20,11 +23,13 @@ def run_benchmarks(static_only: bool) -> list[dict[str, Any]]:
     results: list[dict[str, Any]] = []
 
     try:
+        # Untimed pilot warms caches/bytecode and sizes the measured pass to the target window.
+        pilot_started = perf_counter()
+        _cpu_loop(_CPU_PILOT_ITERATIONS)
+        pilot_ms = (perf_counter() - pilot_started) * 1000.0
+        iterations = _scaled_count(_CPU_PILOT_ITERATIONS, pilot_ms)
         started = perf_counter()
-        iterations = 200_000
-        acc = 0
-        for i in range(iterations):
-            acc += i ^ 3
+        acc = _cpu_loop(iterations)
         elapsed = (perf_counter() - started) * 1000.0
         ops_per_sec = int(iterations / max(elapsed / 1000.0, 1e-9))
         results.append(
@@ -35,7 +40,7 @@ def run_benchmarks(static_only: bool) -> list[dict[str, Any]]:
                 "result": ops_per_sec,
                 "unit": "ops/s",
                 "duration_ms": round(elapsed, 3),
-                "details": {"iterations": iterations, "checksum": acc & 0xFFFF},
+                "details": {"iterations": iterations, "pilot_ms": round(pilot_ms, 3), "checksum": acc & 0xFFFF},
             }
         )
     except Exception as exc:  # noqa: BLE001
@@ -51,11 +56,16 @@ def run_benchmarks(static_only: bool) -> list[dict[str, Any]]:
         )
 
     try:
-        started = perf_counter()
         size = 4 * 1024 * 1024
         source = bytearray(size)
         dest = bytearray(size)
-        rounds = 16
+        # Untimed copy faults in both buffers so zero-fill page faults stay out of the timing.
+        dest[:] = source
+        pilot_started = perf_counter()
+        dest[:] = source
+        pilot_ms = (perf_counter() - pilot_started) * 1000.0
+        rounds = _scaled_count(1, pilot_ms)
+        started = perf_counter()
         for _ in range(rounds):
             dest[:] = source
         elapsed = (perf_counter() - started) * 1000.0
@@ -69,7 +79,7 @@ def run_benchmarks(static_only: bool) -> list[dict[str, Any]]:
                 "result": mbps,
                 "unit": "MB/s",
                 "duration_ms": round(elapsed, 3),
-                "details": {"bytes_per_round": size, "rounds": rounds},
+                "details": {"bytes_per_round": size, "rounds": rounds, "pilot_ms": round(pilot_ms, 3)},
             }
         )
     except Exception as exc:  # noqa: BLE001
@@ -87,4 +97,15 @@ def run_benchmarks(static_only: bool) -> list[dict[str, Any]]:
     return results
 
 
+def _scaled_count(pilot_count: int, pilot_ms: float) -> int:
+    return max(pilot_count, int(pilot_count * _TARGET_MS / max(pilot_ms, 1e-3)))
+
+
+def _cpu_loop(iterations: int) -> int:
+    acc = 0
+    for i in range(iterations):
+        acc += i ^ 3
+    return acc
+
+
 __all__ = ["run_benchmarks"]
@@ -1,10 +1,34 @@
 from __future__ import annotations
 
-import importlib
-import importlib.util
-from time import perf_counter
+import os
+from array import array
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
+from time import perf_counter_ns
 from typing import Any
 
+from continuum.profiler.perf_counters import hardware_counters
+from continuum.profiler.stats import as_positive_float, round_metrics, summarize, warm_up
+
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover
+    _np = None
+
+try:
+    from threadpoolctl import threadpool_info, threadpool_limits
+except Exception:  # pragma: no cover
+    threadpool_info = None  # type: ignore[assignment]
+    threadpool_limits = None  # type: ignore[assignment]
+
+_NS_PER_SEC = 1_000_000_000
+_TARGET_BATCH_NS = 50_000_000
+_MATRIX_SIZE = 2048
+# One square GEMM is N^3 fused multiply-adds, i.e. 2*N^3 floating point operations.
+_FLOPS_PER_ITER = 2.0 * _MATRIX_SIZE**3
+# float64 (DGEMM) is the default: it is the best-tuned BLAS path on most CPU builds.
+_CPU_DTYPES = ("float64", "float32")
+
 
 def run_cpu_benchmark(context: dict[str, Any]) -> dict[str, Any]:
     notes = context.setdefault("notes", [])
@@ -12,51 +36,73 @@ def run_cpu_benchmark(context: dict[str, Any]) -> dict[str, Any]:
         notes.append("CPU sustained benchmark skipped due to --static-only.")
         return _empty_payload()
 
-    warmup_sec = _as_positive_float(context.get("cpu_warmup"), default=2.0)
-    duration_sec = _as_positive_float(context.get("cpu_duration"), default=8.0)
+    warmup_sec = as_positive_float(context.get("cpu_warmup"), default=2.0)
+    duration_sec = as_positive_float(context.get("cpu_duration"), default=8.0)
+    adaptive_warmup = bool(context.get("adaptive_warmup", True))
+    dtype_name = str(context.get("cpu_dtype") or "float64").lower().strip()
+    if dtype_name not in _CPU_DTYPES:
+        notes.append(f"Unsupported CPU benchmark dtype {dtype_name!r}; using float64.")
+        dtype_name = "float64"
     empty = _empty_payload()
 
-    if importlib.util.find_spec("numpy") is None:
+    np = _np
+    if np is None:
         notes.append("NumPy is not installed; CPU sustained benchmark skipped.")
         return empty
 
     try:
-        np = importlib.import_module("numpy")
-    except Exception as exc:  # noqa: BLE001
-        notes.append(f"NumPy import failed; CPU sustained benchmark skipped: {type(exc).__name__}: {exc}")
-        return empty
-
-    try:
-        size = 2048
-        a = np.random.rand(size, size).astype(np.float32)
-        b = np.random.rand(size, size).astype(np.float32)
+        shape = (_MATRIX_SIZE, _MATRIX_SIZE)
+        dtype = getattr(np, dtype_name)
+        # Generate directly in the benchmark dtype rather than drawing float64 and casting.
+        rng = np.random.default_rng()
+        a = rng.random(shape, dtype=dtype)
+        b = rng.random(shape, dtype=dtype)
+        # Reused result buffer keeps the output matrix off the allocator between iterations.
+        out = np.empty(shape, dtype=dtype)
+        matmul = np.matmul
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Failed to allocate benchmark matrices: {type(exc).__name__}: {exc}")
         return empty
 
     try:
-        warmup_end = perf_counter() + warmup_sec
-        while perf_counter() < warmup_end:
-            _ = a @ b
-
-        iter_rates: list[float] = []
-        started = perf_counter()
-        end_at = started + duration_sec
-        iterations = 0
-
-        while perf_counter() < end_at:
-            lap_start = perf_counter()
-            _ = a @ b
-            lap_elapsed = perf_counter() - lap_start
-            if lap_elapsed > 0:
-                iter_rates.append(1.0 / lap_elapsed)
-            iterations += 1
-
-        measured_duration = perf_counter() - started
+        with _blas_thread_limit():
+            blas_backend, blas_threads = _blas_pool_info()
+            pc = perf_counter_ns
+            warm_up(partial(matmul, a, b, out=out), warmup_sec, pc, adaptive=adaptive_warmup)
+
+            # Time batches of matmuls rather than single calls so timer and dispatch
+            # overhead stays negligible next to the GEMM work being measured.
+            probe_start = pc()
+            matmul(a, b, out=out)
+            probe_ns = pc() - probe_start
+            batch = max(1, _TARGET_BATCH_NS // probe_ns) if probe_ns > 0 else 1
+
+            # Laps are kept as integer nanoseconds; conversion to rates waits until the
+            # timed window has closed.
+            lap_durations = array("q")
+            # Counters attach per thread, so they open after warmup has started the BLAS pool.
+            with hardware_counters(notes) as hw_counters:
+                started = pc()
+                end_at = started + int(duration_sec * _NS_PER_SEC)
+                iterations = 0
+
+                while pc() < end_at:
+                    lap_start = pc()
+                    for _step in range(batch):
+                        matmul(a, b, out=out)
+                    lap_ns = pc() - lap_start
+                    if lap_ns > 0:
+                        lap_durations.append(lap_ns)
+                    iterations += batch
+
+                measured_duration = (pc() - started) / _NS_PER_SEC
     except Exception as exc:  # noqa: BLE001
         notes.append(f"CPU sustained benchmark failed: {type(exc).__name__}: {exc}")
         return empty
 
+    lap_iters_ns = batch * _NS_PER_SEC
+    iter_rates = [lap_iters_ns / lap_ns for lap_ns in lap_durations]
+
     if not iter_rates:
         notes.append("CPU sustained benchmark collected zero valid iterations.")
         return empty
@@ -64,63 +110,70 @@ def run_cpu_benchmark(context: dict[str, Any]) -> dict[str, Any]:
     if iterations < 5:
         notes.append("CPU sustained benchmark collected fewer than 5 iterations; variance may be noisy.")
 
+    mean_rate, std_rate, p50_rate, p95_rate = summarize(iter_rates)
+    # GFLOPS is shape-independent and comparable across machines; it scales linearly
+    # with the per-lap rate, so rate percentiles map directly onto GFLOPS percentiles.
+    gflops_per_iter = _FLOPS_PER_ITER / 1e9
+    mean_gflops, p95_gflops, mean_rate, std_rate, p50_rate, p95_rate, measured_duration = round_metrics(
+        (
+            gflops_per_iter * mean_rate,
+            gflops_per_iter * p95_rate,
+            mean_rate,
+            std_rate,
+            p50_rate,
+            p95_rate,
+            measured_duration,
+        )
+    )
     payload = {
-        "mean_iter_per_sec": _round(_mean(iter_rates)),
-        "std_iter_per_sec": _round(_std(iter_rates)),
-        "p50_iter_per_sec": _round(_percentile(iter_rates, 50.0)),
-        "p95_iter_per_sec": _round(_percentile(iter_rates, 95.0)),
+        "dtype": dtype_name,
+        "blas_backend": blas_backend,
+        "blas_threads": blas_threads,
+        "mean_gflops": mean_gflops,
+        "p95_gflops": p95_gflops,
+        "mean_iter_per_sec": mean_rate,
+        "std_iter_per_sec": std_rate,
+        "p50_iter_per_sec": p50_rate,
+        "p95_iter_per_sec": p95_rate,
         "iterations": int(iterations),
-        "duration_sec": _round(measured_duration),
+        "duration_sec": measured_duration,
+        "hw_counters": hw_counters or None,
     }
     return {"cpu_sustained": payload}
 
 
-def _as_positive_float(value: Any, default: float) -> float:
-    try:
-        number = float(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
-
-
-def _mean(values: list[float]) -> float:
-    return sum(values) / len(values)
-
-
-def _std(values: list[float]) -> float:
-    if len(values) < 2:
-        return 0.0
-    m = _mean(values)
-    variance = sum((x - m) ** 2 for x in values) / len(values)
-    return variance ** 0.5
-
-
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    rank = (len(ordered) - 1) * (percentile / 100.0)
-    lo = int(rank)
-    hi = min(lo + 1, len(ordered) - 1)
-    frac = rank - lo
-    return ordered[lo] + (ordered[hi] - ordered[lo]) * frac
+def _blas_thread_limit() -> AbstractContextManager[Any]:
+    # Pin the BLAS pool to every logical CPU for the whole run so thread-count
+    # changes between laps do not show up as iteration variance.
+    if threadpool_limits is None:
+        return nullcontext()
+    return threadpool_limits(limits=os.cpu_count(), user_api="blas")
 
 
-def _round(value: float) -> float:
-    return round(float(value), 6)
+def _blas_pool_info() -> tuple[str | None, int | None]:
+    if threadpool_info is None:
+        return None, None
+    for pool in threadpool_info():
+        if pool.get("user_api") == "blas":
+            return pool.get("internal_api"), pool.get("num_threads")
+    return None, None
 
 
 def _empty_payload() -> dict[str, Any]:
     return {
         "cpu_sustained": {
+            "dtype": None,
+            "blas_backend": None,
+            "blas_threads": None,
+            "mean_gflops": None,
+            "p95_gflops": None,
             "mean_iter_per_sec": None,
             "std_iter_per_sec": None,
             "p50_iter_per_sec": None,
             "p95_iter_per_sec": None,
             "iterations": None,
             "duration_sec": None,
+            "hw_counters": None,
         }
     }
 
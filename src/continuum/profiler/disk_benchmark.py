@@ -1,13 +1,32 @@
 from __future__ import annotations
 
+import mmap
 import os
 import random
+import re
+import sys
 import tempfile
-from time import perf_counter
-from typing import Any
+from array import array
+from functools import partial
+from time import perf_counter_ns
+from typing import Any, Callable
 
+from continuum.profiler.stats import as_positive_float, as_positive_int, mean, round_metric, summarize
+
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover
+    _np = None
 
 _MB = 1024 * 1024
+_NS_PER_SEC = 1_000_000_000
+_CACHE_DROP_INTERVAL = 1024
+_OFFSET_TABLE_SIZE = 65_536
+_OFFSET_SEED = 0xC0FFEE
+# Memory-backed filesystems: reads never reach a device, so timings would measure RAM.
+_RAM_FILESYSTEMS = frozenset({"tmpfs", "ramfs"})
+# mountinfo escapes space, tab, newline and backslash in paths as \NNN octal.
+_MOUNTINFO_ESCAPE = re.compile(r"\\([0-7]{3})")
 
 
 def run_disk_benchmark(context: dict[str, Any]) -> dict[str, Any]:
@@ -19,58 +38,83 @@ def run_disk_benchmark(context: dict[str, Any]) -> dict[str, Any]:
         notes.append("Disk random I/O benchmark skipped due to --no-disk.")
         return _empty_payload()
 
-    warmup_sec = _as_positive_float(context.get("disk_warmup"), default=2.0)
-    duration_sec = _as_positive_float(context.get("disk_duration"), default=8.0)
-    size_mb = _as_positive_int(context.get("disk_size_mb"), default=256)
+    warmup_sec = as_positive_float(context.get("disk_warmup"), default=2.0)
+    duration_sec = as_positive_float(context.get("disk_duration"), default=8.0)
+    size_mb = as_positive_int(context.get("disk_size_mb"), default=256)
     file_size = max(1 * _MB, size_mb * _MB)
     block_size = 4 * 1024
 
+    temp_dir = tempfile.gettempdir()
+    fs_type = _fs_type(temp_dir)
+    if fs_type in _RAM_FILESYSTEMS:
+        notes.append(f"Disk random I/O benchmark skipped: temp dir {temp_dir} is on {fs_type} (memory-backed).")
+        return _empty_payload()
+
     file_path: str | None = None
+    read_fd: int | None = None
     try:
-        fd, file_path = tempfile.mkstemp(prefix="continuum_disk_", suffix=".bin")
-        os.close(fd)
-
-        with open(file_path, "wb") as f:
-            chunk = os.urandom(1024 * 1024)
+        fd, file_path = tempfile.mkstemp(prefix="continuum_disk_", suffix=".bin", dir=temp_dir)
+        # Fill through the descriptor mkstemp already opened; one random chunk is reused.
+        with os.fdopen(fd, "wb", buffering=0) as f:
+            chunk = memoryview(os.urandom(_MB))
             remaining = file_size
             while remaining > 0:
-                write_n = min(len(chunk), remaining)
-                f.write(chunk[:write_n])
-                remaining -= write_n
-            f.flush()
+                remaining -= f.write(chunk[: min(len(chunk), remaining)])
             os.fsync(f.fileno())
 
         max_offset = max(0, file_size - block_size)
 
-        rates: list[float] = []
-        iops_samples: list[float] = []
+        # One sample per read adds up to hundreds of thousands over a run; double arrays
+        # store them unboxed and hand NumPy a zero-copy buffer for aggregation.
+        rates = array("d")
+        iops_samples = array("d")
         iterations = 0
 
-        with open(file_path, "rb", buffering=0) as f:
-            warmup_end = perf_counter() + warmup_sec
-            while perf_counter() < warmup_end:
-                offset = random.randint(0, max_offset) if max_offset > 0 else 0
-                f.seek(offset)
-                _ = f.read(block_size)
-
-            started = perf_counter()
-            end_at = started + duration_sec
-            while perf_counter() < end_at:
-                offset = random.randint(0, max_offset) if max_offset > 0 else 0
-                lap_start = perf_counter()
-                f.seek(offset)
-                data = f.read(block_size)
-                elapsed = perf_counter() - lap_start
-                if elapsed > 0 and data:
-                    mb_s = (len(data) / _MB) / elapsed
-                    rates.append(mb_s)
-                    iops_samples.append(1.0 / elapsed)
-                iterations += 1
-            measured_duration = perf_counter() - started
+        read_fd, direct_io = _open_for_reads(file_path)
+        # The file was just written, so every page is cached; evict it (and again
+        # after warmup and periodically while measuring) to time device reads, not RAM.
+        # O_DIRECT reads skip the cache outright, so eviction only matters without it.
+        if not _bypass_page_cache(read_fd, file_size) and not direct_io:
+            notes.append("Disk benchmark could not bypass the OS page cache; results may reflect cached reads.")
+
+        read_block = _block_reader(read_fd, block_size)
+        # Block-aligned offsets are drawn in bulk outside the timed laps and refilled
+        # when exhausted; the fixed seed keeps the access pattern identical across runs.
+        rng = random.Random(_OFFSET_SEED)
+        offsets = _offset_table(max_offset, block_size, rng)
+        cursor = 0
+        pc = perf_counter_ns
+        warmup_end = pc() + int(warmup_sec * _NS_PER_SEC)
+        while pc() < warmup_end:
+            if cursor == len(offsets):
+                offsets, cursor = _offset_table(max_offset, block_size, rng), 0
+            _ = read_block(offsets[cursor])
+            cursor += 1
+        _bypass_page_cache(read_fd, file_size)
+
+        started = pc()
+        end_at = started + int(duration_sec * _NS_PER_SEC)
+        while pc() < end_at:
+            if not direct_io and iterations and iterations % _CACHE_DROP_INTERVAL == 0:
+                _bypass_page_cache(read_fd, file_size)
+            if cursor == len(offsets):
+                offsets, cursor = _offset_table(max_offset, block_size, rng), 0
+            offset = offsets[cursor]
+            cursor += 1
+            lap_start = pc()
+            read_bytes = read_block(offset)
+            lap_ns = pc() - lap_start
+            if lap_ns > 0 and read_bytes:
+                rates.append(read_bytes * _NS_PER_SEC / (_MB * lap_ns))
+                iops_samples.append(_NS_PER_SEC / lap_ns)
+            iterations += 1
+        measured_duration = (pc() - started) / _NS_PER_SEC
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Disk random I/O benchmark failed: {type(exc).__name__}: {exc}")
         return _empty_payload()
     finally:
+        if read_fd is not None:
+            os.close(read_fd)
         if file_path:
             try:
                 os.remove(file_path)
@@ -83,62 +127,112 @@ def run_disk_benchmark(context: dict[str, Any]) -> dict[str, Any]:
     if iterations < 5:
         notes.append("Disk random I/O benchmark collected fewer than 5 iterations; variance may be noisy.")
 
+    mean_rate, std_rate, p50_rate, p95_rate = summarize(rates)
     return {
         "disk_random_io": {
-            "mean_read_mb_s": _round(_mean(rates)),
-            "std_read_mb_s": _round(_std(rates)),
-            "p50_read_mb_s": _round(_percentile(rates, 50.0)),
-            "p95_read_mb_s": _round(_percentile(rates, 95.0)),
-            "mean_iops": _round(_mean(iops_samples)),
+            "mean_read_mb_s": round_metric(mean_rate),
+            "std_read_mb_s": round_metric(std_rate),
+            "p50_read_mb_s": round_metric(p50_rate),
+            "p95_read_mb_s": round_metric(p95_rate),
+            "mean_iops": round_metric(mean(iops_samples)),
             "iterations": int(iterations),
-            "duration_sec": _round(measured_duration),
+            "duration_sec": round_metric(measured_duration),
         }
     }
 
 
-def _as_positive_float(value: Any, default: float) -> float:
-    try:
-        number = float(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
+def _offset_table(max_offset: int, block_size: int, rng: random.Random) -> list[int]:
+    blocks = max_offset // block_size + 1
+    if _np is not None:
+        picks = _np.random.default_rng(rng.getrandbits(64)).integers(0, blocks, size=_OFFSET_TABLE_SIZE, dtype=_np.int64)
+        # Plain list indexing is cheaper than ndarray scalar access in the hot loop.
+        return (picks * block_size).tolist()
+    getrandbits = rng.getrandbits
+    bits = blocks.bit_length()
+    return [(getrandbits(bits) % blocks) * block_size for _ in range(_OFFSET_TABLE_SIZE)]
 
 
-def _as_positive_int(value: Any, default: int) -> int:
+def _fs_type(path: str) -> str | None:
+    # Linux only: the filesystem type of the longest mount point containing the path.
+    if not sys.platform.startswith("linux"):
+        return None
     try:
-        number = int(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
-
-
-def _mean(values: list[float]) -> float:
-    return sum(values) / len(values)
-
+        with open("/proc/self/mountinfo", encoding="utf-8", errors="surrogateescape") as handle:
+            lines = handle.readlines()
+    except OSError:
+        return None
 
-def _std(values: list[float]) -> float:
-    if len(values) < 2:
-        return 0.0
-    m = _mean(values)
-    variance = sum((x - m) ** 2 for x in values) / len(values)
-    return variance ** 0.5
-
-
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    rank = (len(ordered) - 1) * (percentile / 100.0)
-    lo = int(rank)
-    hi = min(lo + 1, len(ordered) - 1)
-    frac = rank - lo
-    return ordered[lo] + (ordered[hi] - ordered[lo]) * frac
-
-
-def _round(value: float) -> float:
-    return round(float(value), 6)
+    try:
+        target = os.path.realpath(path)
+        best_mount = ""
+        best_type: str | None = None
+        for line in lines:
+            # "<id> <parent> <dev> <root> <mount point> <options...> - <fstype> <source> <super options>"
+            fields, _sep, tail = line.partition(" - ")
+            parts = fields.split()
+            if len(parts) < 5 or not tail.split():
+                continue
+            mount_point = _MOUNTINFO_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), parts[4])
+            prefix = mount_point.rstrip("/") + "/"
+            if (target == mount_point or target.startswith(prefix)) and len(mount_point) >= len(best_mount):
+                best_mount = mount_point
+                best_type = tail.split()[0]
+    except (ValueError, OSError):
+        return None
+    return best_type
+
+
+def _open_for_reads(path: str) -> tuple[int, bool]:
+    # O_DIRECT (Linux) reads go straight to the device; filesystems such as tmpfs reject
+    # it, in which case the page-cache eviction in _bypass_page_cache has to do the job.
+    flags = os.O_RDONLY | getattr(os, "O_BINARY", 0)
+    direct = getattr(os, "O_DIRECT", 0)
+    if direct:
+        try:
+            return os.open(path, flags | direct), True
+        except OSError:
+            pass
+    return os.open(path, flags), False
+
+
+def _block_reader(fd: int, block_size: int) -> Callable[[int], int]:
+    # Each sample is one positioned syscall into a reused buffer, so the timed region
+    # neither seeks separately nor allocates a fresh bytes object per read. An anonymous
+    # mapping is page aligned, which O_DIRECT requires of the destination buffer.
+    buffer = mmap.mmap(-1, block_size)
+    preadv = getattr(os, "preadv", None)
+    if preadv is not None:
+        return partial(preadv, fd, [buffer])
+
+    def _seek_read(offset: int) -> int:
+        os.lseek(fd, offset, os.SEEK_SET)
+        return len(os.read(fd, block_size))
+
+    return _seek_read
+
+
+def _bypass_page_cache(fd: int, length: int) -> bool:
+    fadvise = getattr(os, "posix_fadvise", None)
+    if fadvise is not None:
+        try:
+            fadvise(fd, 0, length, os.POSIX_FADV_DONTNEED)
+            return True
+        except OSError:
+            return False
+
+    # macOS has no posix_fadvise; F_NOCACHE stops further caching on this descriptor.
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    nocache = getattr(fcntl, "F_NOCACHE", None)
+    if nocache is None:
+        return False
+    try:
+        fcntl.fcntl(fd, nocache, 1)
+    except OSError:
+        return False
+    return True
 
 
 def _empty_payload() -> dict[str, Any]:
@@ -1,17 +1,91 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import os
+import sys
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 try:
-    from rich.console import Console
+    from rich.console import Console, Group
     from rich.table import Table
 except Exception:  # pragma: no cover
     Console = None  # type: ignore[assignment]
+    Group = None  # type: ignore[assignment]
     Table = None  # type: ignore[assignment]
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+
+_ensured_dirs: set[Path] = set()
+_REPORT_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Status", {"no_wrap": True}),
+    ("Section", {"overflow": "fold"}),
+    ("Item", {"overflow": "fold"}),
+    ("Result", {"overflow": "fold"}),
+)
+_DETAIL_COLUMNS: tuple[tuple[str, dict[str, Any]], ...] = (
+    ("Section", {"overflow": "fold"}),
+    ("Detail", {"overflow": "fold"}),
+    ("Value", {"overflow": "fold"}),
+)
+_COMPACT_ROW_FMT = "[%s] %s | %s | %s"
+_PASS = "PASS"
+_WARN = "WARN"
+_VALID_STATUSES: frozenset[str] = frozenset({"PASS", "WARN", "FAIL"})
+_STATUS_STYLES = {
+    "PASS": "[green][PASS][/green]",
+    "WARN": "[yellow][WARN][/yellow]",
+    "FAIL": "[red][FAIL][/red]",
+}
+_DEFAULT_CONSOLE: Console | None = None
+
+_STATIC_FIELDS: tuple[tuple[str, str, str], ...] = (
+    ("cpu.model", "cpu", "model"),
+    ("cpu.cores_physical", "cpu", "cores_physical"),
+    ("cpu.cores_logical", "cpu", "cores_logical"),
+    ("cpu.arch", "cpu", "arch"),
+    ("memory.total_bytes", "memory", "total_bytes"),
+    ("storage.root_mount", "storage", "root_mount"),
+    ("storage.root_device", "storage", "root_device"),
+    ("storage.filesystem_type", "storage", "filesystem_type"),
+    ("storage.is_nvme", "storage", "is_nvme"),
+    ("storage.is_ssd", "storage", "is_ssd"),
+    ("os.name", "os", "name"),
+    ("os.version", "os", "version"),
+    ("os.kernel", "os", "kernel"),
+    ("runtime.python_version", "runtime", "python_version"),
+    ("runtime.torch_version", "runtime", "torch_version"),
+    ("runtime.torch_cuda_available", "runtime", "torch_cuda_available"),
+    ("runtime.torch_cuda_version", "runtime", "torch_cuda_version"),
+    ("runtime.platform", "runtime", "platform"),
+)
+
+_CPU_KEYS = (
+    "mean_gflops",
+    "p95_gflops",
+    "mean_iter_per_sec",
+    "p95_iter_per_sec",
+    "std_iter_per_sec",
+    "iterations",
+    "duration_sec",
+)
+_MEMORY_KEYS = ("mean_gbps", "p95_gbps", "std_gbps", "iterations", "duration_sec")
+_GPU_KEYS = ("mean_iter_per_sec", "p95_iter_per_sec", "std_iter_per_sec", "backend", "dtype")
+_DISK_KEYS = ("mean_read_mb_s", "p95_read_mb_s", "std_read_mb_s", "mean_iops", "iterations", "duration_sec")
+
+_BENCHMARK_SECTIONS = (
+    ("CPU Sustained", "cpu_sustained", _CPU_KEYS),
+    ("Memory Bandwidth", "memory_bandwidth", _MEMORY_KEYS),
+    ("GPU Sustained", "gpu_sustained", _GPU_KEYS),
+    ("Disk Random I/O", "disk_random_io", _DISK_KEYS),
+)
+
 
 def build_profile_report(
     static_profile: dict[str, Any],
@@ -26,348 +100,376 @@ def build_profile_report(
     }
 
 
-def write_profile_json(report: dict[str, Any], output_dir: Path) -> Path:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+def write_profile_json(
+    report: dict[str, Any],
+    output_dir: Path,
+    payload: bytes | None = None,
+    pretty: bool = False,
+) -> Path:
+    if output_dir not in _ensured_dirs:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(output_dir)
+    lt = time.localtime()
+    timestamp = f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}_{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}"
     output_path = output_dir / f"profile_{timestamp}.json"
-    output_path.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    if payload is None:
+        payload = dump_profile_json(report, pretty=pretty)
+    # Write beside the target and rename so a crash never leaves a truncated report.
+    tmp_path = output_path.with_suffix(".json.tmp")
+    try:
+        tmp_path.write_bytes(payload)
+    except FileNotFoundError:
+        # The directory was removed since it was first ensured.
+        output_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(payload)
+    try:
+        os.replace(tmp_path, output_path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return output_path
 
 
+def dump_profile_json(report: dict[str, Any], pretty: bool = True) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(report, option=option)
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. ints beyond 64 bits).
+            pass
+    if pretty:
+        text = json.dumps(report, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(report, ensure_ascii=False, separators=(",", ":"))
+    return (text + "\n").encode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class _ReportView:
+    static: dict[str, Any]
+    benchmark_results: list[Any]
+    benchmarks: dict[str, Any]
+    analysis: dict[str, Any] | None
+    remediation: dict[str, Any] | None
+    notes: list[Any]
+
+
+def _view(report: dict[str, Any]) -> _ReportView:
+    # Validate the report shape once so the renderers can index it without re-checking.
+    if not isinstance(report, dict):
+        report = {}
+    static = report.get("static_profile", {})
+    static = static if isinstance(static, dict) else {}
+    benchmark_results = report.get("benchmark_results")
+    benchmarks = report.get("benchmarks")
+    analysis = report.get("analysis")
+    remediation = report.get("remediation")
+    notes = static.get("notes")
+    return _ReportView(
+        static=static,
+        benchmark_results=benchmark_results if isinstance(benchmark_results, list) else [],
+        benchmarks=benchmarks if isinstance(benchmarks, dict) else {},
+        analysis=analysis if isinstance(analysis, dict) else None,
+        remediation=remediation if isinstance(remediation, dict) else None,
+        notes=notes if isinstance(notes, list) else [],
+    )
+
+
 def render_profile_human(report: dict[str, Any], console: Console | None = None) -> None:
+    view = _view(report)
     if Console is None or Table is None:
-        _render_profile_compact(report)
+        _render_profile_compact(view)
         return
 
-    active_console = console or Console()
-    rows = _build_status_rows(report)
+    # Collect every block and print once; each console.print pays for markup and layout.
+    renderables: list[Any] = []
+    rows = _build_status_rows(view)
     if rows:
-        table = Table(title="Continuum Profile Report (Static + Benchmarks + Analysis + Remediation)")
-        table.add_column("Status", no_wrap=True)
-        table.add_column("Section", overflow="fold")
-        table.add_column("Item", overflow="fold")
-        table.add_column("Result", overflow="fold")
+        table = _new_table("Continuum Profile Report (Static + Benchmarks + Analysis + Remediation)", _REPORT_COLUMNS)
         for row in rows:
             table.add_row(
-                _style_status(row["status"]),
-                row["section"],
-                row["item"],
-                row["result"],
+                _style_status(row.status),
+                row.section,
+                row.item,
+                row.result,
             )
-        active_console.print(table)
-    _render_summary_details_rich(report, active_console)
+        renderables.append(table)
+    renderables.extend(_summary_details_renderables(view))
+
+    if view.notes:
+        renderables.append("Notes:")
+        renderables.extend(f"- {note}" for note in view.notes)
+
+    if renderables:
+        (console or _get_console()).print(Group(*renderables))
+
+
+def _new_table(title: str, columns: tuple[tuple[str, dict[str, Any]], ...]) -> Table:
+    table = Table(title=title)
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
 
-    static = report.get("static_profile", {}) if isinstance(report, dict) else {}
-    notes = static.get("notes") if isinstance(static, dict) else None
-    if isinstance(notes, list) and notes:
-        active_console.print("Notes:")
-        for note in notes:
-            active_console.print(f"- {note}")
 
+def _get_console() -> Console:
+    # Console() probes the terminal on construction; build it once per process.
+    global _DEFAULT_CONSOLE
+    if _DEFAULT_CONSOLE is None:
+        _DEFAULT_CONSOLE = Console()
+    return _DEFAULT_CONSOLE
 
-def _render_profile_compact(report: dict[str, Any]) -> None:
-    rows = _build_status_rows(report)
+
+def _render_profile_compact(view: _ReportView) -> None:
+    lines: list[str] = []
+    rows = _build_status_rows(view)
     if rows:
-        print("Continuum Profile Report (Static + Benchmarks + Analysis + Remediation)")
-        print("STATUS ITEM SECTION RESULT")
-        for row in rows:
-            print(f"[{row['status']}] {row['item']} | {row['section']} | {row['result']}")
-    _render_summary_details_compact(report)
+        lines.append("Continuum Profile Report (Static + Benchmarks + Analysis + Remediation)")
+        lines.append("STATUS ITEM SECTION RESULT")
+        lines.extend(_COMPACT_ROW_FMT % (row.status, row.item, row.section, row.result) for row in rows)
+    lines.extend(_summary_details_lines(view))
 
-    static = report.get("static_profile", {}) if isinstance(report, dict) else {}
-    notes = static.get("notes") if isinstance(static, dict) else None
-    if isinstance(notes, list) and notes:
-        print("Notes:")
-        for note in notes:
-            print(f"- {note}")
+    if view.notes:
+        lines.append("Notes:")
+        lines.extend(f"- {note}" for note in view.notes)
+
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def _style_status(status: str) -> str:
-    if status == "PASS":
-        return "[green][PASS][/green]"
-    if status == "WARN":
-        return "[yellow][WARN][/yellow]"
-    if status == "FAIL":
-        return "[red][FAIL][/red]"
-    return f"[{status}]"
+    return _STATUS_STYLES.get(status) or f"[{status}]"
 
 
 def _status_for_value(value: Any) -> str:
-    return "PASS" if value is not None else "WARN"
-
-
-def _build_status_rows(report: dict[str, Any]) -> list[dict[str, str]]:
-    static = report.get("static_profile", {}) if isinstance(report, dict) else {}
-
-    def _section(key: str) -> dict[str, Any]:
-        value = static.get(key) if isinstance(static, dict) else None
-        return value if isinstance(value, dict) else {}
-
-    rows: list[dict[str, str]] = []
-    if isinstance(static, dict) and static:
-        cpu = _section("cpu")
-        memory = _section("memory")
-        storage = _section("storage")
-        os_info = _section("os")
-        runtime = _section("runtime")
-
-        fields = [
-            ("cpu.model", cpu.get("model")),
-            ("cpu.cores_physical", cpu.get("cores_physical")),
-            ("cpu.cores_logical", cpu.get("cores_logical")),
-            ("cpu.arch", cpu.get("arch")),
-            ("memory.total_bytes", memory.get("total_bytes")),
-            ("storage.root_mount", storage.get("root_mount")),
-            ("storage.root_device", storage.get("root_device")),
-            ("storage.filesystem_type", storage.get("filesystem_type")),
-            ("storage.is_nvme", storage.get("is_nvme")),
-            ("storage.is_ssd", storage.get("is_ssd")),
-            ("os.name", os_info.get("name")),
-            ("os.version", os_info.get("version")),
-            ("os.kernel", os_info.get("kernel")),
-            ("runtime.python_version", runtime.get("python_version")),
-            ("runtime.torch_version", runtime.get("torch_version")),
-            ("runtime.torch_cuda_available", runtime.get("torch_cuda_available")),
-            ("runtime.torch_cuda_version", runtime.get("torch_cuda_version")),
-            ("runtime.platform", runtime.get("platform")),
-        ]
-
-        for item, value in fields:
-            rows.append(
-                {
-                    "status": _status_for_value(value),
-                    "section": "Static Profile",
-                    "item": item,
-                    "result": "null" if value is None else str(value),
-                }
+    return _PASS if value is not None else _WARN
+
+
+@dataclass(frozen=True, slots=True)
+class _StatusRow:
+    status: str
+    section: str
+    item: str
+    result: str
+
+
+def _emit_benchmark_rows(
+    rows: list[_StatusRow],
+    benchmarks: dict[str, Any],
+    section_label: str,
+    key: str,
+    field_keys: tuple[str, ...],
+) -> None:
+    payload = benchmarks.get(key)
+    if not isinstance(payload, dict):
+        return
+    prefix = f"benchmarks.{key}."
+    for field in field_keys:
+        value = payload.get(field)
+        rows.append(
+            _StatusRow(
+                status=_PASS if value is not None else _WARN,
+                section=section_label,
+                item=prefix + field,
+                result="null" if value is None else str(value),
             )
+        )
 
-    benchmark_results = report.get("benchmark_results") if isinstance(report, dict) else None
-    if isinstance(benchmark_results, list):
-        for benchmark in benchmark_results:
-            if not isinstance(benchmark, dict):
-                continue
-            status = str(benchmark.get("status", "WARN")).upper()
-            result_value = benchmark.get("result")
-            unit = benchmark.get("unit")
-            message = benchmark.get("message")
-            result_text = "null" if result_value is None else str(result_value)
-            if unit:
-                result_text = f"{result_text} {unit}"
-            if message:
-                result_text = f"{result_text} ({message})"
-            rows.append(
-                {
-                    "status": status if status in {"PASS", "WARN", "FAIL"} else "WARN",
-                    "section": "Legacy Benchmarks",
-                    "item": str(benchmark.get("name", "benchmark.unknown")),
-                    "result": result_text,
-                }
-            )
 
-    benchmarks = report.get("benchmarks") if isinstance(report, dict) else None
-    cpu_sustained = benchmarks.get("cpu_sustained") if isinstance(benchmarks, dict) else None
-    if isinstance(cpu_sustained, dict):
-        cpu_fields = [
-            ("benchmarks.cpu_sustained.mean_iter_per_sec", cpu_sustained.get("mean_iter_per_sec")),
-            ("benchmarks.cpu_sustained.p95_iter_per_sec", cpu_sustained.get("p95_iter_per_sec")),
-            ("benchmarks.cpu_sustained.std_iter_per_sec", cpu_sustained.get("std_iter_per_sec")),
-            ("benchmarks.cpu_sustained.iterations", cpu_sustained.get("iterations")),
-            ("benchmarks.cpu_sustained.duration_sec", cpu_sustained.get("duration_sec")),
-        ]
-        for item, value in cpu_fields:
-            rows.append(
-                {
-                    "status": _status_for_value(value),
-                    "section": "CPU Sustained",
-                    "item": item,
-                    "result": "null" if value is None else str(value),
-                }
-            )
+def _static_field_values(static: dict[str, Any]) -> Iterator[tuple[str, Any]]:
+    for item, section, key in _STATIC_FIELDS:
+        section_value = static.get(section)
+        yield item, section_value.get(key) if isinstance(section_value, dict) else None
 
-    memory_bandwidth = benchmarks.get("memory_bandwidth") if isinstance(benchmarks, dict) else None
-    if isinstance(memory_bandwidth, dict):
-        mem_fields = [
-            ("benchmarks.memory_bandwidth.mean_gbps", memory_bandwidth.get("mean_gbps")),
-            ("benchmarks.memory_bandwidth.p95_gbps", memory_bandwidth.get("p95_gbps")),
-            ("benchmarks.memory_bandwidth.std_gbps", memory_bandwidth.get("std_gbps")),
-            ("benchmarks.memory_bandwidth.iterations", memory_bandwidth.get("iterations")),
-            ("benchmarks.memory_bandwidth.duration_sec", memory_bandwidth.get("duration_sec")),
-        ]
-        for item, value in mem_fields:
-            rows.append(
-                {
-                    "status": _status_for_value(value),
-                    "section": "Memory Bandwidth",
-                    "item": item,
-                    "result": "null" if value is None else str(value),
-                }
-            )
 
-    gpu_sustained = benchmarks.get("gpu_sustained") if isinstance(benchmarks, dict) else None
-    if isinstance(gpu_sustained, dict):
-        gpu_fields = [
-            ("benchmarks.gpu_sustained.mean_iter_per_sec", gpu_sustained.get("mean_iter_per_sec")),
-            ("benchmarks.gpu_sustained.p95_iter_per_sec", gpu_sustained.get("p95_iter_per_sec")),
-            ("benchmarks.gpu_sustained.std_iter_per_sec", gpu_sustained.get("std_iter_per_sec")),
-            ("benchmarks.gpu_sustained.backend", gpu_sustained.get("backend")),
-            ("benchmarks.gpu_sustained.dtype", gpu_sustained.get("dtype")),
-        ]
-        for item, value in gpu_fields:
-            rows.append(
-                {
-                    "status": _status_for_value(value),
-                    "section": "GPU Sustained",
-                    "item": item,
-                    "result": "null" if value is None else str(value),
-                }
+def _build_status_rows(view: _ReportView) -> list[_StatusRow]:
+    rows: list[_StatusRow] = []
+    if view.static:
+        rows.extend(
+            _StatusRow(
+                status=_PASS if value is not None else _WARN,
+                section="Static Profile",
+                item=item,
+                result="null" if value is None else str(value),
             )
+            for item, value in _static_field_values(view.static)
+        )
 
-    disk_random_io = benchmarks.get("disk_random_io") if isinstance(benchmarks, dict) else None
-    if isinstance(disk_random_io, dict):
-        disk_fields = [
-            ("benchmarks.disk_random_io.mean_read_mb_s", disk_random_io.get("mean_read_mb_s")),
-            ("benchmarks.disk_random_io.p95_read_mb_s", disk_random_io.get("p95_read_mb_s")),
-            ("benchmarks.disk_random_io.std_read_mb_s", disk_random_io.get("std_read_mb_s")),
-            ("benchmarks.disk_random_io.mean_iops", disk_random_io.get("mean_iops")),
-            ("benchmarks.disk_random_io.iterations", disk_random_io.get("iterations")),
-            ("benchmarks.disk_random_io.duration_sec", disk_random_io.get("duration_sec")),
-        ]
-        for item, value in disk_fields:
-            rows.append(
-                {
-                    "status": _status_for_value(value),
-                    "section": "Disk Random I/O",
-                    "item": item,
-                    "result": "null" if value is None else str(value),
-                }
+    for benchmark in view.benchmark_results:
+        if not isinstance(benchmark, dict):
+            continue
+        raw_status = benchmark.get("status")
+        status = raw_status.upper() if isinstance(raw_status, str) else _WARN
+        if status not in _VALID_STATUSES:
+            status = _WARN
+        result_value = benchmark.get("result")
+        unit = benchmark.get("unit")
+        message = benchmark.get("message")
+        parts = ["null" if result_value is None else str(result_value)]
+        if unit:
+            parts.append(str(unit))
+        if message:
+            parts.append(f"({message})")
+        result_text = " ".join(parts)
+        rows.append(
+            _StatusRow(
+                status=status,
+                section="Legacy Benchmarks",
+                item=str(benchmark.get("name", "benchmark.unknown")),
+                result=result_text,
             )
+        )
+
+    for section_label, key, field_keys in _BENCHMARK_SECTIONS:
+        _emit_benchmark_rows(rows, view.benchmarks, section_label, key, field_keys)
 
-    analysis = report.get("analysis") if isinstance(report, dict) else None
-    if isinstance(analysis, dict):
+    analysis = view.analysis
+    if analysis is not None:
         primary = analysis.get("primary_bottleneck")
         confidence = analysis.get("confidence")
         rows.append(
-            {
-                "status": _status_for_value(primary),
-                "section": "Analysis",
-                "item": "analysis.primary_bottleneck",
-                "result": "null" if primary is None else str(primary),
-            }
+            _StatusRow(
+                status=_status_for_value(primary),
+                section="Analysis",
+                item="analysis.primary_bottleneck",
+                result="null" if primary is None else str(primary),
+            )
         )
         rows.append(
-            {
-                "status": _status_for_value(confidence),
-                "section": "Analysis",
-                "item": "analysis.confidence",
-                "result": "null" if confidence is None else str(confidence),
-            }
+            _StatusRow(
+                status=_status_for_value(confidence),
+                section="Analysis",
+                item="analysis.confidence",
+                result="null" if confidence is None else str(confidence),
+            )
         )
 
-    remediation = report.get("remediation") if isinstance(report, dict) else None
-    if isinstance(remediation, dict):
+    remediation = view.remediation
+    if remediation is not None:
         priority = remediation.get("priority")
         rows.append(
-            {
-                "status": _status_for_value(priority),
-                "section": "Remediation",
-                "item": "remediation.priority",
-                "result": "null" if priority is None else str(priority),
-            }
+            _StatusRow(
+                status=_status_for_value(priority),
+                section="Remediation",
+                item="remediation.priority",
+                result="null" if priority is None else str(priority),
+            )
         )
 
     return rows
 
 
-def _render_summary_details_rich(report: dict[str, Any], console: Console) -> None:
-    analysis = report.get("analysis") if isinstance(report, dict) else None
-    remediation = report.get("remediation") if isinstance(report, dict) else None
-    details = Table(title="Summary Details")
-    details.add_column("Section", overflow="fold")
-    details.add_column("Detail", overflow="fold")
-    details.add_column("Value", overflow="fold")
-    if isinstance(analysis, dict):
-        details.add_row("Analysis", "primary_bottleneck", "null" if analysis.get("primary_bottleneck") is None else str(analysis.get("primary_bottleneck")))
-        details.add_row("Analysis", "secondary_bottleneck", "null" if analysis.get("secondary_bottleneck") is None else str(analysis.get("secondary_bottleneck")))
-        details.add_row("Analysis", "confidence", "null" if analysis.get("confidence") is None else str(analysis.get("confidence")))
-    if isinstance(remediation, dict):
-        actions = remediation.get("actions")
-        details.add_row("Remediation", "priority", "null" if remediation.get("priority") is None else str(remediation.get("priority")))
-        details.add_row("Remediation", "actions", str(len(actions) if isinstance(actions, list) else 0))
-    if details.row_count > 0:
-        console.print(details)
-
-    if isinstance(analysis, dict):
-        reasons = analysis.get("reasons")
-        if isinstance(reasons, list) and reasons:
-            console.print("Top Reasons:")
-            for reason in reasons[:3]:
-                console.print(f"- {reason}")
-
-        recommendations = analysis.get("recommendations")
-        if isinstance(recommendations, list) and recommendations:
-            console.print("Recommendations:")
-            for rec in recommendations[:3]:
-                console.print(f"- {rec}")
-
-    if isinstance(remediation, dict):
-        actions = remediation.get("actions")
-        if isinstance(actions, list) and actions:
-            console.print("Top Actions:")
-            for action in actions[:3]:
+@dataclass(frozen=True, slots=True)
+class _SummaryDetails:
+    analysis_rows: list[tuple[str, str]]
+    remediation_rows: list[tuple[str, str]]
+    action_count: int
+    reasons: list[str]
+    recommendations: list[str]
+    actions: list[str]
+
+
+def _summarize_details(view: _ReportView) -> _SummaryDetails | None:
+    analysis = view.analysis
+    remediation = view.remediation
+    if analysis is None and remediation is None:
+        return None
+
+    analysis_rows: list[tuple[str, str]] = []
+    reasons: list[str] = []
+    recommendations: list[str] = []
+    if analysis is not None:
+        for key in ("primary_bottleneck", "secondary_bottleneck", "confidence"):
+            value = analysis.get(key)
+            analysis_rows.append((key, "null" if value is None else str(value)))
+        raw_reasons = analysis.get("reasons")
+        if isinstance(raw_reasons, list):
+            reasons = [str(reason) for reason in raw_reasons[:3]]
+        raw_recommendations = analysis.get("recommendations")
+        if isinstance(raw_recommendations, list):
+            recommendations = [str(rec) for rec in raw_recommendations[:3]]
+
+    remediation_rows: list[tuple[str, str]] = []
+    action_count = 0
+    actions: list[str] = []
+    if remediation is not None:
+        priority = remediation.get("priority")
+        remediation_rows.append(("priority", "null" if priority is None else str(priority)))
+        raw_actions = remediation.get("actions")
+        if isinstance(raw_actions, list):
+            action_count = len(raw_actions)
+            for action in raw_actions[:3]:
                 if not isinstance(action, dict):
                     continue
-                title = action.get("title")
-                impact = action.get("impact")
-                difficulty = action.get("difficulty")
                 reason = action.get("reason")
-                console.print(
-                    f"- {title} "
-                    f"(impact={impact}, difficulty={difficulty})"
-                    f"{': ' + str(reason) if reason else ''}"
+                reason_text = f": {reason}" if reason else ""
+                actions.append(
+                    f"{action.get('title')} "
+                    f"(impact={action.get('impact')}, difficulty={action.get('difficulty')})"
+                    f"{reason_text}"
                 )
 
-
-def _render_summary_details_compact(report: dict[str, Any]) -> None:
-    analysis = report.get("analysis") if isinstance(report, dict) else None
-    remediation = report.get("remediation") if isinstance(report, dict) else None
-    if not isinstance(analysis, dict) and not isinstance(remediation, dict):
-        return
-
-    print("Summary Details:")
-    if isinstance(analysis, dict):
-        print(f"analysis.primary_bottleneck: {'null' if analysis.get('primary_bottleneck') is None else analysis.get('primary_bottleneck')}")
-        print(f"analysis.secondary_bottleneck: {'null' if analysis.get('secondary_bottleneck') is None else analysis.get('secondary_bottleneck')}")
-        print(f"analysis.confidence: {'null' if analysis.get('confidence') is None else analysis.get('confidence')}")
-        reasons = analysis.get("reasons")
-        if isinstance(reasons, list) and reasons:
-            print("Top Reasons:")
-            for reason in reasons[:3]:
-                print(f"- {reason}")
-        recommendations = analysis.get("recommendations")
-        if isinstance(recommendations, list) and recommendations:
-            print("Recommendations:")
-            for rec in recommendations[:3]:
-                print(f"- {rec}")
-
-    if isinstance(remediation, dict):
-        print(f"remediation.priority: {'null' if remediation.get('priority') is None else remediation.get('priority')}")
-        actions = remediation.get("actions")
-        if isinstance(actions, list) and actions:
-            print("Top Actions:")
-            for action in actions[:3]:
-                if not isinstance(action, dict):
-                    continue
-                title = action.get("title")
-                impact = action.get("impact")
-                difficulty = action.get("difficulty")
-                reason = action.get("reason")
-                reason_text = f": {reason}" if reason else ""
-                print(f"- {title} (impact={impact}, difficulty={difficulty}){reason_text}")
+    return _SummaryDetails(
+        analysis_rows=analysis_rows,
+        remediation_rows=remediation_rows,
+        action_count=action_count,
+        reasons=reasons,
+        recommendations=recommendations,
+        actions=actions,
+    )
+
+
+def _summary_details_renderables(view: _ReportView) -> list[Any]:
+    summary = _summarize_details(view)
+    if summary is None:
+        return []
+
+    details = _new_table("Summary Details", _DETAIL_COLUMNS)
+    for detail, value in summary.analysis_rows:
+        details.add_row("Analysis", detail, value)
+    if summary.remediation_rows:
+        for detail, value in summary.remediation_rows:
+            details.add_row("Remediation", detail, value)
+        details.add_row("Remediation", "actions", str(summary.action_count))
+
+    renderables: list[Any] = [details]
+    sections = (
+        ("Top Reasons:", summary.reasons),
+        ("Recommendations:", summary.recommendations),
+        ("Top Actions:", summary.actions),
+    )
+    for header, lines in sections:
+        if not lines:
+            continue
+        renderables.append(header)
+        renderables.extend(f"- {line}" for line in lines)
+    return renderables
+
+
+def _summary_details_lines(view: _ReportView) -> list[str]:
+    summary = _summarize_details(view)
+    if summary is None:
+        return []
+
+    lines = ["Summary Details:"]
+    lines.extend(f"analysis.{detail}: {value}" for detail, value in summary.analysis_rows)
+    for header, items in (("Top Reasons:", summary.reasons), ("Recommendations:", summary.recommendations)):
+        if not items:
+            continue
+        lines.append(header)
+        lines.extend(f"- {item}" for item in items)
+    lines.extend(f"remediation.{detail}: {value}" for detail, value in summary.remediation_rows)
+    if summary.actions:
+        lines.append("Top Actions:")
+        lines.extend(f"- {item}" for item in summary.actions)
+    return lines
 
 
 __all__ = [
     "build_profile_report",
     "write_profile_json",
+    "dump_profile_json",
     "render_profile_human",
 ]
@@ -5,6 +5,8 @@ import importlib.util
 from time import perf_counter
 from typing import Any
 
+from continuum.profiler.stats import as_positive_float, as_positive_int, round_metric, summarize
+
 
 def run_gpu_benchmark(context: dict[str, Any]) -> dict[str, Any]:
     notes = context.setdefault("notes", [])
@@ -33,10 +35,10 @@ def run_gpu_benchmark(context: dict[str, Any]) -> dict[str, Any]:
         return _empty_payload()
 
     device = "cuda:0" if backend == "cuda" else "mps"
-    warmup_sec = _as_positive_float(context.get("gpu_warmup"), default=2.0)
-    duration_sec = _as_positive_float(context.get("gpu_duration"), default=8.0)
+    warmup_sec = as_positive_float(context.get("gpu_warmup"), default=2.0)
+    duration_sec = as_positive_float(context.get("gpu_duration"), default=8.0)
     requested_dtype = str(context.get("gpu_dtype", "auto")).lower().strip() or "auto"
-    size_override = _as_positive_int(context.get("gpu_size"), default=None)
+    size_override = as_positive_int(context.get("gpu_size"), default=None)
     size = size_override if size_override is not None else (4096 if backend == "cuda" else 2048)
 
     prepared = _prepare_tensors(
@@ -81,17 +83,18 @@ def run_gpu_benchmark(context: dict[str, Any]) -> dict[str, Any]:
     if iterations < 5:
         notes.append("GPU sustained benchmark collected fewer than 5 iterations; variance may be noisy.")
 
+    mean_rate, std_rate, p50_rate, p95_rate = summarize(rates)
     return {
         "gpu_sustained": {
             "backend": backend,
             "device": device,
             "dtype": dtype_name,
-            "mean_iter_per_sec": _round(_mean(rates)),
-            "std_iter_per_sec": _round(_std(rates)),
-            "p50_iter_per_sec": _round(_percentile(rates, 50.0)),
-            "p95_iter_per_sec": _round(_percentile(rates, 95.0)),
+            "mean_iter_per_sec": round_metric(mean_rate),
+            "std_iter_per_sec": round_metric(std_rate),
+            "p50_iter_per_sec": round_metric(p50_rate),
+            "p95_iter_per_sec": round_metric(p95_rate),
             "iterations": int(iterations),
-            "duration_sec": _round(measured),
+            "duration_sec": round_metric(measured),
         }
     }
 
@@ -159,53 +162,6 @@ def _synchronize(torch: Any, backend: str) -> None:
             sync()
 
 
-def _as_positive_float(value: Any, default: float) -> float:
-    try:
-        number = float(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
-
-
-def _as_positive_int(value: Any, default: int | None) -> int | None:
-    if value is None:
-        return default
-    try:
-        number = int(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
-
-
-def _mean(values: list[float]) -> float:
-    return sum(values) / len(values)
-
-
-def _std(values: list[float]) -> float:
-    if len(values) < 2:
-        return 0.0
-    m = _mean(values)
-    variance = sum((x - m) ** 2 for x in values) / len(values)
-    return variance ** 0.5
-
-
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    rank = (len(ordered) - 1) * (percentile / 100.0)
-    lo = int(rank)
-    hi = min(lo + 1, len(ordered) - 1)
-    frac = rank - lo
-    return ordered[lo] + (ordered[hi] - ordered[lo]) * frac
-
-
-def _round(value: float) -> float:
-    return round(float(value), 6)
-
-
 def _empty_payload(
     backend: str | None = None,
     device: str | None = None,
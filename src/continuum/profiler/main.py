@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-import json
-import traceback
+import importlib
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 try:
     import typer
@@ -18,28 +19,39 @@ except Exception:  # pragma: no cover
             return default
 
         @staticmethod
-        def echo(message: str, err: bool = False) -> None:
-            print(message)
+        def echo(message: str | bytes, err: bool = False, nl: bool = True) -> None:
+            if isinstance(message, bytes):
+                sys.stdout.flush()
+                sys.stdout.buffer.write(message + (b"\n" if nl else b""))
+                sys.stdout.buffer.flush()
+                return
+            print(message, end="\n" if nl else "")
 
     typer = _TyperShim()  # type: ignore[assignment]
 
-from continuum.profiler.formatters import build_profile_report, render_profile_human, write_profile_json
+from continuum.profiler.formatters import build_profile_report, dump_profile_json, render_profile_human, write_profile_json
 from continuum.profiler.analysis import classify_bottleneck
-from continuum.profiler.cpu_benchmark import run_cpu_benchmark
-from continuum.profiler.disk_benchmark import run_disk_benchmark
-from continuum.profiler.gpu_benchmark import run_gpu_benchmark
-from continuum.profiler.memory_bandwidth import run_memory_bandwidth
 from continuum.profiler.remediation import generate_remediation
-from continuum.profiler.static_profile import collect_static_profile
+
+
+def _lazy_benchmark(module_name: str, func_name: str) -> Callable[[dict[str, Any]], dict[str, Any]]:
+    # Benchmark modules pull in NumPy/torch; import them only when the benchmark runs.
+    def _run(context: dict[str, Any]) -> dict[str, Any]:
+        return getattr(importlib.import_module(module_name), func_name)(context)
+
+    _run.__name__ = func_name
+    return _run
+
 
 AVAILABLE_BENCHMARKS = {
-    "static": collect_static_profile,
-    "cpu": run_cpu_benchmark,
-    "memory": run_memory_bandwidth,
-    "gpu": run_gpu_benchmark,
-    "disk": run_disk_benchmark,
+    "static": _lazy_benchmark("continuum.profiler.static_profile", "collect_static_profile"),
+    "cpu": _lazy_benchmark("continuum.profiler.cpu_benchmark", "run_cpu_benchmark"),
+    "memory": _lazy_benchmark("continuum.profiler.memory_bandwidth", "run_memory_bandwidth"),
+    "gpu": _lazy_benchmark("continuum.profiler.gpu_benchmark", "run_gpu_benchmark"),
+    "disk": _lazy_benchmark("continuum.profiler.disk_benchmark", "run_disk_benchmark"),
 }
 _BENCHMARK_ORDER = ("static", "cpu", "memory", "gpu", "disk")
+_NEEDS_STATIC_FACTS = frozenset({"memory"})
 _OUTPUT_FORMATS = {"human", "json", "both"}
 
 
@@ -58,6 +70,24 @@ def profile_command(
     ),
     no_static: bool = typer.Option(False, "--no-static", help="Exclude static profile section from output.", rich_help_panel="Selection"),
     no_benchmarks: bool = typer.Option(False, "--no-benchmarks", help="Exclude benchmarks section from output.", rich_help_panel="Selection"),
+    probe_cuda: bool = typer.Option(
+        False,
+        "--probe-cuda",
+        help="Initialize CUDA during static profiling to report torch CUDA availability.",
+        rich_help_panel="Selection",
+    ),
+    parallel_benchmarks: bool = typer.Option(
+        False,
+        "--parallel-benchmarks",
+        help="Run benchmarks concurrently for a faster, lower-fidelity profile (they contend for CPU and DRAM).",
+        rich_help_panel="Selection",
+    ),
+    adaptive_warmup: bool = typer.Option(
+        True,
+        "--adaptive-warmup/--fixed-warmup",
+        help="End CPU and memory warmups early once kernel timings settle; the warmup durations become upper bounds.",
+        rich_help_panel="Selection",
+    ),
     output_format: str = typer.Option("human", "--output-format", help="Output format: human, json, or both.", rich_help_panel="Output"),
     quiet: bool = typer.Option(False, "--quiet", help="Suppress human output (equivalent to --output-format json).", rich_help_panel="Output"),
     json_output: bool = typer.Option(False, "--json", help="Also print JSON report to stdout.", rich_help_panel="Output"),
@@ -65,6 +95,7 @@ def profile_command(
     no_write: bool = typer.Option(False, "--no-write", help="Do not write JSON report to disk.", rich_help_panel="Output"),
     cpu_duration: float = typer.Option(8.0, "--cpu-duration", help="CPU benchmark measurement duration in seconds.", rich_help_panel="CPU Benchmark"),
     cpu_warmup: float = typer.Option(2.0, "--cpu-warmup", help="CPU benchmark warmup duration in seconds.", rich_help_panel="CPU Benchmark"),
+    cpu_dtype: str = typer.Option("float64", "--cpu-dtype", help="CPU benchmark dtype: float64 or float32.", rich_help_panel="CPU Benchmark"),
     mem_duration: float = typer.Option(8.0, "--mem-duration", help="Memory benchmark measurement duration in seconds.", rich_help_panel="Memory Benchmark"),
     mem_warmup: float = typer.Option(2.0, "--mem-warmup", help="Memory benchmark warmup duration in seconds.", rich_help_panel="Memory Benchmark"),
     mem_mb: int | None = typer.Option(None, "--mem-mb", help="Memory benchmark buffer size in MB.", rich_help_panel="Memory Benchmark"),
@@ -88,8 +119,11 @@ def profile_command(
             "facts": {},
             "notes": [],
             "static_only": static_only,
+            "probe_cuda": probe_cuda,
+            "adaptive_warmup": adaptive_warmup,
             "cpu_duration": cpu_duration,
             "cpu_warmup": cpu_warmup,
+            "cpu_dtype": cpu_dtype,
             "mem_duration": mem_duration,
             "mem_warmup": mem_warmup,
             "mem_mb": mem_mb,
@@ -103,24 +137,14 @@ def profile_command(
             "disk_size_mb": disk_size_mb,
             "no_disk": no_disk,
         }
-        static_profile: dict[str, Any] = {}
-        benchmarks_payload: dict[str, Any] = {}
-
-        for name in _BENCHMARK_ORDER:
-            if name not in selected:
-                continue
-            fn = AVAILABLE_BENCHMARKS[name]
-            value = fn(context)
-            if name == "static":
-                if isinstance(value, dict):
-                    static_profile = value
-            elif isinstance(value, dict):
-                benchmarks_payload.update(value)
+        static_profile, benchmarks_payload = _run_selected(selected, context, parallel=parallel_benchmarks)
 
         static_notes = static_profile.get("notes") if isinstance(static_profile, dict) else None
         if isinstance(static_notes, list):
+            seen = set(static_notes)
             for note in context.get("notes", []):
-                if isinstance(note, str) and note not in static_notes:
+                if isinstance(note, str) and note not in seen:
+                    seen.add(note)
                     static_notes.append(note)
 
         if no_static:
@@ -141,10 +165,12 @@ def profile_command(
         if effective_output_format in {"human", "both"}:
             render_profile_human(report)
         if effective_output_format in {"json", "both"}:
-            typer.echo(json.dumps(report, indent=2, ensure_ascii=False))
+            # Bytes go straight to the binary stdout stream; the payload already ends in a newline.
+            typer.echo(dump_profile_json(report), nl=False)
 
         if not no_write:
             output_dir = export if export is not None else Path(".hydra/reports")
+            # The report file is for tooling, so it is written compact; stdout stays indented.
             output = write_profile_json(report, output_dir)
             typer.echo(f"Profile JSON written: {output}")
 
@@ -157,6 +183,8 @@ def profile_command(
     except Exception as exc:
         typer.echo(f"Profiler failed: {type(exc).__name__}: {exc}", err=True)
         if verbose:
+            import traceback
+
             typer.echo(traceback.format_exc(), err=True)
         raise typer.Exit(code=4)
 
@@ -168,6 +196,48 @@ def main() -> None:
     typer.run(profile_command)
 
 
+def _run_selected(selected: set[str], context: dict[str, Any], parallel: bool = False) -> tuple[dict[str, Any], dict[str, Any]]:
+    static_profile: dict[str, Any] = {}
+    benchmarks_payload: dict[str, Any] = {}
+    names = [name for name in _BENCHMARK_ORDER if name != "static" and name in selected]
+
+    if not parallel:
+        # Static probes run their own thread pool (torch import, sysctl, procfs), so they
+        # finish before any timed benchmark starts rather than stealing its cores.
+        if "static" in selected:
+            value = AVAILABLE_BENCHMARKS["static"](context)
+            if isinstance(value, dict):
+                static_profile = value
+        for name in names:
+            value = AVAILABLE_BENCHMARKS[name](context)
+            if isinstance(value, dict):
+                benchmarks_payload.update(value)
+        return static_profile, benchmarks_payload
+
+    # Parallel mode trades measurement fidelity for wall time: static collection and every
+    # benchmark get their own worker; only benchmarks that size themselves from static
+    # facts wait for it.
+    with ThreadPoolExecutor(max_workers=1 + len(names)) as executor:
+        static_future = executor.submit(AVAILABLE_BENCHMARKS["static"], context) if "static" in selected else None
+
+        def _run(name: str) -> Any:
+            if static_future is not None and name in _NEEDS_STATIC_FACTS:
+                static_future.result()
+            return AVAILABLE_BENCHMARKS[name](context)
+
+        futures = [executor.submit(_run, name) for name in names]
+        # Results merge in benchmark order, so the report is deterministic.
+        for future in futures:
+            value = future.result()
+            if isinstance(value, dict):
+                benchmarks_payload.update(value)
+        if static_future is not None:
+            value = static_future.result()
+            if isinstance(value, dict):
+                static_profile = value
+    return static_profile, benchmarks_payload
+
+
 def _parse_selected_benchmarks(raw: str | None) -> set[str]:
     if raw is None or not raw.strip():
         return set(_BENCHMARK_ORDER)
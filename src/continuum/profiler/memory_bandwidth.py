@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-import importlib
-import importlib.util
-from time import perf_counter
-from typing import Any
-
+import mmap
+import os
+import sys
+from array import array
+from contextlib import contextmanager
+from functools import partial
+from time import perf_counter_ns
+from typing import Any, Callable, Iterator, Sequence
+
+from continuum.profiler.stats import as_positive_float, as_positive_int, round_metric, summarize, warm_up
+from continuum.profiler.sysctl import sysctl_int
+
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover
+    _np = None
 
 _MB = 1024 * 1024
-_GB_DIVISOR = 1_000_000_000.0
+_NS_PER_SEC = 1_000_000_000
+_TARGET_BATCH_NS = 50_000_000
+_MIN_RATE_SLOTS = 64
+# STREAM Copy accounting: every copied byte is read once and written once.
+_COPY_TRAFFIC_FACTOR = 2
+# STREAM sizing rule: each array at least 4x the last-level cache, so copies miss to DRAM.
+_LLC_MULTIPLE = 4
+_CACHE_SIZE_SUFFIXES = {"K": 1024, "M": _MB, "G": 1024 * _MB}
 
 
 def run_memory_bandwidth(context: dict[str, Any]) -> dict[str, Any]:
@@ -16,63 +34,111 @@ def run_memory_bandwidth(context: dict[str, Any]) -> dict[str, Any]:
         notes.append("Memory bandwidth benchmark skipped due to --static-only.")
         return _empty_payload()
 
-    warmup_sec = _as_positive_float(context.get("mem_warmup"), default=2.0)
-    duration_sec = _as_positive_float(context.get("mem_duration"), default=8.0)
-    mem_mb = _as_positive_int(context.get("mem_mb"), default=None)
-    target_bytes = _resolve_target_bytes(context=context, mem_mb=mem_mb, numpy_available=_numpy_available())
-
-    if _numpy_available():
-        result = _run_numpy_path(target_bytes=target_bytes, warmup_sec=warmup_sec, duration_sec=duration_sec, notes=notes)
-        if result is not None:
-            return result
-
-    notes.append("NumPy not installed; using stdlib bytearray copy fallback (lower fidelity).")
-    return _run_stdlib_path(target_bytes=target_bytes, warmup_sec=warmup_sec, duration_sec=duration_sec, notes=notes)
+    warmup_sec = as_positive_float(context.get("mem_warmup"), default=2.0)
+    duration_sec = as_positive_float(context.get("mem_duration"), default=8.0)
+    mem_mb = as_positive_int(context.get("mem_mb"), default=None)
+    adaptive_warmup = bool(context.get("adaptive_warmup", True))
+    np = _np
+    target_bytes = _resolve_target_bytes(context=context, mem_mb=mem_mb, numpy_available=np is not None)
+
+    with _single_cpu_affinity(notes):
+        if np is not None:
+            return _run_numpy_path(
+                np,
+                target_bytes=target_bytes,
+                warmup_sec=warmup_sec,
+                duration_sec=duration_sec,
+                notes=notes,
+                adaptive_warmup=adaptive_warmup,
+            )
+
+        notes.append("NumPy not installed; using stdlib bytearray copy fallback (lower fidelity).")
+        return _run_stdlib_path(
+            target_bytes=target_bytes,
+            warmup_sec=warmup_sec,
+            duration_sec=duration_sec,
+            notes=notes,
+            adaptive_warmup=adaptive_warmup,
+        )
+
+
+@contextmanager
+def _single_cpu_affinity(notes: list[str]) -> Iterator[None]:
+    # The copy loop is single-threaded; keeping it on one core stops migrations from
+    # showing up as bandwidth variance. Linux-only and best-effort, restored afterwards.
+    getaffinity = getattr(os, "sched_getaffinity", None)
+    setaffinity = getattr(os, "sched_setaffinity", None)
+    previous: set[int] | None = None
+    if getaffinity is not None and setaffinity is not None:
+        try:
+            allowed = getaffinity(0)
+            if len(allowed) > 1:
+                cpu = min(allowed)
+                setaffinity(0, {cpu})
+                previous = allowed
+                notes.append(f"Memory bandwidth benchmark pinned to CPU {cpu}.")
+        except (OSError, ValueError):
+            previous = None
+    try:
+        yield
+    finally:
+        if previous is not None:
+            try:
+                setaffinity(0, previous)
+            except OSError:
+                pass
 
 
 def _run_numpy_path(
+    np: Any,
     target_bytes: int,
     warmup_sec: float,
     duration_sec: float,
     notes: list[str],
-) -> dict[str, Any] | None:
-    if importlib.util.find_spec("numpy") is None:
-        return None
-
-    try:
-        np = importlib.import_module("numpy")
-    except Exception:
-        return None
-
+    adaptive_warmup: bool = True,
+) -> dict[str, Any]:
     try:
-        dtype = np.uint8
         size = max(1, int(target_bytes))
-        src = np.empty(size, dtype=dtype)
-        dst = np.empty(size, dtype=dtype)
+        src = _page_aligned_buffer(np, size)
+        dst = _page_aligned_buffer(np, size)
+        # First touch happens after CPU pinning, so pages land on the pinned core's NUMA
+        # node. The source must be written: untouched anonymous pages all alias the
+        # kernel zero page and would make the copy read from cache.
         src.fill(7)
-        bytes_per_iter = int(src.nbytes)
+        bytes_per_iter = _COPY_TRAFFIC_FACTOR * int(src.nbytes)
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Memory bandwidth numpy allocation failed: {type(exc).__name__}: {exc}")
         return _empty_payload(bytes_per_iter=None)
 
     try:
-        warmup_end = perf_counter() + warmup_sec
-        while perf_counter() < warmup_end:
-            np.copyto(dst, src)
-
-        started = perf_counter()
-        end_at = started + duration_sec
-        rates: list[float] = []
+        copyto = np.copyto
+        pc = perf_counter_ns
+        warm_up(partial(copyto, dst, src), warmup_sec, pc, adaptive=adaptive_warmup)
+
+        # Time batches of copies rather than single calls so timer and loop overhead
+        # stays negligible next to the memcpy being measured.
+        probe_start = pc()
+        copyto(dst, src)
+        probe_ns = pc() - probe_start
+        batch = max(1, _TARGET_BATCH_NS // probe_ns) if probe_ns > 0 else 1
+        bytes_per_lap = batch * bytes_per_iter
+
+        started = pc()
+        end_at = started + int(duration_sec * _NS_PER_SEC)
+        lap_durations = array("q")
         iterations = 0
-        while perf_counter() < end_at:
-            lap_start = perf_counter()
-            np.copyto(dst, src)
-            elapsed = perf_counter() - lap_start
-            if elapsed > 0:
-                rates.append((bytes_per_iter / elapsed) / _GB_DIVISOR)
-            iterations += 1
-
-        measured = perf_counter() - started
+        while pc() < end_at:
+            lap_start = pc()
+            for _step in range(batch):
+                copyto(dst, src)
+            lap_ns = pc() - lap_start
+            if lap_ns > 0:
+                lap_durations.append(lap_ns)
+            iterations += batch
+
+        measured = (pc() - started) / _NS_PER_SEC
+        # Bytes per nanosecond is exactly GB/s (10^9 bytes per second).
+        rates = bytes_per_lap / np.frombuffer(lap_durations, dtype=np.int64).astype(np.float64)
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Memory bandwidth numpy benchmark failed: {type(exc).__name__}: {exc}")
         return _empty_payload(bytes_per_iter=bytes_per_iter)
@@ -80,69 +146,121 @@ def _run_numpy_path(
     return _finalize_payload(rates=rates, iterations=iterations, duration_sec=measured, bytes_per_iter=bytes_per_iter, notes=notes)
 
 
+def _page_aligned_buffer(np: Any, size: int) -> Any:
+    # Anonymous mappings are page aligned, and on Linux can be backed by transparent huge
+    # pages so the copy stream is not dominated by DTLB misses on 4 KiB pages.
+    try:
+        mapping = mmap.mmap(-1, size)
+    except (OSError, ValueError):
+        return np.empty(size, dtype=np.uint8)
+    hugepage = getattr(mmap, "MADV_HUGEPAGE", None)
+    if hugepage is not None:
+        try:
+            mapping.madvise(hugepage)
+        except OSError:
+            pass
+    return np.frombuffer(mapping, dtype=np.uint8)
+
+
 def _run_stdlib_path(
     target_bytes: int,
     warmup_sec: float,
     duration_sec: float,
     notes: list[str],
+    adaptive_warmup: bool = True,
 ) -> dict[str, Any]:
     try:
         src = bytearray(target_bytes)
         dst = bytearray(target_bytes)
-        mv_src = memoryview(src)
-        mv_dst = memoryview(dst)
-        bytes_per_iter = len(src)
+        copy = _buffer_copier(src, dst)
+        bytes_per_iter = _COPY_TRAFFIC_FACTOR * len(src)
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Memory bandwidth stdlib allocation failed: {type(exc).__name__}: {exc}")
         return _empty_payload()
 
     try:
-        warmup_end = perf_counter() + warmup_sec
-        while perf_counter() < warmup_end:
-            mv_dst[:] = mv_src
-
-        started = perf_counter()
-        end_at = started + duration_sec
-        rates: list[float] = []
+        pc = perf_counter_ns
+        warm_up(copy, warmup_sec, pc, adaptive=adaptive_warmup)
+
+        # One sample per ~50 ms batch of copies bounds the sample count by the duration
+        # rather than the copy size. Samples go into a double array preallocated from the
+        # probe copy (doubled when full), so the loop never boxes floats into a list.
+        probe_start = pc()
+        copy()
+        probe_ns = pc() - probe_start
+        batch = max(1, _TARGET_BATCH_NS // probe_ns) if probe_ns > 0 else 1
+        bytes_per_lap = batch * bytes_per_iter
+        capacity = max(_MIN_RATE_SLOTS, int(duration_sec * _NS_PER_SEC) // (batch * probe_ns)) if probe_ns > 0 else _MIN_RATE_SLOTS
+        rates = array("d", bytes(8 * capacity))
+        count = 0
+
+        started = pc()
+        end_at = started + int(duration_sec * _NS_PER_SEC)
         iterations = 0
-        while perf_counter() < end_at:
-            lap_start = perf_counter()
-            mv_dst[:] = mv_src
-            elapsed = perf_counter() - lap_start
-            if elapsed > 0:
-                rates.append((bytes_per_iter / elapsed) / _GB_DIVISOR)
-            iterations += 1
-
-        measured = perf_counter() - started
+        while pc() < end_at:
+            lap_start = pc()
+            for _step in range(batch):
+                copy()
+            lap_ns = pc() - lap_start
+            if lap_ns > 0:
+                if count == len(rates):
+                    rates.extend(array("d", bytes(8 * len(rates))))
+                rates[count] = bytes_per_lap / lap_ns
+                count += 1
+            iterations += batch
+
+        measured = (pc() - started) / _NS_PER_SEC
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Memory bandwidth stdlib benchmark failed: {type(exc).__name__}: {exc}")
         return _empty_payload(bytes_per_iter=bytes_per_iter)
 
-    return _finalize_payload(rates=rates, iterations=iterations, duration_sec=measured, bytes_per_iter=bytes_per_iter, notes=notes)
+    return _finalize_payload(rates=rates[:count], iterations=iterations, duration_sec=measured, bytes_per_iter=bytes_per_iter, notes=notes)
+
+
+def _buffer_copier(src: bytearray, dst: bytearray) -> Callable[[], Any]:
+    # ctypes.memmove goes straight to the C library copy, skipping the buffer-protocol
+    # acquire/release that memoryview slice assignment pays on every call.
+    size = len(src)
+    try:
+        import ctypes
+
+        src_addr = ctypes.addressof((ctypes.c_char * size).from_buffer(src))
+        dst_addr = ctypes.addressof((ctypes.c_char * size).from_buffer(dst))
+    except Exception:
+        mv_src = memoryview(src)
+        mv_dst = memoryview(dst)
+
+        def _slice_copy() -> None:
+            mv_dst[:] = mv_src
+
+        return _slice_copy
+
+    return partial(ctypes.memmove, dst_addr, src_addr, size)
 
 
 def _finalize_payload(
-    rates: list[float],
+    rates: Sequence[float],
     iterations: int,
     duration_sec: float,
     bytes_per_iter: int | None,
     notes: list[str],
 ) -> dict[str, Any]:
-    if not rates:
+    if len(rates) == 0:
         notes.append("Memory bandwidth benchmark collected zero valid iterations.")
         return _empty_payload(bytes_per_iter=bytes_per_iter)
 
     if iterations < 5:
         notes.append("Memory bandwidth benchmark collected fewer than 5 iterations; variance may be noisy.")
 
+    mean_rate, std_rate, p50_rate, p95_rate = summarize(rates)
     return {
         "memory_bandwidth": {
-            "mean_gbps": _round(_mean(rates)),
-            "std_gbps": _round(_std(rates)),
-            "p50_gbps": _round(_percentile(rates, 50.0)),
-            "p95_gbps": _round(_percentile(rates, 95.0)),
+            "mean_gbps": round_metric(mean_rate),
+            "std_gbps": round_metric(std_rate),
+            "p50_gbps": round_metric(p50_rate),
+            "p95_gbps": round_metric(p95_rate),
             "iterations": int(iterations),
-            "duration_sec": _round(duration_sec),
+            "duration_sec": round_metric(duration_sec),
             "bytes_per_iter": int(bytes_per_iter) if isinstance(bytes_per_iter, int) else None,
         }
     }
@@ -156,12 +274,55 @@ def _resolve_target_bytes(context: dict[str, Any], mem_mb: int | None, numpy_ava
     if isinstance(total_ram, int) and total_ram > 0:
         target = int(total_ram * 0.05)
         capped = min(256 * _MB, max(64 * _MB, target))
-        return capped
+    elif numpy_available:
+        # No RAM hint available.
+        capped = 128 * _MB
+    else:
+        capped = 64 * _MB
+
+    # Large server L3s can hold the default buffers outright, which would report cache
+    # bandwidth; grow past the LLC, but never beyond an eighth of RAM per buffer.
+    llc_bytes = _l3_cache_bytes()
+    if llc_bytes is not None and llc_bytes * _LLC_MULTIPLE > capped:
+        ceiling = total_ram // 8 if isinstance(total_ram, int) and total_ram > 0 else 512 * _MB
+        capped = max(capped, min(llc_bytes * _LLC_MULTIPLE, ceiling))
+    return capped
+
+
+def _l3_cache_bytes() -> int | None:
+    if sys.platform == "darwin":
+        value = sysctl_int("hw.l3cachesize")
+        return value if value else None
+
+    cache_root = "/sys/devices/system/cpu/cpu0/cache"
+    try:
+        entries = os.listdir(cache_root)
+    except OSError:
+        return None
+    for entry in entries:
+        if not entry.startswith("index"):
+            continue
+        try:
+            with open(f"{cache_root}/{entry}/level", encoding="ascii") as handle:
+                if handle.read().strip() != "3":
+                    continue
+            with open(f"{cache_root}/{entry}/size", encoding="ascii") as handle:
+                raw = handle.read().strip()
+        except OSError:
+            continue
+        return _parse_cache_size(raw)
+    return None
 
-    # No RAM hint available.
-    if numpy_available:
-        return 128 * _MB
-    return 64 * _MB
+
+def _parse_cache_size(raw: str) -> int | None:
+    # sysfs reports sizes like "32768K".
+    multiplier = _CACHE_SIZE_SUFFIXES.get(raw[-1:].upper(), 1)
+    digits = raw[:-1] if raw[-1:].upper() in _CACHE_SIZE_SUFFIXES else raw
+    try:
+        value = int(digits) * multiplier
+    except ValueError:
+        return None
+    return value if value > 0 else None
 
 
 def _extract_total_ram(context: dict[str, Any]) -> int | None:
@@ -177,57 +338,6 @@ def _extract_total_ram(context: dict[str, Any]) -> int | None:
     return None
 
 
-def _numpy_available() -> bool:
-    return importlib.util.find_spec("numpy") is not None
-
-
-def _as_positive_float(value: Any, default: float) -> float:
-    try:
-        number = float(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
-
-
-def _as_positive_int(value: Any, default: int | None) -> int | None:
-    if value is None:
-        return default
-    try:
-        number = int(value)
-    except Exception:
-        return default
-    return number if number > 0 else default
-
-
-def _mean(values: list[float]) -> float:
-    return sum(values) / len(values)
-
-
-def _std(values: list[float]) -> float:
-    if len(values) < 2:
-        return 0.0
-    m = _mean(values)
-    variance = sum((x - m) ** 2 for x in values) / len(values)
-    return variance ** 0.5
-
-
-def _percentile(values: list[float], percentile: float) -> float:
-    if not values:
-        return 0.0
-    ordered = sorted(values)
-    if len(ordered) == 1:
-        return ordered[0]
-    rank = (len(ordered) - 1) * (percentile / 100.0)
-    lo = int(rank)
-    hi = min(lo + 1, len(ordered) - 1)
-    frac = rank - lo
-    return ordered[lo] + (ordered[hi] - ordered[lo]) * frac
-
-
-def _round(value: float) -> float:
-    return round(float(value), 6)
-
-
 def _empty_payload(bytes_per_iter: int | None = None) -> dict[str, Any]:
     return {
         "memory_bandwidth": {
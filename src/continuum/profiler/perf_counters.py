@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import ctypes
+import errno
+import os
+import platform
+import sys
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+_PERF_TYPE_HARDWARE = 0
+_HW_CPU_CYCLES = 0
+_HW_INSTRUCTIONS = 1
+_HW_CACHE_MISSES = 3
+_HW_BRANCH_MISSES = 5
+_COUNTERS = (
+    ("cycles", _HW_CPU_CYCLES),
+    ("instructions", _HW_INSTRUCTIONS),
+    ("cache_misses", _HW_CACHE_MISSES),
+    ("branch_misses", _HW_BRANCH_MISSES),
+)
+
+# perf_event_attr flag bits.
+_FLAG_DISABLED = 1 << 0
+_FLAG_EXCLUDE_KERNEL = 1 << 5
+_FLAG_EXCLUDE_HV = 1 << 6
+
+_IOC_ENABLE = 0x2400
+_IOC_DISABLE = 0x2401
+
+_SYSCALL_NUMBERS = {"x86_64": 298, "aarch64": 241, "arm64": 241, "riscv64": 241}
+
+
+class _PerfEventAttr(ctypes.Structure):
+    # PERF_ATTR_SIZE_VER0 prefix of struct perf_event_attr; the kernel zero-extends it.
+    _fields_ = [
+        ("type", ctypes.c_uint32),
+        ("size", ctypes.c_uint32),
+        ("config", ctypes.c_uint64),
+        ("sample_period", ctypes.c_uint64),
+        ("sample_type", ctypes.c_uint64),
+        ("read_format", ctypes.c_uint64),
+        ("flags", ctypes.c_uint64),
+        ("wakeup_events", ctypes.c_uint32),
+        ("bp_type", ctypes.c_uint32),
+        ("config1", ctypes.c_uint64),
+    ]
+
+
+@contextmanager
+def hardware_counters(notes: list[str]) -> Iterator[dict[str, Any]]:
+    # Counts user-space cycles, instructions, cache misses and branch misses for every
+    # thread of the process that exists on entry (BLAS pools are started by the warmup),
+    # summed on exit. The yielded dict is filled on exit and stays empty when counters
+    # are unavailable; threads started inside the block are not counted.
+    sample: dict[str, Any] = {}
+    fds = _open_counters(notes)
+    if not fds:
+        yield sample
+        return
+
+    import fcntl
+
+    all_fds = [fd for thread_fds in fds.values() for fd in thread_fds]
+    try:
+        for fd in all_fds:
+            fcntl.ioctl(fd, _IOC_ENABLE, 0)
+    except OSError as exc:
+        notes.append(f"Hardware performance counters could not be enabled: {exc}")
+        for fd in all_fds:
+            os.close(fd)
+        yield sample
+        return
+
+    try:
+        yield sample
+    finally:
+        try:
+            for fd in all_fds:
+                fcntl.ioctl(fd, _IOC_DISABLE, 0)
+            totals = {name: sum(int.from_bytes(os.read(fd, 8), sys.byteorder) for fd in thread_fds) for name, thread_fds in fds.items()}
+            sample.update(_derive(totals))
+            sample["threads"] = len(fds["cycles"])
+        except OSError as exc:
+            notes.append(f"Hardware performance counters could not be read: {exc}")
+        for fd in all_fds:
+            os.close(fd)
+
+
+def _open_counters(notes: list[str]) -> dict[str, list[int]]:
+    # One counter per event per thread; per-thread counters (rather than inherit=1 on the
+    # caller) are the only way to see worker threads that already exist.
+    if not sys.platform.startswith("linux"):
+        return {}
+    syscall_number = _SYSCALL_NUMBERS.get(platform.machine().lower())
+    if syscall_number is None:
+        return {}
+
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        tids = sorted(int(entry) for entry in os.listdir("/proc/self/task"))
+    except (OSError, ValueError):
+        return {}
+
+    fds: dict[str, list[int]] = {name: [] for name, _config in _COUNTERS}
+    for tid in tids:
+        opened: list[tuple[str, int]] = []
+        for name, config in _COUNTERS:
+            attr = _PerfEventAttr(
+                type=_PERF_TYPE_HARDWARE,
+                size=ctypes.sizeof(_PerfEventAttr),
+                config=config,
+                flags=_FLAG_DISABLED | _FLAG_EXCLUDE_KERNEL | _FLAG_EXCLUDE_HV,
+            )
+            # perf_event_open(attr, pid=tid, cpu=-1 (any), group_fd=-1, flags=0)
+            fd = libc.syscall(syscall_number, ctypes.byref(attr), tid, -1, -1, 0)
+            if fd < 0:
+                err = ctypes.get_errno()
+                for _name, opened_fd in opened:
+                    os.close(opened_fd)
+                if err == errno.ESRCH:
+                    # The thread exited between listing and opening.
+                    opened = []
+                    break
+                for thread_fds in fds.values():
+                    for opened_fd in thread_fds:
+                        os.close(opened_fd)
+                notes.append(f"Hardware performance counters unavailable ({name}: {os.strerror(err)}); CPU IPC not reported.")
+                return {}
+            opened.append((name, fd))
+        for name, fd in opened:
+            fds[name].append(fd)
+    return fds if fds["cycles"] else {}
+
+
+def _derive(counts: dict[str, int]) -> dict[str, Any]:
+    cycles = counts.get("cycles", 0)
+    instructions = counts.get("instructions", 0)
+    kilo_instructions = instructions / 1000.0
+    return {
+        "cycles": cycles,
+        "instructions": instructions,
+        "ipc": round(instructions / cycles, 6) if cycles else None,
+        "cache_mpki": round(counts.get("cache_misses", 0) / kilo_instructions, 6) if instructions else None,
+        "branch_mpki": round(counts.get("branch_misses", 0) / kilo_instructions, 6) if instructions else None,
+    }
+
+
+__all__ = ["hardware_counters"]
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 
 def generate_remediation(report: dict[str, Any]) -> dict[str, Any]:
@@ -12,61 +13,57 @@ def generate_remediation(report: dict[str, Any]) -> dict[str, Any]:
     confidence = _to_float(analysis.get("confidence"))
     priority = _priority_from_confidence(confidence)
 
-    actions = _actions_for_primary(str(primary) if primary is not None else None)
     return {
         "priority": priority,
-        "actions": actions,
+        "actions": [dict(action) for action in _ACTIONS_BY_PRIMARY.get(str(primary), ())] if primary is not None else [],
     }
 
 
-def _actions_for_primary(primary: str | None) -> list[dict[str, str]]:
-    if primary == "memory_bandwidth":
-        return [
+def _action(title: str, impact: str, difficulty: str, reason: str) -> dict[str, str]:
+    return {
+        "title": title,
+        "impact": impact,
+        "difficulty": difficulty,
+        "reason": reason,
+    }
+
+
+# Built once at import; generate_remediation hands out copies so reports never share these dicts.
+_ACTIONS_BY_PRIMARY: Mapping[str, tuple[dict[str, str], ...]] = MappingProxyType(
+    {
+        "memory_bandwidth": (
             _action("Switch to fp16/bf16 precision", "high", "medium", "Reduced bytes per operation lowers memory pressure."),
             _action("Use fused attention/kernels", "high", "high", "Kernel fusion reduces memory traffic and launch overhead."),
             _action("Increase arithmetic intensity", "medium", "medium", "Larger batch/matmul can improve compute-to-memory ratio."),
             _action("Use dataset sharding", "medium", "medium", "Sharding improves data locality and reduces input stalls."),
-        ]
-    if primary == "gpu_instability":
-        return [
+        ),
+        "gpu_instability": (
             _action("Check power/thermal limits", "high", "medium", "Instability patterns often align with thermal or power throttling."),
             _action("Close background GPU processes", "medium", "low", "Background load can create throughput variance."),
             _action("Test reduced matrix size", "medium", "low", "Smaller workloads help verify throttling sensitivity."),
-        ]
-    if primary == "cpu_instability":
-        return [
+        ),
+        "cpu_instability": (
             _action("Close background CPU processes", "high", "low", "CPU contention increases benchmark variance."),
             _action("Check power governor/mode", "medium", "medium", "Aggressive power saving can destabilize sustained throughput."),
             _action("Limit BLAS thread count", "medium", "medium", "Oversubscribed threads can cause oscillating performance."),
-        ]
-    if primary == "cpu_compute":
-        return [
+        ),
+        "cpu_compute": (
             _action("Install optimized BLAS libraries", "high", "medium", "Vectorized kernels can improve CPU throughput significantly."),
             _action("Avoid Python loops in hot paths", "high", "medium", "Interpreter overhead limits sustained CPU compute."),
             _action("Vectorize workloads", "high", "medium", "Batch/vector operations improve CPU utilization."),
-        ]
-    if primary == "gpu_compute":
-        return [
+        ),
+        "gpu_compute": (
             _action("Verify correct backend (cuda/mps)", "high", "low", "Incorrect backend selection can cap GPU performance."),
             _action("Enable mixed precision where safe", "high", "medium", "Reduced precision often increases GPU throughput."),
             _action("Confirm model/device placement", "high", "low", "Host-side execution prevents expected GPU utilization."),
-        ]
-    if primary == "disk_io":
-        return [
+        ),
+        "disk_io": (
             _action("Use NVMe-class storage", "high", "high", "Low random I/O throughput indicates storage bottlenecks."),
             _action("Use sharded dataset formats", "high", "medium", "Sharded formats reduce random small-file access overhead."),
             _action("Increase DataLoader workers and prefetch", "medium", "medium", "Parallel prefetch can hide random I/O latency."),
-        ]
-    return []
-
-
-def _action(title: str, impact: str, difficulty: str, reason: str) -> dict[str, str]:
-    return {
-        "title": title,
-        "impact": impact,
-        "difficulty": difficulty,
-        "reason": reason,
+        ),
     }
+)
 
 
 def _priority_from_confidence(confidence: float | None) -> str:
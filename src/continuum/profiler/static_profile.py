@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import importlib.util
 import os
 import platform
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
+from continuum.profiler.sysctl import sysctl_int, sysctl_value
 
-_PSUTIL_UNSET = object()
-_PSUTIL_CACHE: Any = _PSUTIL_UNSET
+
+_UNSET = object()
+_PSUTIL_CACHE: Any = _UNSET
+_TORCH_CUDA_CACHE: Any = _UNSET
+_MEMTOTAL_RE = re.compile(r"^MemTotal:\s*(\d+)\s+kB", flags=re.MULTILINE)
+# nvme0n1p2 -> nvme0n1, mmcblk0p1 -> mmcblk0, sda2 -> sda (also vda1 -> vda, xvda1 -> xvda)
+_BLOCK_DEVICE_RE = re.compile(r"^(?:(?P<nvme>nvme\d+n\d+)p\d+|(?P<mmc>mmcblk\d+)p\d+|(?P<sd>[a-zA-Z]+)\d+)$")
+_OS_RELEASE_RE = re.compile(r"^[ \t]*(PRETTY_NAME|NAME|VERSION|VERSION_ID)=(.*)$", flags=re.MULTILINE)
+_CPU_MODEL_RE = re.compile(r"^model name[^\n:]*:[ \t]*(\S[^\n]*)", flags=re.MULTILINE | re.IGNORECASE)
 
 
 def collect_static_profile(context: dict[str, Any]) -> dict[str, Any]:
@@ -19,29 +29,47 @@ def collect_static_profile(context: dict[str, Any]) -> dict[str, Any]:
     if isinstance(cached, dict):
         return cached
 
-    notes: list[str] = []
-
-    profile = {
-        "cpu": _probe_cpu(notes),
-        "memory": _probe_memory(notes),
-        "storage": _probe_storage(notes),
-        "os": _probe_os(notes),
-        "runtime": _probe_runtime(notes),
-        "notes": notes,
+    probes: dict[str, Callable[[list[str]], dict[str, Any]]] = {
+        "cpu": _probe_cpu,
+        "memory": _probe_memory,
+        "storage": _probe_storage,
+        "os": _probe_os,
+        "runtime": functools.partial(_probe_runtime, probe_cuda=bool(context.get("probe_cuda"))),
     }
+    # The probes are independent and mostly wait on file reads, sysctl and the torch
+    # import, so overlap them; each writes its own notes, merged in probe order.
+    probe_notes: dict[str, list[str]] = {name: [] for name in probes}
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {name: executor.submit(probe, probe_notes[name]) for name, probe in probes.items()}
+        profile: dict[str, Any] = {name: future.result() for name, future in futures.items()}
+    profile["notes"] = [note for name in probes for note in probe_notes[name]]
 
     facts["static_profile"] = profile
     return profile
 
 
 def _probe_cpu(notes: list[str]) -> dict[str, Any]:
+    return _replay_probe(_cpu_facts, notes)
+
+
+def _replay_probe(probe: Any, notes: list[str]) -> dict[str, Any]:
+    # Hardware and OS facts do not change within a process, so the probes run once and
+    # later profiles replay the cached result and notes instead of re-issuing syscalls.
+    facts, probe_notes = probe()
+    notes.extend(probe_notes)
+    return dict(facts)
+
+
+@functools.lru_cache(maxsize=1)
+def _cpu_facts() -> tuple[dict[str, Any], tuple[str, ...]]:
+    notes: list[str] = []
     model: str | None = None
 
     system = platform.system()
     if system == "Linux":
         model = _cpu_model_from_proc_cpuinfo()
     elif system == "Darwin":
-        model = _sysctl_value("machdep.cpu.brand_string")
+        model = sysctl_value("machdep.cpu.brand_string")
     elif system == "Windows":
         model = platform.processor() or None
 
@@ -64,30 +92,34 @@ def _probe_cpu(notes: list[str]) -> dict[str, Any]:
     except Exception as exc:  # noqa: BLE001
         notes.append(f"Logical CPU count probe failed: {type(exc).__name__}: {exc}")
 
-    return {
+    facts = {
         "model": model,
         "cores_physical": int(physical) if isinstance(physical, int) else None,
         "cores_logical": int(logical) if isinstance(logical, int) else None,
         "arch": platform.machine() or None,
     }
+    return facts, tuple(notes)
 
 
 def _cpu_model_from_proc_cpuinfo() -> str | None:
     try:
-        text = Path("/proc/cpuinfo").read_text(encoding="utf-8", errors="ignore")
+        text = _read_proc("/proc/cpuinfo")
     except OSError:
         return None
 
-    for line in text.splitlines():
-        if line.lower().startswith("model name"):
-            _, _, value = line.partition(":")
-            model = value.strip()
-            if model:
-                return model
-    return None
+    # Many-core hosts repeat every field per logical CPU; stop at the first model line
+    # instead of splitting the whole file.
+    match = _CPU_MODEL_RE.search(text)
+    return match.group(1).strip() if match else None
 
 
 def _probe_memory(notes: list[str]) -> dict[str, Any]:
+    return _replay_probe(_memory_facts, notes)
+
+
+@functools.lru_cache(maxsize=1)
+def _memory_facts() -> tuple[dict[str, Any], tuple[str, ...]]:
+    notes: list[str] = []
     total: int | None = None
 
     psutil_mod = _get_psutil()
@@ -105,7 +137,7 @@ def _probe_memory(notes: list[str]) -> dict[str, Any]:
     if total is None:
         notes.append("Total RAM could not be determined.")
 
-    return {"total_bytes": total}
+    return {"total_bytes": total}, tuple(notes)
 
 
 def _memory_total_fallback() -> int | None:
@@ -113,17 +145,17 @@ def _memory_total_fallback() -> int | None:
 
     if system == "Linux":
         try:
-            text = Path("/proc/meminfo").read_text(encoding="utf-8", errors="ignore")
-            match = re.search(r"^MemTotal:\s*(\d+)\s+kB", text, flags=re.MULTILINE)
+            text = _read_proc("/proc/meminfo")
+            match = _MEMTOTAL_RE.search(text)
             if match:
                 return int(match.group(1)) * 1024
         except OSError:
             return None
 
     if system == "Darwin":
-        value = _sysctl_value("hw.memsize")
-        if value and value.isdigit():
-            return int(value)
+        memsize = sysctl_int("hw.memsize")
+        if memsize:
+            return memsize
 
     if system == "Windows":
         try:
@@ -170,7 +202,10 @@ def _probe_storage(notes: list[str]) -> dict[str, Any]:
         dev_lower = root_device.lower()
         is_nvme = "nvme" in dev_lower
 
-        if system == "Linux" and root_device.startswith("/dev/"):
+        if is_nvme:
+            # NVMe devices are never rotational; no need to read the sysfs flag.
+            is_ssd = True
+        elif system == "Linux" and root_device.startswith("/dev/"):
             base = _linux_base_block_device(root_device)
             if base is None:
                 storage_notes.append(f"Unable to map partition to base block device: {root_device}")
@@ -213,7 +248,11 @@ def _linux_root_device_and_fs(root_mount: str) -> tuple[str | None, str | None]:
     except OSError:
         return _root_device_and_fs_from_psutil(root_mount)
 
+    # Only the root mount matters, so skip splitting lines that cannot contain it.
+    needle = f" {root_mount} "
     for line in text.splitlines():
+        if needle not in line:
+            continue
         parts = line.split()
         if len(parts) < 3:
             continue
@@ -263,20 +302,9 @@ def _is_network_filesystem(filesystem_type: str | None, device: str) -> bool:
 def _linux_base_block_device(device_path: str) -> str | None:
     devname = Path(device_path).name
 
-    # nvme0n1p2 -> nvme0n1
-    nvme_match = re.match(r"^(nvme\d+n\d+)p\d+$", devname)
-    if nvme_match:
-        return nvme_match.group(1)
-
-    # mmcblk0p1 -> mmcblk0
-    mmc_match = re.match(r"^(mmcblk\d+)p\d+$", devname)
-    if mmc_match:
-        return mmc_match.group(1)
-
-    # sda2 -> sda, vda1 -> vda, xvda1 -> xvda
-    sd_match = re.match(r"^([a-zA-Z]+)\d+$", devname)
-    if sd_match:
-        return sd_match.group(1)
+    match = _BLOCK_DEVICE_RE.match(devname)
+    if match:
+        return match.group("nvme") or match.group("mmc") or match.group("sd")
 
     if devname:
         return devname
@@ -285,6 +313,12 @@ def _linux_base_block_device(device_path: str) -> str | None:
 
 
 def _probe_os(notes: list[str]) -> dict[str, Any]:
+    return _replay_probe(_os_facts, notes)
+
+
+@functools.lru_cache(maxsize=1)
+def _os_facts() -> tuple[dict[str, Any], tuple[str, ...]]:
+    notes: list[str] = []
     name = platform.system() or None
     version = platform.version() or None
     kernel = platform.release() or None
@@ -303,11 +337,12 @@ def _probe_os(notes: list[str]) -> dict[str, Any]:
     if kernel is None:
         notes.append("Kernel version could not be determined.")
 
-    return {
+    facts = {
         "name": name,
         "version": version,
         "kernel": kernel,
     }
+    return facts, tuple(notes)
 
 
 def _linux_os_release() -> dict[str, str | None]:
@@ -316,13 +351,7 @@ def _linux_os_release() -> dict[str, str | None]:
     except OSError:
         return {"name": None, "version": None}
 
-    values: dict[str, str] = {}
-    for line in text.splitlines():
-        line = line.strip()
-        if not line or "=" not in line or line.startswith("#"):
-            continue
-        key, value = line.split("=", 1)
-        values[key] = value.strip().strip('"')
+    values = {key: value.strip().strip('"') for key, value in _OS_RELEASE_RE.findall(text)}
 
     return {
         "name": values.get("PRETTY_NAME") or values.get("NAME"),
@@ -330,7 +359,7 @@ def _linux_os_release() -> dict[str, str | None]:
     }
 
 
-def _probe_runtime(notes: list[str]) -> dict[str, Any]:
+def _probe_runtime(notes: list[str], probe_cuda: bool = False) -> dict[str, Any]:
     torch_version: str | None = None
     torch_cuda_available: bool | None = None
     torch_cuda_version: str | None = None
@@ -343,11 +372,11 @@ def _probe_runtime(notes: list[str]) -> dict[str, Any]:
             torch = importlib.import_module("torch")
             torch_version = str(getattr(torch, "__version__", None)) if getattr(torch, "__version__", None) is not None else None
             torch_cuda_version = getattr(getattr(torch, "version", None), "cuda", None)
-            try:
-                torch_cuda_available = bool(torch.cuda.is_available())
-            except Exception as exc:  # noqa: BLE001
-                notes.append(f"Torch CUDA availability probe failed: {type(exc).__name__}: {exc}")
-                torch_cuda_available = None
+            if probe_cuda:
+                torch_cuda_available = _torch_cuda_available(torch, notes)
+            else:
+                # torch.cuda.is_available() initializes the CUDA driver, which can take seconds.
+                notes.append("Torch CUDA availability not probed; pass --probe-cuda to initialize CUDA during static profiling.")
         except Exception as exc:  # noqa: BLE001
             notes.append(f"Torch appears installed but could not be imported: {type(exc).__name__}: {exc}")
 
@@ -360,28 +389,27 @@ def _probe_runtime(notes: list[str]) -> dict[str, Any]:
     }
 
 
-def _sysctl_value(key: str) -> str | None:
+def _torch_cuda_available(torch: Any, notes: list[str]) -> bool | None:
+    global _TORCH_CUDA_CACHE
+    if _TORCH_CUDA_CACHE is not _UNSET:
+        return _TORCH_CUDA_CACHE
+
     try:
-        import subprocess
-
-        proc = subprocess.run(
-            ["sysctl", "-n", key],
-            capture_output=True,
-            text=True,
-            timeout=0.1,
-            check=False,
-        )
-        if proc.returncode == 0:
-            value = proc.stdout.strip()
-            return value or None
-    except Exception:
+        _TORCH_CUDA_CACHE = bool(torch.cuda.is_available())
+    except Exception as exc:  # noqa: BLE001
+        notes.append(f"Torch CUDA availability probe failed: {type(exc).__name__}: {exc}")
         return None
-    return None
+    return _TORCH_CUDA_CACHE
+
+
+@functools.lru_cache(maxsize=None)
+def _read_proc(path: str) -> str:
+    return Path(path).read_text(encoding="utf-8", errors="ignore")
 
 
 def _get_psutil() -> Any | None:
     global _PSUTIL_CACHE
-    if _PSUTIL_CACHE is not _PSUTIL_UNSET:
+    if _PSUTIL_CACHE is not _UNSET:
         return _PSUTIL_CACHE
 
     if importlib.util.find_spec("psutil") is None:
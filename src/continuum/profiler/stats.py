@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Any, Callable, Sequence
+
+try:
+    import numpy as _np
+except Exception:  # pragma: no cover
+    _np = None
+
+_NS_PER_SEC = 1_000_000_000
+# Adaptive warmup compares the mean of the latest window of kernel timings with the
+# window before it and stops once they agree within the tolerance.
+_WARMUP_WINDOW = 8
+_WARMUP_TOLERANCE = 0.02
+
+
+def summarize(values: Sequence[float]) -> tuple[float, float, float, float]:
+    # (mean, population std, p50, p95) in one vectorized pass when NumPy is available.
+    if _np is not None:
+        samples = _np.asarray(values, dtype=_np.float64)
+        p50, p95 = _np.percentile(samples, [50.0, 95.0])
+        return float(samples.mean()), float(samples.std()), float(p50), float(p95)
+    mean_value, std_value = _mean_std(values)
+    ordered = sorted(values)
+    return mean_value, std_value, _percentile_sorted(ordered, 50.0), _percentile_sorted(ordered, 95.0)
+
+
+def mean(values: Sequence[float]) -> float:
+    return sum(values) / len(values)
+
+
+def std(values: Sequence[float]) -> float:
+    if len(values) < 2:
+        return 0.0
+    return _mean_std(values)[1]
+
+
+def _mean_std(values: Sequence[float]) -> tuple[float, float]:
+    # Welford's update yields mean and population std in a single pass over the samples.
+    count = 0
+    running_mean = 0.0
+    m2 = 0.0
+    for value in values:
+        count += 1
+        delta = value - running_mean
+        running_mean += delta / count
+        m2 += delta * (value - running_mean)
+    return running_mean, (m2 / count) ** 0.5 if count else 0.0
+
+
+def percentile(values: Sequence[float], percentile: float) -> float:
+    return _percentile_sorted(sorted(values), percentile)
+
+
+def _percentile_sorted(ordered: Sequence[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * (percentile / 100.0)
+    lo = int(rank)
+    hi = min(lo + 1, len(ordered) - 1)
+    frac = rank - lo
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * frac
+
+
+def warm_up(kernel: Callable[[], Any], duration_sec: float, clock: Callable[[], int], adaptive: bool = True) -> None:
+    # duration_sec is the upper bound; adaptive mode returns as soon as timings settle.
+    end_at = clock() + int(duration_sec * _NS_PER_SEC)
+    if not adaptive:
+        while clock() < end_at:
+            kernel()
+        return
+
+    recent: deque[int] = deque(maxlen=2 * _WARMUP_WINDOW)
+    now = clock()
+    while now < end_at:
+        kernel()
+        later = clock()
+        recent.append(later - now)
+        now = later
+        if len(recent) == recent.maxlen:
+            older = sum(islice(recent, _WARMUP_WINDOW))
+            newer = sum(islice(recent, _WARMUP_WINDOW, None))
+            if newer > 0 and abs(newer - older) <= _WARMUP_TOLERANCE * newer:
+                return
+
+
+def as_positive_float(value: Any, default: float) -> float:
+    try:
+        number = float(value)
+    except Exception:
+        return default
+    return number if number > 0 else default
+
+
+def as_positive_int(value: Any, default: int | None) -> int | None:
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except Exception:
+        return default
+    return number if number > 0 else default
+
+
+def round_metric(value: float) -> float:
+    return round(float(value), 6)
+
+
+def round_metrics(values: Sequence[float]) -> list[float]:
+    if _np is not None:
+        return _np.round(_np.asarray(values, dtype=_np.float64), 6).tolist()
+    return [round_metric(value) for value in values]
+
+
+__all__ = [
+    "summarize",
+    "mean",
+    "std",
+    "percentile",
+    "warm_up",
+    "as_positive_float",
+    "as_positive_int",
+    "round_metric",
+    "round_metrics",
+]
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import sys
+
+
+def sysctl_value(key: str) -> str | None:
+    raw = sysctl_bytes(key)
+    if raw is None:
+        return None
+    value = raw.split(b"\0", 1)[0].decode("utf-8", errors="ignore").strip()
+    return value or None
+
+
+def sysctl_int(key: str) -> int | None:
+    raw = sysctl_bytes(key)
+    if raw is None or len(raw) not in (4, 8):
+        return None
+    return int.from_bytes(raw, sys.byteorder)
+
+
+def sysctl_bytes(key: str) -> bytes | None:
+    # sysctlbyname is a plain libSystem call, so lookups do not fork a sysctl process.
+    try:
+        import ctypes
+        import ctypes.util
+
+        sysctlbyname = ctypes.CDLL(ctypes.util.find_library("c")).sysctlbyname
+        name = key.encode()
+        size = ctypes.c_size_t(0)
+        if sysctlbyname(name, None, ctypes.byref(size), None, ctypes.c_size_t(0)) != 0 or not size.value:
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+        if sysctlbyname(name, buf, ctypes.byref(size), None, ctypes.c_size_t(0)) != 0:
+            return None
+        return buf.raw[: size.value]
+    except Exception:
+        return None
+
+
+__all__ = ["sysctl_bytes", "sysctl_int", "sysctl_value"]
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import functools
 import json
 import platform
+import re
 import subprocess
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from importlib import import_module
-from importlib.metadata import PackageNotFoundError, version
+from importlib.metadata import distributions
 from pathlib import Path
 from typing import Any
 
+from continuum import __version__
+
 try:
     import typer
 except Exception:  # pragma: no cover
@@ -29,11 +34,9 @@ except Exception:  # pragma: no cover
     typer = _TyperShim()  # type: ignore[assignment]
 
 try:
-    from rich.console import Console
-    from rich.table import Table
+    import orjson
 except Exception:  # pragma: no cover
-    Console = None  # type: ignore[assignment]
-    Table = None  # type: ignore[assignment]
+    orjson = None  # type: ignore[assignment]
 
 _DEFAULT_CUDA_TORCH_INDEX = "https://download.pytorch.org/whl/cu121"
 _PYPI_INDEX = "https://pypi.org/simple"
@@ -82,9 +85,10 @@ def setup_command(
         _write_manifest(manifest, manifest_path)
         requirements_path = manifest_path.parent / "requirements.txt"
         readme_path = manifest_path.parent / "README.md"
-        _write_state_requirements(manifest, requirements_path)
-        _write_state_readme(manifest, manifest_path, requirements_path, readme_path, dry_run=dry_run)
-        _render_summary(manifest, manifest_path)
+        view = _manifest_view(manifest)
+        _write_state_requirements(view, requirements_path)
+        _write_state_readme(view, manifest_path, requirements_path, readme_path, dry_run=dry_run)
+        _render_summary(view, manifest_path)
 
         raise typer.Exit(code=0)
     except ValueError as exc:
@@ -106,36 +110,28 @@ def _build_install_commands(
     upgrade: bool,
     requirements: Path | None,
 ) -> list[list[str]]:
-    commands: list[list[str]] = []
-    commands.append([sys.executable, "-m", "pip", "--version"])
-
-    if upgrade:
-        commands.append([sys.executable, "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"])
-
-    numpy_cmd = [sys.executable, "-m", "pip", "install"]
-    if upgrade:
-        numpy_cmd.append("--upgrade")
-    numpy_cmd.append(numpy_spec)
-    commands.append(numpy_cmd)
-
-    if with_torch:
-        effective_torch_index = torch_index or _default_torch_index()
-        torch_cmd = [sys.executable, "-m", "pip", "install"]
-        if upgrade:
-            torch_cmd.append("--upgrade")
-        if effective_torch_index:
-            # Force torch wheel resolution from the selected index (CUDA wheels on Linux/Windows).
-            torch_cmd.extend(["--index-url", effective_torch_index, "--extra-index-url", _PYPI_INDEX])
-        torch_cmd.append(torch_spec or "torch")
-        commands.append(torch_cmd)
+    torch_index = (torch_index or _default_torch_index()) if with_torch else None
+    pip_install = [sys.executable, "-m", "pip", "install", "--upgrade"] if upgrade else [sys.executable, "-m", "pip", "install"]
 
+    commands: list[list[str]] = []
+    if torch_index:
+        # torch gets its own run with the torch index as the primary index. pip takes the
+        # highest version across all indexes, so only adding the CUDA index would let a newer
+        # (on Windows, CPU-only) PyPI torch win, and would expose every other package to it.
+        # It runs first so torch dependents in the requirements find it already satisfied
+        # instead of pulling a PyPI build that the later run would then keep.
+        commands.append([*pip_install, "--index-url", torch_index, "--extra-index-url", _PYPI_INDEX, torch_spec or "torch"])
+
+    # numpy and the requirements resolve together in one pip run, without the torch index.
+    install_cmd = [*pip_install, numpy_spec]
+    if with_torch and not torch_index:
+        install_cmd.append(torch_spec or "torch")
     if requirements is not None:
-        req_cmd = [sys.executable, "-m", "pip", "install"]
-        if upgrade:
-            req_cmd.append("--upgrade")
-        req_cmd.extend(["-r", str(requirements)])
-        commands.append(req_cmd)
+        install_cmd.extend(["-r", str(requirements)])
+    commands.append(install_cmd)
 
+    if upgrade:
+        return [[sys.executable, "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"], *commands]
     return commands
 
 
@@ -147,12 +143,21 @@ def _run_command(cmd: list[str], *, dry_run: bool, verbose: bool) -> None:
     if verbose:
         typer.echo(f"$ {' '.join(cmd)}")
 
+    if not verbose:
+        # pip's progress output is discarded; only stderr is kept, to report a failure.
+        completed = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=False)
+        if completed.returncode == 0:
+            return
+        detail = (completed.stderr or "").strip()
+        if detail:
+            typer.echo(detail, err=True)
+        raise RuntimeError(f"Command failed ({completed.returncode}): {' '.join(cmd)}")
+
     completed = subprocess.run(cmd, capture_output=True, text=True, check=False)
-    if verbose:
-        if completed.stdout:
-            typer.echo(completed.stdout.rstrip())
-        if completed.stderr:
-            typer.echo(completed.stderr.rstrip(), err=True)
+    if completed.stdout:
+        typer.echo(completed.stdout.rstrip())
+    if completed.stderr:
+        typer.echo(completed.stderr.rstrip(), err=True)
     if completed.returncode != 0:
         raise RuntimeError(f"Command failed ({completed.returncode}): {' '.join(cmd)}")
 
@@ -170,10 +175,15 @@ def _build_manifest(*, with_torch: bool, dry_run: bool) -> dict[str, Any]:
         try:
             torch = import_module("torch")
             installed["torch"] = getattr(torch, "__version__", None)
-            cuda = getattr(torch, "cuda", None)
-            installed["torch_cuda_available"] = bool(getattr(cuda, "is_available", lambda: False)())
-            version_obj = getattr(torch, "version", None)
-            installed["torch_cuda_version"] = getattr(version_obj, "cuda", None)
+            if platform.system().lower() == "darwin":
+                # No CUDA builds exist for macOS and nothing is enforced there, so skip the
+                # driver probe that torch.cuda.is_available() would pay.
+                notes.append("CUDA probe skipped on darwin.")
+            else:
+                cuda = getattr(torch, "cuda", None)
+                installed["torch_cuda_available"] = bool(getattr(cuda, "is_available", lambda: False)())
+                version_obj = getattr(torch, "version", None)
+                installed["torch_cuda_version"] = getattr(version_obj, "cuda", None)
         except Exception as exc:  # noqa: BLE001
             notes.append(f"Torch validation failed: {type(exc).__name__}: {exc}")
 
@@ -181,28 +191,52 @@ def _build_manifest(*, with_torch: bool, dry_run: bool) -> dict[str, Any]:
         notes.append("Dry-run enabled; install commands were not executed.")
 
     manifest: dict[str, Any] = {
-        "python_version": platform.python_version(),
-        "platform": platform.platform(),
-        "architecture": platform.machine(),
+        **_platform_info(),
         "venv": bool(sys.prefix != getattr(sys, "base_prefix", sys.prefix)),
         "installed": installed,
         "timestamp": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
-        "continuum_version": _safe_dist_version("continuum-intelligence"),
+        "continuum_version": __version__,
     }
     if notes:
         manifest["notes"] = notes
     return manifest
 
 
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> dict[str, str]:
+    # platform.platform() forks `uname -p` on Linux; resolve it once per process, and only
+    # when a manifest is built rather than on every CLI import.
+    return {
+        "python_version": platform.python_version(),
+        "platform": platform.platform(),
+        "architecture": platform.machine(),
+    }
+
+
 def _safe_dist_version(dist_name: str) -> str | None:
     try:
-        return version(dist_name)
-    except PackageNotFoundError:
-        return None
+        return _dist_index().get(_normalize_dist_name(dist_name))
     except Exception:
         return None
 
 
+@functools.lru_cache(maxsize=1)
+def _dist_index() -> dict[str, str]:
+    # One walk over installed distribution metadata serves every lookup; it runs after
+    # the pip installs, so the versions reflect the packages setup just installed.
+    index: dict[str, str] = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if name:
+            # First match wins, mirroring importlib.metadata.version() and sys.path order.
+            index.setdefault(_normalize_dist_name(name), dist.version)
+    return index
+
+
+def _normalize_dist_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
 def _default_torch_index() -> str | None:
     if platform.system().lower() == "darwin":
         return None
@@ -237,69 +271,99 @@ def _resolve_manifest_path() -> Path:
 
 def _write_manifest(manifest: dict[str, Any], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(manifest, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    path.write_bytes(_dump_manifest(manifest))
+
+
+def _dump_manifest(manifest: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(manifest, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass
+    return (json.dumps(manifest, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
 
 
-def _write_state_requirements(manifest: dict[str, Any], path: Path) -> None:
-    installed = manifest.get("installed", {})
+@dataclass(frozen=True, slots=True)
+class _ManifestView:
+    manifest: dict[str, Any]
+    numpy: Any
+    torch: Any
+    cuda_available: Any
+
+
+def _manifest_view(manifest: dict[str, Any]) -> _ManifestView:
+    # Read the installed versions once so the state writers and summary cannot diverge.
+    installed = manifest.get("installed")
+    installed = installed if isinstance(installed, dict) else {}
+    return _ManifestView(
+        manifest=manifest,
+        numpy=installed.get("numpy"),
+        torch=installed.get("torch"),
+        cuda_available=installed.get("torch_cuda_available"),
+    )
+
+
+def _write_state_requirements(view: _ManifestView, path: Path) -> None:
     lines: list[str] = []
-    if isinstance(installed, dict):
-        numpy_version = installed.get("numpy")
-        torch_version = installed.get("torch")
-        if isinstance(numpy_version, str) and numpy_version.strip():
-            lines.append(f"numpy=={numpy_version}")
-        else:
-            lines.append("numpy")
-        if isinstance(torch_version, str) and torch_version.strip():
-            lines.append(f"torch=={torch_version}")
+    if isinstance(view.numpy, str) and view.numpy.strip():
+        lines.append(f"numpy=={view.numpy}")
+    else:
+        lines.append("numpy")
+    if isinstance(view.torch, str) and view.torch.strip():
+        lines.append(f"torch=={view.torch}")
     path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def _write_state_readme(
-    manifest: dict[str, Any],
+    view: _ManifestView,
     manifest_path: Path,
     requirements_path: Path,
     readme_path: Path,
     *,
     dry_run: bool,
 ) -> None:
-    installed = manifest.get("installed", {})
-    numpy_version = installed.get("numpy") if isinstance(installed, dict) else None
-    torch_version = installed.get("torch") if isinstance(installed, dict) else None
-    cuda_available = installed.get("torch_cuda_available") if isinstance(installed, dict) else None
-    lines = [
+    manifest = view.manifest
+    lines = (
         "# Continuum Setup State",
         "",
         "This directory contains reproducibility artifacts from `continuum setup`.",
         "",
         "## Files",
-        f"- `env_manifest.json`: captured environment and install metadata",
-        f"- `requirements.txt`: pinned package snapshot for setup-installed ML deps",
+        "- `env_manifest.json`: captured environment and install metadata",
+        "- `requirements.txt`: pinned package snapshot for setup-installed ML deps",
         "",
         "## Snapshot",
         f"- python_version: {manifest.get('python_version')}",
         f"- platform: {manifest.get('platform')}",
         f"- architecture: {manifest.get('architecture')}",
-        f"- numpy: {'null' if numpy_version is None else numpy_version}",
-        f"- torch: {'null' if torch_version is None else torch_version}",
-        f"- torch_cuda_available: {'null' if cuda_available is None else cuda_available}",
+        f"- numpy: {'null' if view.numpy is None else view.numpy}",
+        f"- torch: {'null' if view.torch is None else view.torch}",
+        f"- torch_cuda_available: {'null' if view.cuda_available is None else view.cuda_available}",
         "",
         "## Re-apply",
         f"`{sys.executable} -m pip install -r {requirements_path}`",
         "",
         "## Manifest Path",
         str(manifest_path),
-    ]
+    )
     if dry_run:
-        lines.extend(["", "Note: setup was run with `--dry-run`; no pip installs were executed."])
+        lines += ("", "Note: setup was run with `--dry-run`; no pip installs were executed.")
     readme_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
-def _render_summary(manifest: dict[str, Any], manifest_path: Path) -> None:
-    installed = manifest.get("installed", {})
-    numpy_version = installed.get("numpy") if isinstance(installed, dict) else None
-    torch_version = installed.get("torch") if isinstance(installed, dict) else None
-    torch_cuda_available = installed.get("torch_cuda_available") if isinstance(installed, dict) else None
+def _render_summary(view: _ManifestView, manifest_path: Path) -> None:
+    manifest = view.manifest
+    numpy_version = view.numpy
+    torch_version = view.torch
+    torch_cuda_available = view.cuda_available
+
+    # rich is only needed for this final summary, so keep it off the CLI import path.
+    try:
+        from rich.console import Console
+        from rich.table import Table
+    except Exception:
+        Console = None  # type: ignore[assignment]
+        Table = None  # type: ignore[assignment]
 
     if Console is not None and Table is not None:
         console = Console()
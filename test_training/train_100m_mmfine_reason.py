@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
+import os
 from pathlib import Path
 from typing import Any
 
 from datasets import Dataset, load_dataset
+from datasets.fingerprint import Hasher
 from transformers import (
     AutoModelForCausalLM,
     AutoTokenizer,
@@ -17,6 +20,26 @@ from transformers import (
 DEFAULT_MODEL_ID = "gpt2"
 DEFAULT_DATASET_ID = "OpenDataArena/MMFineReason-1.8M-Qwen3-VL-235B-Thinking"
 
+_PREFERRED_KEYS = (
+    "text",
+    "prompt",
+    "response",
+    "question",
+    "answer",
+    "instruction",
+    "output",
+    "messages",
+    "conversations",
+)
+_PREFERRED_KEY_SET = frozenset(_PREFERRED_KEYS)
+
+# Part of the tokenized-cache key: bump when example_to_text/flatten_to_text or the
+# tokenize_fn output (padding, extra columns) changes, so older Arrow files are not reused.
+_TOKENIZED_FORMAT_VERSION = 2
+
+# Stack entry kinds for flatten_to_text.
+_VALUE, _KEY_START, _KEY_END = 0, 1, 2
+
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Test trainer for MMFineReason dataset")
@@ -33,56 +56,76 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--save-steps", type=int, default=200)
     parser.add_argument("--resume", type=str, default=None, help="Checkpoint path for resuming")
     parser.add_argument("--fp16", action="store_true")
+    parser.add_argument("--bf16", action="store_true", help="BF16 mixed precision (Ampere or newer)")
+    parser.add_argument("--tf32", action="store_true", help="Allow TF32 matmuls (Ampere or newer)")
+    parser.add_argument("--gradient-checkpointing", action="store_true")
+    parser.add_argument("--torch-compile", action="store_true")
+    parser.add_argument(
+        "--attn-implementation",
+        type=str,
+        default=None,
+        help='Attention kernel, e.g. "sdpa" or "flash_attention_2" (requires flash-attn)',
+    )
+    parser.add_argument(
+        "--num-proc",
+        type=int,
+        default=max(1, (os.cpu_count() or 1) // 2),
+        help="Worker processes for dataset tokenization",
+    )
     return parser.parse_args()
 
 
 def flatten_to_text(value: Any) -> str:
-    if value is None:
-        return ""
-    if isinstance(value, str):
-        return value
-    if isinstance(value, (int, float, bool)):
-        return str(value)
-    if isinstance(value, list):
-        return "\n".join(part for item in value if (part := flatten_to_text(item)))
-    if isinstance(value, dict):
-        # Common conversational keys are handled naturally by recursive flattening.
-        chunks: list[str] = []
-        for key in sorted(value.keys()):
-            part = flatten_to_text(value[key])
-            if part:
-                chunks.append(f"{key}: {part}")
-        return "\n".join(chunks)
-    return str(value)
+    # Every nesting level joins with "\n", so the result is the non-empty leaves in order,
+    # with each dict key prefixed onto the first leaf beneath it. Walking an explicit stack
+    # avoids a Python call per node and any recursion limit on deeply nested rows.
+    out: list[str] = []
+    pending: list[tuple[str]] = []
+    stack: list[tuple[int, Any]] = [(_VALUE, value)]
+    while stack:
+        kind, item = stack.pop()
+        if kind == _KEY_START:
+            pending.append(item)
+            continue
+        if kind == _KEY_END:
+            # Nothing under this key produced text, so its prefix is dropped.
+            if pending and pending[-1] is item:
+                pending.pop()
+            continue
+        if item is None:
+            continue
+        if isinstance(item, list):
+            stack.extend((_VALUE, child) for child in reversed(item))
+            continue
+        if isinstance(item, dict):
+            for key in sorted(item.keys(), reverse=True):
+                entry = (f"{key}: ",)
+                stack.append((_KEY_END, entry))
+                stack.append((_VALUE, item[key]))
+                stack.append((_KEY_START, entry))
+            continue
+        text = item if isinstance(item, str) else str(item)
+        if text:
+            if pending:
+                text = "".join(prefix for (prefix,) in pending) + text
+                pending.clear()
+            out.append(text)
+    return "\n".join(out)
 
 
 def example_to_text(example: dict[str, Any]) -> str:
-    preferred_keys = [
-        "text",
-        "prompt",
-        "response",
-        "question",
-        "answer",
-        "instruction",
-        "output",
-        "messages",
-        "conversations",
-    ]
-
+    present = _PREFERRED_KEY_SET & example.keys()
     parts: list[str] = []
-    used = set()
 
-    for key in preferred_keys:
-        if key in example:
+    for key in _PREFERRED_KEYS:
+        if key in present:
             txt = flatten_to_text(example[key]).strip()
             if txt:
                 parts.append(txt)
-                used.add(key)
 
     if not parts:
-        for key in sorted(example.keys()):
-            if key in used:
-                continue
+        # Preferred keys present here all flattened to empty text; no need to revisit them.
+        for key in sorted(example.keys() - present):
             txt = flatten_to_text(example[key]).strip()
             if txt:
                 parts.append(f"{key}: {txt}")
@@ -104,13 +147,21 @@ def choose_train_split(dataset_obj: Any) -> Dataset:
 
 
 def latest_checkpoint(output_dir: Path) -> str | None:
-    if not output_dir.exists():
+    # Trainer names checkpoints "checkpoint-<global_step>", so the highest step is the
+    # latest one; ordering by name avoids a stat() per checkpoint directory.
+    latest_step = -1
+    latest_path: str | None = None
+    try:
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                prefix, _, step = entry.name.partition("-")
+                if prefix != "checkpoint" or not step.isdigit() or not entry.is_dir():
+                    continue
+                if int(step) > latest_step:
+                    latest_step, latest_path = int(step), entry.path
+    except FileNotFoundError:
         return None
-    checkpoints = [p for p in output_dir.glob("checkpoint-*") if p.is_dir()]
-    if not checkpoints:
-        return None
-    checkpoints.sort(key=lambda p: p.stat().st_mtime)
-    return str(checkpoints[-1])
+    return latest_path
 
 
 def main() -> None:
@@ -131,24 +182,41 @@ def main() -> None:
     if tokenizer.pad_token is None:
         tokenizer.pad_token = tokenizer.eos_token
 
-    model = AutoModelForCausalLM.from_pretrained(args.model)
-
-    def tokenize_fn(example: dict[str, Any]) -> dict[str, Any]:
-        text = example_to_text(example)
-        if not text:
-            text = "\n"
-        encoded = tokenizer(
-            text,
+    model_kwargs: dict[str, Any] = {}
+    if args.attn_implementation:
+        model_kwargs["attn_implementation"] = args.attn_implementation
+    model = AutoModelForCausalLM.from_pretrained(args.model, **model_kwargs)
+
+    def tokenize_fn(examples: dict[str, list[Any]]) -> dict[str, Any]:
+        # Batched: the fast tokenizer encodes the whole list in Rust with the GIL released.
+        columns = list(examples.keys())
+        texts = [example_to_text(dict(zip(columns, row))) or "\n" for row in zip(*examples.values())]
+        # No padding here: the collator pads each batch to its longest row and derives the
+        # labels from input_ids (mlm=False), so short rows never carry block_size padding.
+        return tokenizer(
+            texts,
             truncation=True,
             max_length=args.block_size,
-            padding="max_length",
+            padding=False,
         )
-        encoded["labels"] = encoded["input_ids"].copy()
-        return encoded
 
+    # Key the tokenized cache on everything that shapes it, so re-runs with the same
+    # settings load the Arrow file instead of re-tokenizing. The tokenizer is fingerprinted
+    # by content (vocab, special tokens, pad token), not just by --model.
+    cache_key = hashlib.sha1(
+        (
+            f"v{_TOKENIZED_FORMAT_VERSION}|{args.dataset}|{args.model}|{Hasher.hash(tokenizer)}"
+            f"|{args.block_size}|{args.max_samples}"
+        ).encode("utf-8")
+    ).hexdigest()[:16]
     tokenized = train_ds.map(
         tokenize_fn,
+        batched=True,
+        batch_size=1000,
+        num_proc=args.num_proc,
         remove_columns=train_ds.column_names,
+        new_fingerprint=cache_key,
+        cache_file_name=str(output_dir / f"tok_{cache_key}.arrow"),
         desc="Tokenizing dataset",
     )
 
@@ -164,13 +232,21 @@ def main() -> None:
         save_total_limit=3,
         report_to=[],
         fp16=args.fp16,
+        bf16=args.bf16,
+        tf32=args.tf32 or None,
+        gradient_checkpointing=args.gradient_checkpointing,
+        gradient_checkpointing_kwargs={"use_reentrant": False} if args.gradient_checkpointing else None,
+        torch_compile=args.torch_compile,
+        group_by_length=True,
+        dataloader_num_workers=max(2, (os.cpu_count() or 1) // 2),
+        dataloader_pin_memory=True,
     )
 
     trainer = Trainer(
         model=model,
         args=training_args,
         train_dataset=tokenized,
-        data_collator=DataCollatorForLanguageModeling(tokenizer=tokenizer, mlm=False),
+        data_collator=DataCollatorForLanguageModeling(tokenizer=tokenizer, mlm=False, pad_to_multiple_of=8),
     )
 
     resume_from = args.resume or latest_checkpoint(output_dir)
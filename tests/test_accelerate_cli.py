@@ -4,8 +4,10 @@ import json
 import os
 import tempfile
 import unittest
+from contextlib import contextmanager
 from importlib.util import find_spec
 from pathlib import Path
+from typing import Iterator
 
 if find_spec("typer") is not None:
     from typer.testing import CliRunner
@@ -16,56 +18,53 @@ else:
     app = None
 
 
+@contextmanager
+def _isolated_cwd() -> Iterator[str]:
+    # typer's bundled CliRunner has no isolated_filesystem(), so provide the equivalent.
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = Path.cwd()
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(previous)
+
+
 @unittest.skipIf(find_spec("typer") is None, "typer is not installed in this interpreter")
 class TestAccelerateCli(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.runner = CliRunner()
+
     def test_json_prints_only_json_to_stdout(self) -> None:
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmp:
-            previous = Path.cwd()
-            try:
-                os.chdir(tmp)
-                result = runner.invoke(app, ["accelerate", "--dry-run", "--json"], catch_exceptions=False)
-                self.assertEqual(result.exit_code, 0)
-                payload = json.loads(result.stdout)
-                self.assertEqual(payload["mode"], "dry-run")
-                self.assertNotIn("Hydra Launch Plan", result.stdout)
-                self.assertNotIn("Hydra Launch Plan", result.stderr)
-            finally:
-                os.chdir(previous)
+        with _isolated_cwd():
+            result = self.runner.invoke(app, ["accelerate", "--dry-run", "--json"], catch_exceptions=False)
+            self.assertEqual(result.exit_code, 0)
+            payload = json.loads(result.stdout)
+            self.assertEqual(payload["mode"], "dry-run")
+            self.assertNotIn("Hydra Launch Plan", result.stdout)
+            self.assertNotIn("Hydra Launch Plan", result.stderr)
 
     def test_invalid_profile_returns_2(self) -> None:
-        runner = CliRunner()
-        result = runner.invoke(app, ["accelerate", "--profile", "ultra"], catch_exceptions=False)
+        result = self.runner.invoke(app, ["accelerate", "--profile", "ultra"], catch_exceptions=False)
         self.assertEqual(result.exit_code, 2)
 
     def test_unknown_only_category_returns_2(self) -> None:
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmp:
-            previous = Path.cwd()
-            try:
-                os.chdir(tmp)
-                result = runner.invoke(app, ["accelerate", "--dry-run", "--only", "unknown"], catch_exceptions=False)
-                self.assertEqual(result.exit_code, 2)
-            finally:
-                os.chdir(previous)
+        with _isolated_cwd():
+            result = self.runner.invoke(app, ["accelerate", "--dry-run", "--only", "unknown"], catch_exceptions=False)
+            self.assertEqual(result.exit_code, 2)
 
     def test_deterministic_action_ordering_in_json(self) -> None:
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmp:
-            previous = Path.cwd()
-            try:
-                os.chdir(tmp)
-                result = runner.invoke(
-                    app,
-                    ["accelerate", "--dry-run", "--json", "--no-timestamp"],
-                    catch_exceptions=False,
-                )
-                self.assertEqual(result.exit_code, 0)
-                payload = json.loads(result.stdout)
-                ids = [entry["action_id"] for entry in payload["plan"]["recommendations"]]
-                self.assertEqual(ids, sorted(ids))
-            finally:
-                os.chdir(previous)
+        with _isolated_cwd():
+            result = self.runner.invoke(
+                app,
+                ["accelerate", "--dry-run", "--json", "--no-timestamp"],
+                catch_exceptions=False,
+            )
+            self.assertEqual(result.exit_code, 0)
+            payload = json.loads(result.stdout)
+            ids = [entry["action_id"] for entry in payload["plan"]["recommendations"]]
+            self.assertEqual(ids, sorted(ids))
 
 
 if __name__ == "__main__":
@@ -1,9 +1,43 @@
 from __future__ import annotations
 
+import tempfile
+import threading
 import unittest
+from pathlib import Path
 
 from continuum.accelerate.models import AccelerationAction, AccelerationActionResult, ExecutionContext
-from continuum.accelerate.registry import clear_registry, filter_actions, get_actions, register_action
+from continuum.accelerate.registry import clear_registry, filter_actions, get_actions, register_action, register_actions
+from continuum.launch.plan_builder import build_plan
+
+_THREAD_RECORDING_PLUGIN = """
+import threading
+
+from continuum.launch.models import AccelerationAction
+
+CALLS = []
+
+
+class ThreadRecordingAction(AccelerationAction):
+    id = "plugin.thread_probe"
+    title = "Thread probe"
+    category = "process"
+    why = "test"
+
+    def check(self, ctx):
+        CALLS.append(threading.get_ident())
+        return True, {}, []
+
+    def plan(self, ctx):
+        CALLS.append(threading.get_ident())
+        return True, [], {}, []
+
+    def apply(self, ctx):
+        raise NotImplementedError
+
+
+def register(register_action):
+    register_action(ThreadRecordingAction())
+"""
 
 
 class _DummyAction(AccelerationAction):
@@ -53,6 +87,16 @@ class TestAccelerateRegistry(unittest.TestCase):
         ids = [action.id for action in get_actions()]
         self.assertEqual(ids, ["a.first", "z.last"])
 
+    def test_register_actions_in_bulk_invalidates_sorted_view(self) -> None:
+        register_action(_DummyAction("m.middle", "misc"))
+        self.assertEqual([action.id for action in get_actions()], ["m.middle"])
+
+        register_actions([_DummyAction("z.last", "misc"), _DummyAction("a.first", "gpu")])
+        self.assertEqual([action.id for action in get_actions()], ["a.first", "m.middle", "z.last"])
+
+        clear_registry()
+        self.assertEqual(get_actions(), [])
+
     def test_filter_actions_profile_and_categories(self) -> None:
         actions = [
             _DummyAction("gpu.one", "gpu", profile_min="minimal"),
@@ -71,6 +115,19 @@ class TestAccelerateRegistry(unittest.TestCase):
         filtered = filter_actions(actions, only={"process.two"}, exclude=None, profile="balanced")
         self.assertEqual([action.id for action in filtered], ["process.two"])
 
+    def test_plugin_actions_are_evaluated_on_the_calling_thread(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            plugin_dir = Path(tmpdir) / ".hydra" / "launch.d"
+            plugin_dir.mkdir(parents=True)
+            (plugin_dir / "thread_probe.py").write_text(_THREAD_RECORDING_PLUGIN, encoding="utf-8")
+
+            _, planned, _, plugin_result = build_plan("balanced", None, None, include_timestamp=False, cwd=Path(tmpdir))
+
+        self.assertEqual(plugin_result.actions_loaded, 1)
+        plugin_action = next(item.action for item in planned if item.action.id == "plugin.thread_probe")
+        calls = type(plugin_action).check.__globals__["CALLS"]
+        self.assertEqual(calls, [threading.get_ident()] * 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -4,10 +4,12 @@ import json
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from continuum.accelerate.models import ActionDescriptor, AccelerationActionResult, AccelerationPlan, ExecutionContext
 from continuum.accelerate.plugins.loader import HookBundle, PluginLoadResult
 from continuum.accelerate.reporting import build_report, write_state_report
+from continuum.launch import reporting
 
 
 class TestAccelerateReporting(unittest.TestCase):
@@ -69,6 +71,26 @@ class TestAccelerateReporting(unittest.TestCase):
             self.assertEqual(payload["mode"], "dry-run")
             self.assertIn("plugin_summary", payload)
 
+    def test_json_dump_matches_stdlib_fallback(self) -> None:
+        data = {"z": [1, {"b": None, "a": "né"}], "a": {"attempts": 2}}
+        fast = reporting._dump_json(data)
+        with patch("continuum.launch.reporting.orjson", None):
+            fallback = reporting._dump_json(data)
+
+        self.assertEqual(fast, fallback)
+        self.assertEqual(json.loads(fast), data)
+
+    def test_failed_write_keeps_previous_state(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_path = Path(tmpdir) / "launch_latest.json"
+            reporting.write_json(state_path, {"status": "running"})
+            with patch("continuum.launch.reporting.os.replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    reporting.write_json(state_path, {"status": "completed"})
+
+            self.assertEqual(json.loads(state_path.read_text(encoding="utf-8")), {"status": "running"})
+            self.assertEqual([path.name for path in Path(tmpdir).iterdir()], ["launch_latest.json"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -123,6 +123,43 @@ class TestBottleneckAnalysis(unittest.TestCase):
         analysis = classify_bottleneck(report)
         self.assertEqual(analysis["primary_bottleneck"], "disk_io")
 
+    def test_cpu_hardware_counters_flag_memory_stalls(self) -> None:
+        report = {
+            "schema_version": "1.0.0",
+            "static_profile": {"os": {"name": "Linux"}, "cpu": {"arch": "x86_64"}},
+            "benchmarks": {
+                "cpu_sustained": {
+                    "mean_iter_per_sec": 1.1,
+                    "std_iter_per_sec": 0.03,
+                    "p95_iter_per_sec": 1.05,
+                    "hw_counters": {"ipc": 0.6, "cache_mpki": 24.0},
+                },
+            },
+        }
+        analysis = classify_bottleneck(report)
+        self.assertEqual(analysis["primary_bottleneck"], "memory_bandwidth")
+        self.assertEqual(analysis["signals"]["cpu_ipc"], 0.6)
+
+    def test_memory_floor_counts_read_and_write_traffic(self) -> None:
+        def _analyze(mean_gbps: float) -> dict:
+            return classify_bottleneck(
+                {
+                    "schema_version": "1.0.0",
+                    "static_profile": {"os": {"name": "Linux"}, "cpu": {"arch": "x86_64"}},
+                    "benchmarks": {
+                        "cpu_sustained": {"mean_iter_per_sec": 1.1, "std_iter_per_sec": 0.03, "p95_iter_per_sec": 1.05},
+                        "memory_bandwidth": {"mean_gbps": mean_gbps, "std_gbps": 0.5, "p95_gbps": mean_gbps},
+                    },
+                }
+            )
+
+        # 45 GB/s of read + write traffic is only 22.5 GB/s of copied data: below the floor.
+        below = _analyze(45.0)
+        self.assertEqual(below["signals"]["mem_expected_floor_gbps"], 50.0)
+        self.assertEqual(below["primary_bottleneck"], "memory_bandwidth")
+        above = _analyze(55.0)
+        self.assertFalse(any("below heuristic floor" in reason for reason in above["reasons"]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import importlib
 import itertools
 import unittest
 from types import SimpleNamespace
@@ -8,53 +7,57 @@ from unittest.mock import patch
 
 from continuum.profiler.cpu_benchmark import run_cpu_benchmark
 
+_MODULE = "continuum.profiler.cpu_benchmark"
 
-class _FakeMatrix:
-    def astype(self, _dtype):  # noqa: ANN001
-        return self
 
+class _FakeMatrix:
     def __matmul__(self, _other):  # noqa: ANN001
         return self
 
 
 class _FakeNumpy:
     float32 = "float32"
+    float64 = "float64"
 
     def __init__(self) -> None:
-        self.random = SimpleNamespace(rand=lambda _r, _c: _FakeMatrix())
+        generator = SimpleNamespace(random=lambda _shape, dtype=None: _FakeMatrix())
+        self.random = SimpleNamespace(default_rng=lambda: generator)
+
+    def empty(self, _shape, dtype=None):  # noqa: ANN001
+        return _FakeMatrix()
+
+    def matmul(self, a, _b, out=None):  # noqa: ANN001
+        return out if out is not None else a
 
 
 class TestCpuBenchmark(unittest.TestCase):
     def test_cpu_benchmark_returns_expected_keys(self) -> None:
         fake_np = _FakeNumpy()
-        ticks = itertools.count(step=0.01)
-        real_import_module = importlib.import_module
-
-        def _import_module(name: str):  # noqa: ANN202
-            if name == "numpy":
-                return fake_np
-            return real_import_module(name)
-
-        with patch("continuum.profiler.cpu_benchmark.importlib.util.find_spec", return_value=object()):
-            with patch("continuum.profiler.cpu_benchmark.importlib.import_module", side_effect=_import_module):
-                with patch("continuum.profiler.cpu_benchmark.perf_counter", side_effect=lambda: next(ticks)):
-                    result = run_cpu_benchmark({"cpu_warmup": 0.0, "cpu_duration": 0.2, "notes": []})
+        ticks = itertools.count(step=10_000_000)
+        with patch.multiple(_MODULE, _np=fake_np, perf_counter_ns=lambda: next(ticks)):
+            result = run_cpu_benchmark({"cpu_warmup": 0.0, "cpu_duration": 0.2, "notes": []})
 
         self.assertIn("cpu_sustained", result)
         payload = result["cpu_sustained"]
         expected = {
+            "dtype",
+            "blas_backend",
+            "blas_threads",
+            "mean_gflops",
+            "p95_gflops",
             "mean_iter_per_sec",
             "std_iter_per_sec",
             "p50_iter_per_sec",
             "p95_iter_per_sec",
             "iterations",
             "duration_sec",
+            "hw_counters",
         }
         self.assertEqual(set(payload.keys()), expected)
 
     def test_numpy_missing_does_not_crash(self) -> None:
         ctx = {"notes": []}
-        with patch("continuum.profiler.cpu_benchmark.importlib.util.find_spec", return_value=None):
+        with patch("continuum.profiler.cpu_benchmark._np", None):
             result = run_cpu_benchmark(ctx)
 
         payload = result["cpu_sustained"]
@@ -73,20 +76,14 @@ class TestCpuBenchmark(unittest.TestCase):
 
     def test_deterministic_structure_validation(self) -> None:
         fake_np = _FakeNumpy()
-        ticks = itertools.count(step=0.02)
-        real_import_module = importlib.import_module
-
-        def _import_module(name: str):  # noqa: ANN202
-            if name == "numpy":
-                return fake_np
-            return real_import_module(name)
-
-        with patch("continuum.profiler.cpu_benchmark.importlib.util.find_spec", return_value=object()):
-            with patch("continuum.profiler.cpu_benchmark.importlib.import_module", side_effect=_import_module):
-                with patch("continuum.profiler.cpu_benchmark.perf_counter", side_effect=lambda: next(ticks)):
-                    result = run_cpu_benchmark({"cpu_warmup": 0.0, "cpu_duration": 0.1, "notes": []})
+        ticks = itertools.count(step=20_000_000)
+        with patch.multiple(_MODULE, _np=fake_np, perf_counter_ns=lambda: next(ticks)):
+            result = run_cpu_benchmark({"cpu_warmup": 0.0, "cpu_duration": 0.1, "notes": []})
 
         payload = result["cpu_sustained"]
+        self.assertEqual(payload["dtype"], "float64")
+        self.assertIn(type(payload["mean_gflops"]), {float, type(None)})
+        self.assertIn(type(payload["p95_gflops"]), {float, type(None)})
         self.assertIn(type(payload["mean_iter_per_sec"]), {float, type(None)})
         self.assertIn(type(payload["std_iter_per_sec"]), {float, type(None)})
         self.assertIn(type(payload["p50_iter_per_sec"]), {float, type(None)})
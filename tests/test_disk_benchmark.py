@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import itertools
+import os
+import random
+import tempfile
 import unittest
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
-from continuum.profiler.disk_benchmark import run_disk_benchmark
+from continuum.profiler.disk_benchmark import _block_reader, _fs_type, _offset_table, run_disk_benchmark
 
 
 class TestDiskBenchmark(unittest.TestCase):
     def test_returns_expected_keys_and_types(self) -> None:
-        ticks = itertools.count(step=0.01)
-        with patch("continuum.profiler.disk_benchmark.perf_counter", side_effect=lambda: next(ticks)):
+        ticks = itertools.count(step=10_000_000)
+        with patch("continuum.profiler.disk_benchmark.perf_counter_ns", side_effect=lambda: next(ticks)):
             result = run_disk_benchmark(
                 {
                     "notes": [],
@@ -63,6 +66,55 @@ class TestDiskBenchmark(unittest.TestCase):
         self.assertIsNone(payload["mean_iops"])
         self.assertTrue(any("failed" in note.lower() for note in ctx["notes"]))
 
+    def test_memory_backed_temp_dir_skips_benchmark(self) -> None:
+        ctx = {"notes": [], "disk_warmup": 0.0, "disk_duration": 0.05, "disk_size_mb": 1}
+        with patch("continuum.profiler.disk_benchmark._fs_type", return_value="tmpfs"):
+            with patch("continuum.profiler.disk_benchmark.tempfile.mkstemp") as mock_mkstemp:
+                result = run_disk_benchmark(ctx)
+
+        mock_mkstemp.assert_not_called()
+        payload = result["disk_random_io"]
+        self.assertIsNone(payload["mean_read_mb_s"])
+        self.assertIsNone(payload["iterations"])
+        self.assertTrue(any("tmpfs" in note for note in ctx["notes"]))
+
+    def test_fs_type_decodes_escaped_and_non_ascii_mount_points(self) -> None:
+        mountinfo = (
+            "28 1 254:0 / / rw,relatime - ext4 /dev/vda rw\n"
+            "40 28 8:17 / /media/Jos\u00e9 rw,relatime - vfat /dev/sdb1 rw\n"
+            "41 28 0:45 / /mnt/scratch\\040space rw,relatime - tmpfs tmpfs rw\n"
+        )
+        with patch("continuum.profiler.disk_benchmark.sys.platform", "linux"):
+            with patch("builtins.open", mock_open(read_data=mountinfo)):
+                self.assertEqual(_fs_type("/media/Jos\u00e9/tmp"), "vfat")
+                self.assertEqual(_fs_type("/mnt/scratch space/tmp"), "tmpfs")
+                self.assertEqual(_fs_type("/home"), "ext4")
+
+    def test_offset_table_is_block_aligned_and_in_range(self) -> None:
+        block_size = 4096
+        max_offset = 1024 * 1024 - block_size
+        offsets = _offset_table(max_offset, block_size, random.Random(7))
+        self.assertTrue(offsets)
+        self.assertEqual(offsets, _offset_table(max_offset, block_size, random.Random(7)))
+        self.assertTrue(all(offset % block_size == 0 for offset in offsets))
+        self.assertTrue(all(0 <= offset <= max_offset for offset in offsets))
+
+        with patch("continuum.profiler.disk_benchmark._np", None):
+            fallback = _offset_table(max_offset, block_size, random.Random(7))
+        self.assertTrue(all(offset % block_size == 0 and 0 <= offset <= max_offset for offset in fallback))
+
+    def test_block_reader_reads_positioned_blocks(self) -> None:
+        block_size = 4096
+        with tempfile.TemporaryFile() as f:
+            f.write(bytes(range(256)) * 32)
+            f.flush()
+            fd = f.fileno()
+            self.assertEqual(_block_reader(fd, block_size)(block_size), block_size)
+            with patch("continuum.profiler.disk_benchmark.os.preadv", None, create=True):
+                read_block = _block_reader(fd, block_size)
+                self.assertEqual(read_block(block_size), block_size)
+                self.assertEqual(os.lseek(fd, 0, os.SEEK_CUR), 2 * block_size)
+
 
 if __name__ == "__main__":
     unittest.main()
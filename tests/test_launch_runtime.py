@@ -4,8 +4,10 @@ import json
 import os
 import tempfile
 import unittest
+from contextlib import contextmanager
 from importlib.util import find_spec
 from pathlib import Path
+from typing import Iterator
 
 if find_spec("typer") is not None:
     from typer.testing import CliRunner
@@ -16,17 +18,29 @@ else:
     app = None
 
 
+@contextmanager
+def _isolated_cwd() -> Iterator[str]:
+    # typer's bundled CliRunner has no isolated_filesystem(), so provide the equivalent.
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = Path.cwd()
+        os.chdir(tmp)
+        try:
+            yield tmp
+        finally:
+            os.chdir(previous)
+
+
 @unittest.skipIf(find_spec("typer") is None, "typer is not installed in this interpreter")
 class TestLaunchRuntime(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.runner = CliRunner()
+
     def test_launch_script_auto_resume(self) -> None:
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmp:
-            previous = Path.cwd()
-            try:
-                os.chdir(tmp)
-                script = Path("train.py")
-                script.write_text(
-                    """
+        with _isolated_cwd() as tmp:
+            script = Path("train.py")
+            script.write_text(
+                """
 from pathlib import Path
 import sys
 
@@ -39,67 +53,53 @@ ckpt.write_text('checkpoint')
 print('first attempt failed')
 sys.exit(1)
 """.strip()
-                    + "\n",
-                    encoding="utf-8",
-                )
-
-                result = runner.invoke(app, ["launch", "train.py", "--max-restarts", "1"], catch_exceptions=False)
-                self.assertEqual(result.exit_code, 0)
-
-                state_path = Path(tmp) / ".hydra" / "state" / "launch_latest.json"
-                self.assertTrue(state_path.exists())
-                payload = json.loads(state_path.read_text(encoding="utf-8"))
-                self.assertEqual(payload["status"], "completed")
-                self.assertEqual(payload["restarts_used"], 1)
-                self.assertEqual(len(payload["attempts"]), 2)
-            finally:
-                os.chdir(previous)
+                + "\n",
+                encoding="utf-8",
+            )
+
+            result = self.runner.invoke(app, ["launch", "train.py", "--max-restarts", "1"], catch_exceptions=False)
+            self.assertEqual(result.exit_code, 0)
+
+            state_path = Path(tmp) / ".hydra" / "state" / "launch_latest.json"
+            self.assertTrue(state_path.exists())
+            payload = json.loads(state_path.read_text(encoding="utf-8"))
+            self.assertEqual(payload["status"], "completed")
+            self.assertEqual(payload["restarts_used"], 1)
+            self.assertEqual(len(payload["attempts"]), 2)
 
     def test_launch_script_dry_run(self) -> None:
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmp:
-            previous = Path.cwd()
-            try:
-                os.chdir(tmp)
-                script = Path("train.py")
-                script.write_text("print('hello')\n", encoding="utf-8")
-
-                result = runner.invoke(app, ["launch", "train.py", "--dry-run", "--json"], catch_exceptions=False)
-                self.assertEqual(result.exit_code, 0)
-                payload = json.loads(result.stdout)
-                self.assertEqual(payload["mode"], "dry-run")
-                self.assertEqual(payload["attempts"], [])
-            finally:
-                os.chdir(previous)
+        with _isolated_cwd():
+            script = Path("train.py")
+            script.write_text("print('hello')\n", encoding="utf-8")
+
+            result = self.runner.invoke(app, ["launch", "train.py", "--dry-run", "--json"], catch_exceptions=False)
+            self.assertEqual(result.exit_code, 0)
+            payload = json.loads(result.stdout)
+            self.assertEqual(payload["mode"], "dry-run")
+            self.assertEqual(payload["attempts"], [])
 
     def test_launch_preserves_exact_output_dir_arg(self) -> None:
-        runner = CliRunner()
-        with tempfile.TemporaryDirectory() as tmp:
-            previous = Path.cwd()
-            try:
-                os.chdir(tmp)
-                script = Path("train.py")
-                script.write_text("print('ok')\n", encoding="utf-8")
-
-                result = runner.invoke(
-                    app,
-                    [
-                        "launch",
-                        "train.py",
-                        "--dry-run",
-                        "--json",
-                        "--",
-                        "--output-dir",
-                        "./outputs/mmfine_100m",
-                    ],
-                    catch_exceptions=False,
-                )
-                self.assertEqual(result.exit_code, 0)
-                payload = json.loads(result.stdout)
-                self.assertEqual(payload["script_args"], ["--output-dir", "./outputs/mmfine_100m"])
-                self.assertIn("./outputs/mmfine_100m", payload["command_argv"])
-            finally:
-                os.chdir(previous)
+        with _isolated_cwd():
+            script = Path("train.py")
+            script.write_text("print('ok')\n", encoding="utf-8")
+
+            result = self.runner.invoke(
+                app,
+                [
+                    "launch",
+                    "train.py",
+                    "--dry-run",
+                    "--json",
+                    "--",
+                    "--output-dir",
+                    "./outputs/mmfine_100m",
+                ],
+                catch_exceptions=False,
+            )
+            self.assertEqual(result.exit_code, 0)
+            payload = json.loads(result.stdout)
+            self.assertEqual(payload["script_args"], ["--output-dir", "./outputs/mmfine_100m"])
+            self.assertIn("./outputs/mmfine_100m", payload["command_argv"])
 
 
 if __name__ == "__main__":
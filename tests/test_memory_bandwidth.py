@@ -4,14 +4,14 @@ import itertools
 import unittest
 from unittest.mock import patch
 
-from continuum.profiler.memory_bandwidth import run_memory_bandwidth
+from continuum.profiler.memory_bandwidth import _buffer_copier, _parse_cache_size, _resolve_target_bytes, run_memory_bandwidth
 
 
 class TestMemoryBandwidth(unittest.TestCase):
     def test_returns_expected_keys(self) -> None:
-        ticks = itertools.count(step=0.01)
-        with patch("continuum.profiler.memory_bandwidth.importlib.util.find_spec", return_value=None):
-            with patch("continuum.profiler.memory_bandwidth.perf_counter", side_effect=lambda: next(ticks)):
+        ticks = itertools.count(step=10_000_000)
+        with patch("continuum.profiler.memory_bandwidth._np", None):
+            with patch("continuum.profiler.memory_bandwidth.perf_counter_ns", side_effect=lambda: next(ticks)):
                 result = run_memory_bandwidth(
                     {
                         "mem_mb": 1,
@@ -35,16 +35,24 @@ class TestMemoryBandwidth(unittest.TestCase):
         self.assertEqual(set(payload.keys()), expected)
 
     def test_numpy_missing_uses_fallback(self) -> None:
-        ticks = itertools.count(step=0.02)
+        ticks = itertools.count(step=20_000_000)
         ctx = {"mem_mb": 1, "mem_warmup": 0.0, "mem_duration": 0.1, "notes": []}
-        with patch("continuum.profiler.memory_bandwidth.importlib.util.find_spec", return_value=None):
-            with patch("continuum.profiler.memory_bandwidth.perf_counter", side_effect=lambda: next(ticks)):
+        with patch("continuum.profiler.memory_bandwidth._np", None):
+            with patch("continuum.profiler.memory_bandwidth.perf_counter_ns", side_effect=lambda: next(ticks)):
                 result = run_memory_bandwidth(ctx)
 
         payload = result["memory_bandwidth"]
         self.assertIn(type(payload["mean_gbps"]), {float, type(None)})
         self.assertTrue(any("stdlib bytearray copy fallback" in note.lower() for note in ctx["notes"]))
 
+    def test_bytes_per_iter_counts_read_and_write_traffic(self) -> None:
+        ticks = itertools.count(step=10_000_000)
+        with patch("continuum.profiler.memory_bandwidth._np", None):
+            with patch("continuum.profiler.memory_bandwidth.perf_counter_ns", side_effect=lambda: next(ticks)):
+                result = run_memory_bandwidth({"mem_mb": 1, "mem_warmup": 0.0, "mem_duration": 0.1, "notes": []})
+
+        self.assertEqual(result["memory_bandwidth"]["bytes_per_iter"], 2 * 1024 * 1024)
+
     def test_static_only_skips_benchmark(self) -> None:
         ctx = {"static_only": True, "notes": []}
         result = run_memory_bandwidth(ctx)
@@ -55,9 +63,9 @@ class TestMemoryBandwidth(unittest.TestCase):
         self.assertTrue(any("static-only" in note.lower() for note in ctx["notes"]))
 
     def test_deterministic_structure_validation(self) -> None:
-        ticks = itertools.count(step=0.01)
-        with patch("continuum.profiler.memory_bandwidth.importlib.util.find_spec", return_value=None):
-            with patch("continuum.profiler.memory_bandwidth.perf_counter", side_effect=lambda: next(ticks)):
+        ticks = itertools.count(step=10_000_000)
+        with patch("continuum.profiler.memory_bandwidth._np", None):
+            with patch("continuum.profiler.memory_bandwidth.perf_counter_ns", side_effect=lambda: next(ticks)):
                 result = run_memory_bandwidth(
                     {
                         "mem_mb": 1,
@@ -76,6 +84,24 @@ class TestMemoryBandwidth(unittest.TestCase):
         self.assertIn(type(payload["duration_sec"]), {float, type(None)})
         self.assertIn(type(payload["bytes_per_iter"]), {int, type(None)})
 
+    def test_buffer_copier_copies_source_into_destination(self) -> None:
+        src = bytearray(b"continuum" * 64)
+        dst = bytearray(len(src))
+        _buffer_copier(src, dst)()
+        self.assertEqual(dst, src)
+
+    def test_default_buffer_grows_past_last_level_cache(self) -> None:
+        mb = 1024 * 1024
+        context = {"facts": {"static_profile": {"memory": {"total_bytes": 64 * 1024 * mb}}}}
+        with patch("continuum.profiler.memory_bandwidth._l3_cache_bytes", return_value=256 * mb):
+            self.assertEqual(_resolve_target_bytes(context, mem_mb=None, numpy_available=True), 1024 * mb)
+            self.assertEqual(_resolve_target_bytes(context, mem_mb=32, numpy_available=True), 32 * mb)
+        with patch("continuum.profiler.memory_bandwidth._l3_cache_bytes", return_value=8 * mb):
+            self.assertEqual(_resolve_target_bytes(context, mem_mb=None, numpy_available=True), 256 * mb)
+
+        self.assertEqual(_parse_cache_size("32768K"), 32 * mb)
+        self.assertIsNone(_parse_cache_size(""))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import os
+import sys
+import unittest
+from unittest.mock import patch
+
+from continuum.profiler import perf_counters
+
+
+class TestPerfCounters(unittest.TestCase):
+    def test_derive_reports_ipc_and_misses_per_kilo_instruction(self) -> None:
+        derived = perf_counters._derive({"cycles": 2_000, "instructions": 4_000, "cache_misses": 40, "branch_misses": 8})
+        self.assertEqual(derived["ipc"], 2.0)
+        self.assertEqual(derived["cache_mpki"], 10.0)
+        self.assertEqual(derived["branch_mpki"], 2.0)
+
+        self.assertIsNone(perf_counters._derive({"cycles": 0, "instructions": 0})["ipc"])
+
+    def test_unavailable_counters_yield_empty_sample(self) -> None:
+        notes: list[str] = []
+        with patch("continuum.profiler.perf_counters._open_counters", return_value={}):
+            with perf_counters.hardware_counters(notes) as sample:
+                pass
+        self.assertEqual(sample, {})
+
+    def test_counts_are_summed_across_threads(self) -> None:
+        per_thread = {"cycles": (1_000, 3_000), "instructions": (2_000, 6_000), "cache_misses": (4, 36), "branch_misses": (1, 7)}
+        fds: dict[str, list[int]] = {}
+        for name, counts in per_thread.items():
+            for count in counts:
+                read_fd, write_fd = os.pipe()
+                os.write(write_fd, count.to_bytes(8, sys.byteorder))
+                os.close(write_fd)
+                fds.setdefault(name, []).append(read_fd)
+
+        notes: list[str] = []
+        with patch("continuum.profiler.perf_counters._open_counters", return_value=fds), patch("fcntl.ioctl"):
+            with perf_counters.hardware_counters(notes) as sample:
+                pass
+
+        self.assertEqual(notes, [])
+        self.assertEqual(sample["threads"], 2)
+        self.assertEqual(sample["cycles"], 4_000)
+        self.assertEqual(sample["instructions"], 8_000)
+        self.assertEqual(sample["ipc"], 2.0)
+        self.assertEqual(sample["cache_mpki"], 5.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
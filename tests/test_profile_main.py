@@ -1,74 +1,116 @@
 from __future__ import annotations
 
+import inspect
 import unittest
+from contextlib import ExitStack
+from importlib.util import find_spec
 from unittest.mock import patch
 
-from continuum.profiler import main as profile_main
+if find_spec("typer") is not None:
+    import typer
+    from typer.models import ParameterInfo
 
+    from continuum.profiler import main as profile_main
+else:
+    typer = None
+    ParameterInfo = None
+    profile_main = None
 
+_SCHEMA = "1.0.0"
+
+
+def _fake_build_report(static_profile, benchmark_results=None, benchmarks=None):  # noqa: ANN001, ANN202
+    return {
+        "schema_version": _SCHEMA,
+        "static_profile": static_profile,
+        "benchmarks": benchmarks or {},
+        "benchmark_results": benchmark_results or [],
+    }
+
+
+def _cli_defaults(command):  # noqa: ANN001, ANN202
+    # Called directly, a typer command would receive its OptionInfo markers as argument
+    # values, so every option is passed explicitly with its CLI default.
+    return {
+        name: param.default.default
+        for name, param in inspect.signature(command).parameters.items()
+        if isinstance(param.default, ParameterInfo)
+    }
+
+
+def _run_profile(**options):  # noqa: ANN003, ANN202
+    return profile_main.profile_command(**{**_cli_defaults(profile_main.profile_command), **options})
+
+
+class _StubBench:
+    __slots__ = ("calls", "rv")
+
+    def __init__(self, rv: dict) -> None:
+        self.calls = 0
+        self.rv = rv
+
+    def __call__(self, *args, **kwargs) -> dict:  # noqa: ANN002, ANN003
+        self.calls += 1
+        return self.rv
+
+
+@unittest.skipIf(find_spec("typer") is None, "typer is not installed in this interpreter")
 class TestProfileMain(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub_static = _StubBench({"cpu": {"model": "X"}})
+        cls.stub_cpu = _StubBench({"cpu_sustained": {"iterations": 1}})
+        cls.stub_mem = _StubBench({"memory_bandwidth": {"iterations": 1}})
+        cls.stub_gpu = _StubBench({"gpu_sustained": {"iterations": 1}})
+        cls.stub_disk = _StubBench({"disk_random_io": {"iterations": 1}})
+        cls.registry = {
+            "static": cls.stub_static,
+            "cpu": cls.stub_cpu,
+            "memory": cls.stub_mem,
+            "gpu": cls.stub_gpu,
+            "disk": cls.stub_disk,
+        }
+
+    def setUp(self) -> None:
+        for stub in self.registry.values():
+            stub.calls = 0
+
+    def _patched(self) -> ExitStack:
+        stack = ExitStack()
+        stack.enter_context(patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", self.registry))
+        self.mock_render = stack.enter_context(patch("continuum.profiler.main.render_profile_human"))
+        stack.enter_context(patch("continuum.profiler.main.typer.echo"))
+        return stack
+
     def _assert_exit_code(self, exc: BaseException, expected: int) -> None:
-        code = getattr(exc, "code", None)
-        if code is None:
-            code = getattr(exc, "exit_code", None)
-        if code is None and isinstance(exc, SystemExit):
-            code = exc.code
-        self.assertEqual(code, expected)
+        self.assertIsInstance(exc, typer.Exit)
+        self.assertEqual(exc.exit_code, expected)
 
     def test_benchmarks_cpu_only_and_exclude_static(self) -> None:
-        mock_static = unittest.mock.Mock(return_value={"cpu": {"model": "X"}})
-        mock_cpu = unittest.mock.Mock(return_value={"cpu_sustained": {"mean_iter_per_sec": 1.0}})
-        registry = {"static": mock_static, "cpu": mock_cpu}
-        with patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", registry):
-            with patch("continuum.profiler.main.render_profile_human"):
-                with patch("continuum.profiler.main.typer.echo"):
-                    with patch(
-                        "continuum.profiler.main.build_profile_report",
-                        side_effect=lambda static_profile, benchmark_results=None, benchmarks=None: {
-                            "schema_version": "1.0.0",
-                            "static_profile": static_profile,
-                            "benchmarks": benchmarks or {},
-                            "benchmark_results": benchmark_results or [],
-                        },
-                    ) as mock_build:
-                        with self.assertRaises(BaseException) as cm:
-                            profile_main.profile_command(
-                                benchmarks="cpu",
-                                no_static=True,
-                                output_format="json",
-                                no_write=True,
-                            )
+        with self._patched() as stack:
+            mock_build = stack.enter_context(patch("continuum.profiler.main.build_profile_report", side_effect=_fake_build_report))
+            with self.assertRaises(BaseException) as cm:
+                _run_profile(
+                    benchmarks="cpu",
+                    no_static=True,
+                    output_format="json",
+                    no_write=True,
+                )
         self._assert_exit_code(cm.exception, 0)
-        mock_static.assert_not_called()
+        self.assertEqual(self.stub_static.calls, 0)
         args, kwargs = mock_build.call_args
         self.assertEqual(args[0], {})
         self.assertIn("cpu_sustained", kwargs["benchmarks"])
 
     def test_no_static_produces_empty_static_profile(self) -> None:
-        mock_static = unittest.mock.Mock(return_value={"cpu": {"model": "X"}})
-        mock_cpu = unittest.mock.Mock(return_value={"cpu_sustained": {"iterations": 1}})
-        mock_mem = unittest.mock.Mock(return_value={"memory_bandwidth": {"iterations": 1}})
-        mock_gpu = unittest.mock.Mock(return_value={"gpu_sustained": {"iterations": 1}})
-        mock_disk = unittest.mock.Mock(return_value={"disk_random_io": {"iterations": 1}})
-        registry = {"static": mock_static, "cpu": mock_cpu, "memory": mock_mem, "gpu": mock_gpu, "disk": mock_disk}
-        with patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", registry):
-            with patch("continuum.profiler.main.render_profile_human"):
-                with patch("continuum.profiler.main.typer.echo"):
-                    with patch(
-                        "continuum.profiler.main.build_profile_report",
-                        side_effect=lambda static_profile, benchmark_results=None, benchmarks=None: {
-                            "schema_version": "1.0.0",
-                            "static_profile": static_profile,
-                            "benchmarks": benchmarks or {},
-                            "benchmark_results": benchmark_results or [],
-                        },
-                    ) as mock_build:
-                        with self.assertRaises(BaseException) as cm:
-                            profile_main.profile_command(
-                                no_static=True,
-                                output_format="json",
-                                no_write=True,
-                            )
+        with self._patched() as stack:
+            mock_build = stack.enter_context(patch("continuum.profiler.main.build_profile_report", side_effect=_fake_build_report))
+            with self.assertRaises(BaseException) as cm:
+                _run_profile(
+                    no_static=True,
+                    output_format="json",
+                    no_write=True,
+                )
         self._assert_exit_code(cm.exception, 0)
         args, _kwargs = mock_build.call_args
         self.assertEqual(args[0], {})
@@ -76,51 +118,68 @@ class TestProfileMain(unittest.TestCase):
     def test_unknown_benchmark_exits_with_code_2(self) -> None:
         with patch("continuum.profiler.main.typer.echo"):
             with self.assertRaises(BaseException) as cm:
-                profile_main.profile_command(
+                _run_profile(
                     benchmarks="static,unknown",
                     no_write=True,
                 )
         self._assert_exit_code(cm.exception, 2)
 
     def test_output_format_json_suppresses_human_output(self) -> None:
-        mock_static = unittest.mock.Mock(return_value={"cpu": {"model": "X"}})
-        mock_cpu = unittest.mock.Mock(return_value={"cpu_sustained": {"iterations": 1}})
-        mock_mem = unittest.mock.Mock(return_value={"memory_bandwidth": {"iterations": 1}})
-        mock_gpu = unittest.mock.Mock(return_value={"gpu_sustained": {"iterations": 1}})
-        mock_disk = unittest.mock.Mock(return_value={"disk_random_io": {"iterations": 1}})
-        registry = {"static": mock_static, "cpu": mock_cpu, "memory": mock_mem, "gpu": mock_gpu, "disk": mock_disk}
-        with patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", registry):
-            with patch("continuum.profiler.main.render_profile_human") as mock_render:
-                with patch("continuum.profiler.main.typer.echo"):
-                    with self.assertRaises(BaseException) as cm:
-                        profile_main.profile_command(
-                            output_format="json",
-                            no_write=True,
-                        )
+        with self._patched():
+            with self.assertRaises(BaseException) as cm:
+                _run_profile(
+                    output_format="json",
+                    no_write=True,
+                )
         self._assert_exit_code(cm.exception, 0)
-        mock_render.assert_not_called()
+        self.mock_render.assert_not_called()
 
     def test_default_behavior_runs_all(self) -> None:
-        mock_static = unittest.mock.Mock(return_value={"cpu": {"model": "X"}})
-        mock_cpu = unittest.mock.Mock(return_value={"cpu_sustained": {"iterations": 1}})
-        mock_mem = unittest.mock.Mock(return_value={"memory_bandwidth": {"iterations": 1}})
-        mock_gpu = unittest.mock.Mock(return_value={"gpu_sustained": {"iterations": 1}})
-        mock_disk = unittest.mock.Mock(return_value={"disk_random_io": {"iterations": 1}})
-        registry = {"static": mock_static, "cpu": mock_cpu, "memory": mock_mem, "gpu": mock_gpu, "disk": mock_disk}
-        with patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", registry):
-            with patch("continuum.profiler.main.render_profile_human") as mock_render:
-                with patch("continuum.profiler.main.typer.echo"):
-                    with self.assertRaises(BaseException) as cm:
-                        profile_main.profile_command(
-                            no_write=True,
-                        )
+        with self._patched():
+            with self.assertRaises(BaseException) as cm:
+                _run_profile(
+                    no_write=True,
+                )
         self._assert_exit_code(cm.exception, 0)
-        mock_static.assert_called_once()
-        mock_cpu.assert_called_once()
-        mock_mem.assert_called_once()
-        mock_gpu.assert_called_once()
-        mock_disk.assert_called_once()
-        mock_render.assert_called_once()
+        self.assertEqual(self.stub_static.calls, 1)
+        self.assertEqual(self.stub_cpu.calls, 1)
+        self.assertEqual(self.stub_mem.calls, 1)
+        self.assertEqual(self.stub_gpu.calls, 1)
+        self.assertEqual(self.stub_disk.calls, 1)
+        self.mock_render.assert_called_once()
+
+    def test_parallel_benchmarks_collect_every_result(self) -> None:
+        with patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", self.registry):
+            static_profile, benchmarks = profile_main._run_selected(
+                {"static", "cpu", "memory", "disk"},
+                {"facts": {}, "notes": []},
+                parallel=True,
+            )
+
+        self.assertEqual(static_profile, {"cpu": {"model": "X"}})
+        self.assertEqual(list(benchmarks), ["cpu_sustained", "memory_bandwidth", "disk_random_io"])
+
+    def test_sequential_run_finishes_static_before_benchmarks(self) -> None:
+        order: list[str] = []
+
+        def _recorder(name: str, payload: dict) -> object:
+            def _bench(context: dict) -> dict:
+                order.append(name)
+                return payload
+
+            return _bench
+
+        registry = {
+            "static": _recorder("static", {"cpu": {"model": "X"}}),
+            "cpu": _recorder("cpu", {"cpu_sustained": {"iterations": 1}}),
+            "disk": _recorder("disk", {"disk_random_io": {"iterations": 1}}),
+        }
+        with patch("continuum.profiler.main.AVAILABLE_BENCHMARKS", registry):
+            static_profile, benchmarks = profile_main._run_selected({"static", "cpu", "disk"}, {"facts": {}, "notes": []})
+
+        self.assertEqual(order, ["static", "cpu", "disk"])
+        self.assertEqual(static_profile, {"cpu": {"model": "X"}})
+        self.assertEqual(list(benchmarks), ["cpu_sustained", "disk_random_io"])
 
 
 if __name__ == "__main__":
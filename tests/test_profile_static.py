@@ -1,44 +1,60 @@
 from __future__ import annotations
 
 import importlib.machinery
-import io
+import json
+import shutil
+import tempfile
 import unittest
-from contextlib import redirect_stdout
+from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from continuum.profiler.formatters import build_profile_report, render_profile_human
+from continuum.profiler.formatters import build_profile_report, render_profile_human, write_profile_json
+from continuum.profiler import static_profile
 from continuum.profiler.static_profile import collect_static_profile
 
+_FAKE_PSUTIL = SimpleNamespace(
+    cpu_count=lambda logical=False: 8 if not logical else 16,
+    virtual_memory=lambda: SimpleNamespace(total=64 * 1024**3),
+    disk_partitions=lambda all=True: [SimpleNamespace(mountpoint="/", device="/dev/sda1", fstype="ext4")],
+)
+_FAKE_PROC_TEXT = "model name\t: Test CPU\n/dev/root / ext4 rw 0 0\nNAME=test\nVERSION=1\n"
+
+
+def _reset_probe_caches() -> None:
+    for probe in (static_profile._cpu_facts, static_profile._memory_facts, static_profile._os_facts, static_profile._read_proc):
+        probe.cache_clear()
+    static_profile._TORCH_CUDA_CACHE = static_profile._UNSET
+
 
 class TestStaticProfile(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        # One profile collected under the canonical Linux doubles serves every test that
+        # only inspects its structure.
+        _reset_probe_caches()
+        with (
+            patch.multiple(
+                "continuum.profiler.static_profile.platform",
+                system=Mock(return_value="Linux"),
+                machine=Mock(return_value="x86_64"),
+                release=Mock(return_value="6.8.0"),
+                version=Mock(return_value="#1 SMP"),
+                python_version=Mock(return_value="3.12.3"),
+                platform=Mock(return_value="Linux-6.8.0"),
+            ),
+            patch("continuum.profiler.static_profile.os.cpu_count", return_value=16),
+            patch("continuum.profiler.static_profile._get_psutil", return_value=_FAKE_PSUTIL),
+            patch("continuum.profiler.static_profile.Path.read_text", return_value=_FAKE_PROC_TEXT),
+            patch("continuum.profiler.static_profile.importlib.util.find_spec", return_value=None),
+        ):
+            cls._sample_profile = collect_static_profile({"facts": {}})
+
+    def setUp(self) -> None:
+        _reset_probe_caches()
+
     def test_report_contains_static_profile_shape(self) -> None:
-        with patch("continuum.profiler.static_profile.platform.system", return_value="Linux"):
-            with patch("continuum.profiler.static_profile.platform.machine", return_value="x86_64"):
-                with patch("continuum.profiler.static_profile.platform.release", return_value="6.8.0"):
-                    with patch("continuum.profiler.static_profile.platform.version", return_value="#1 SMP"):
-                        with patch("continuum.profiler.static_profile.platform.python_version", return_value="3.12.3"):
-                            with patch("continuum.profiler.static_profile.platform.platform", return_value="Linux-6.8.0"):
-                                with patch("continuum.profiler.static_profile.os.cpu_count", return_value=16):
-                                    fake_psutil = SimpleNamespace(
-                                        cpu_count=lambda logical=False: 8 if not logical else 16,
-                                        virtual_memory=lambda: SimpleNamespace(total=64 * 1024**3),
-                                        disk_partitions=lambda all=True: [
-                                            SimpleNamespace(mountpoint="/", device="/dev/sda1", fstype="ext4")
-                                        ],
-                                    )
-                                    with patch("continuum.profiler.static_profile._get_psutil", return_value=fake_psutil):
-                                        with patch(
-                                            "continuum.profiler.static_profile.Path.read_text",
-                                            return_value="model name\t: Test CPU\n/dev/root / ext4 rw 0 0\nNAME=test\nVERSION=1\n",
-                                        ):
-                                            with patch(
-                                                "continuum.profiler.static_profile.importlib.util.find_spec",
-                                                return_value=None,
-                                            ):
-                                                profile = collect_static_profile({"facts": {}})
-
-        report = build_profile_report(profile)
+        report = build_profile_report(self._sample_profile)
         self.assertEqual(report["schema_version"], "1.0.0")
         self.assertIn("static_profile", report)
         self.assertIn("benchmark_results", report)
@@ -63,6 +79,24 @@ class TestStaticProfile(unittest.TestCase):
         self.assertIn("filesystem_type", static["storage"])
         self.assertIn("notes", static["storage"])
 
+    def test_hardware_probes_run_once_per_process(self) -> None:
+        calls = []
+
+        def _fake_psutil():  # noqa: ANN202
+            calls.append(1)
+            return None
+
+        with patch("continuum.profiler.static_profile._get_psutil", side_effect=_fake_psutil):
+            first = collect_static_profile({"facts": {}})
+            second = collect_static_profile({"facts": {}})
+
+        self.assertEqual(first["memory"], second["memory"])
+        self.assertEqual(first["cpu"], second["cpu"])
+        self.assertIsNot(first["cpu"], second["cpu"])
+        self.assertTrue(any("psutil" in note.lower() for note in second["notes"]))
+        # Only the uncached storage probe may consult psutil again.
+        self.assertLessEqual(len(calls), 4)
+
     def test_torch_import_failure_is_non_fatal(self) -> None:
         fake_spec = importlib.machinery.ModuleSpec("torch", loader=None)
         with patch("continuum.profiler.static_profile.importlib.util.find_spec", return_value=fake_spec):
@@ -78,6 +112,25 @@ class TestStaticProfile(unittest.TestCase):
         self.assertIsNone(runtime["torch_cuda_version"])
         self.assertTrue(any("could not be imported" in note.lower() for note in profile["notes"]))
 
+    def test_cuda_availability_is_probed_only_on_request(self) -> None:
+        is_available = Mock(return_value=True)
+        fake_torch = SimpleNamespace(
+            __version__="2.4.0",
+            version=SimpleNamespace(cuda="12.4"),
+            cuda=SimpleNamespace(is_available=is_available),
+        )
+        fake_spec = importlib.machinery.ModuleSpec("torch", loader=None)
+        with patch("continuum.profiler.static_profile.importlib.util.find_spec", return_value=fake_spec):
+            with patch("continuum.profiler.static_profile.importlib.import_module", return_value=fake_torch):
+                skipped = collect_static_profile({"facts": {}})
+                probed = collect_static_profile({"facts": {}, "probe_cuda": True})
+                collect_static_profile({"facts": {}, "probe_cuda": True})
+
+        self.assertIsNone(skipped["runtime"]["torch_cuda_available"])
+        self.assertEqual(skipped["runtime"]["torch_cuda_version"], "12.4")
+        self.assertTrue(probed["runtime"]["torch_cuda_available"])
+        is_available.assert_called_once_with()
+
     def test_storage_probe_graceful_when_proc_and_sysfs_missing(self) -> None:
         def _read_text_side_effect(self, *args, **kwargs):  # noqa: ANN001
             raise OSError("missing")
@@ -148,18 +201,52 @@ class TestStaticProfile(unittest.TestCase):
                 }
             ],
         )
-        stream = io.StringIO()
+        written: list[str] = []
         with patch("continuum.profiler.formatters.Console", None):
             with patch("continuum.profiler.formatters.Table", None):
-                with redirect_stdout(stream):
+                with patch("continuum.profiler.formatters.sys.stdout", SimpleNamespace(write=written.append)):
                     render_profile_human(report)
 
-        output = stream.getvalue()
+        self.assertEqual(len(written), 1)
+        output = written[0]
         self.assertIn("Continuum Profile Report", output)
         self.assertIn("[PASS] cpu.model", output)
         self.assertIn("benchmark.cpu_loop_ops", output)
         self.assertNotIn('"static_profile"', output)
 
+    def test_write_profile_json_round_trips_with_and_without_orjson(self) -> None:
+        report = build_profile_report({"cpu": {"model": "CPU \u00b5"}, "notes": []}, benchmarks={"disk_random_io": {"mean_iops": 1.5}})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fast_path = write_profile_json(report, Path(tmpdir) / "fast")
+            with patch("continuum.profiler.formatters.orjson", None):
+                stdlib_path = write_profile_json(report, Path(tmpdir) / "stdlib")
+
+            for path in (fast_path, stdlib_path):
+                raw = path.read_text(encoding="utf-8")
+                self.assertTrue(raw.endswith("\n"))
+                self.assertEqual(raw.count("\n"), 1)
+                self.assertEqual(json.loads(raw), report)
+                self.assertEqual(list(path.parent.glob("*.tmp")), [])
+
+    def test_write_profile_json_recreates_removed_directory(self) -> None:
+        report = build_profile_report({"notes": []})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            output_dir = Path(tmpdir) / "reports"
+            write_profile_json(report, output_dir)
+            shutil.rmtree(output_dir)
+            path = write_profile_json(report, output_dir)
+            self.assertTrue(path.exists())
+
+    def test_default_console_is_built_once(self) -> None:
+        report = build_profile_report({"cpu": {"model": "CPU"}, "notes": []})
+        with patch("continuum.profiler.formatters._DEFAULT_CONSOLE", None):
+            with patch("continuum.profiler.formatters.Console") as console_cls:
+                render_profile_human(report)
+                render_profile_human(report)
+
+        console_cls.assert_called_once_with()
+        self.assertEqual(console_cls.return_value.print.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -23,25 +23,29 @@ class TestRemediation(unittest.TestCase):
         remediation = generate_remediation(report)
         self.assertEqual(remediation["actions"], [])
 
-    def test_priority_levels(self) -> None:
-        low = generate_remediation({"analysis": {"primary_bottleneck": "cpu_compute", "confidence": 0.2}})
-        medium = generate_remediation({"analysis": {"primary_bottleneck": "cpu_compute", "confidence": 0.4}})
-        high = generate_remediation({"analysis": {"primary_bottleneck": "cpu_compute", "confidence": 0.7}})
-        self.assertEqual(low["priority"], "low")
-        self.assertEqual(medium["priority"], "medium")
-        self.assertEqual(high["priority"], "high")
-
-    def test_structure_is_deterministic(self) -> None:
-        remediation = generate_remediation({"analysis": {"primary_bottleneck": "cpu_compute", "confidence": 0.5}})
-        self.assertIn("priority", remediation)
-        self.assertIn("actions", remediation)
+    def test_returned_actions_are_independent_copies(self) -> None:
+        report = {"analysis": {"primary_bottleneck": "disk_io", "confidence": 0.9}}
+        first = generate_remediation(report)
+        first["actions"][0]["title"] = "mutated"
+        first["actions"][0]["extra"] = "annotation"
+
+        second = generate_remediation(report)
+        self.assertEqual(second["actions"][0]["title"], "Use NVMe-class storage")
+        self.assertNotIn("extra", second["actions"][0])
+
+    def _assert_shape(self, remediation: dict) -> None:
         self.assertIn(remediation["priority"], {"low", "medium", "high"})
         self.assertIsInstance(remediation["actions"], list)
         for action in remediation["actions"]:
-            self.assertIn("title", action)
-            self.assertIn("impact", action)
-            self.assertIn("difficulty", action)
-            self.assertIn("reason", action)
+            for key in ("title", "impact", "difficulty", "reason"):
+                self.assertIn(key, action)
+
+    def test_priority_levels(self) -> None:
+        for confidence, expected in ((0.2, "low"), (0.4, "medium"), (0.5, "medium"), (0.7, "high")):
+            with self.subTest(confidence=confidence):
+                remediation = generate_remediation({"analysis": {"primary_bottleneck": "cpu_compute", "confidence": confidence}})
+                self.assertEqual(remediation["priority"], expected)
+                self._assert_shape(remediation)
 
 
 if __name__ == "__main__":
@@ -1,208 +1,296 @@
 from __future__ import annotations
 
+import inspect
 import json
+import shutil
 import tempfile
 import unittest
+from importlib.util import find_spec
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from continuum.setup import main as setup_main
+if find_spec("typer") is not None:
+    import typer
+    from typer.models import ParameterInfo
 
+    from continuum.setup import main as setup_main
+else:
+    typer = None
+    ParameterInfo = None
+    setup_main = None
 
+
+def _cli_defaults(command):  # noqa: ANN001, ANN202
+    # Called directly, a typer command would receive its OptionInfo markers as argument
+    # values, so every option is passed explicitly with its CLI default.
+    return {
+        name: param.default.default
+        for name, param in inspect.signature(command).parameters.items()
+        if isinstance(param.default, ParameterInfo)
+    }
+
+
+def _run_setup(**options):  # noqa: ANN003, ANN202
+    return setup_main.setup_command(**{**_cli_defaults(setup_main.setup_command), **options})
+
+
+_OK_RESULT = SimpleNamespace(returncode=0, stdout="", stderr="")
+
+
+def _fake_run(cmd, **kwargs):  # noqa: ANN001, ANN003, ANN202
+    return _OK_RESULT
+
+
+@unittest.skipIf(find_spec("typer") is None, "typer is not installed in this interpreter")
 class TestSetupCommand(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._root = Path(tempfile.mkdtemp(prefix="continuum_setup_test_"))
+        cls.PIP = (setup_main.sys.executable, "-m", "pip")
+        cls.EXPECTED_PIP_BOOTSTRAP = (*cls.PIP, "install", "--upgrade", "pip", "setuptools", "wheel")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls._root, ignore_errors=True)
+
+    def setUp(self) -> None:
+        self.tmpdir = self._root / self._testMethodName
+        self.tmpdir.mkdir()
+        self.manifest_path = self.tmpdir / "env_manifest.json"
+        # Every setup run writes into this test's directory and runs no real commands;
+        # tests needing other behaviour nest one more patch over these.
+        for patcher in (
+            patch.multiple("continuum.setup.main", _resolve_manifest_path=Mock(return_value=self.manifest_path)),
+            patch.multiple("continuum.setup.main.subprocess", run=_fake_run),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
     def _assert_exit_code(self, exc: BaseException, expected: int) -> None:
-        code = getattr(exc, "code", None)
-        if code is None:
-            code = getattr(exc, "exit_code", None)
-        if code is None and isinstance(exc, SystemExit):
-            code = exc.code
-        self.assertEqual(code, expected)
+        self.assertIsInstance(exc, typer.Exit)
+        self.assertEqual(exc.exit_code, expected)
 
     def test_pip_commands_constructed_correctly(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "env_manifest.json"
-            req_path = Path(tmpdir) / "req.txt"
-            req_path.write_text("requests\n", encoding="utf-8")
+        manifest_path = self.manifest_path
+        req_path = self.tmpdir / "req.txt"
+        req_path.write_text("requests\n", encoding="utf-8")
 
-            run_calls: list[list[str]] = []
+        run_calls: list[tuple[str, ...]] = []
 
-            def _fake_run(cmd, capture_output, text, check):  # noqa: ANN001, ANN202
-                run_calls.append(list(cmd))
-                return SimpleNamespace(returncode=0, stdout="", stderr="")
+        def _fake_run(cmd, **kwargs):  # noqa: ANN001, ANN003, ANN202
+            if tuple(cmd[:3]) == self.PIP:
+                run_calls.append(tuple(cmd))
+            return _OK_RESULT
 
-            fake_torch = SimpleNamespace(
-                __version__="2.5.0",
-                cuda=SimpleNamespace(is_available=lambda: True),
-                version=SimpleNamespace(cuda="12.1"),
-            )
+        fake_torch = SimpleNamespace(
+            __version__="2.5.0",
+            cuda=SimpleNamespace(is_available=lambda: True),
+            version=SimpleNamespace(cuda="12.1"),
+        )
 
-            with patch("continuum.setup.main._resolve_manifest_path", return_value=manifest_path):
-                with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
-                    with patch("continuum.setup.main.import_module", return_value=fake_torch):
-                        with patch("continuum.setup.main.platform.system", return_value="Linux"):
-                            with patch("continuum.setup.main._safe_dist_version", side_effect=lambda name: "1.0.0" if name == "numpy" else None):
-                                with self.assertRaises(BaseException) as cm:
-                                    setup_main.setup_command(
-                                        with_torch=True,
-                                        torch_spec="torch==2.5.*",
-                                        torch_index="https://download.pytorch.org/whl/cu121",
-                                        numpy_spec="numpy==1.26.4",
-                                        upgrade=True,
-                                        requirements=req_path,
-                                        dry_run=False,
-                                        verbose=False,
-                                    )
-
-            self._assert_exit_code(cm.exception, 0)
-            self.assertGreaterEqual(len(run_calls), 5)
-            self.assertEqual(run_calls[0], [setup_main.sys.executable, "-m", "pip", "--version"])
-            self.assertEqual(
-                run_calls[1],
-                [setup_main.sys.executable, "-m", "pip", "install", "--upgrade", "pip", "setuptools", "wheel"],
-            )
-            self.assertEqual(
-                run_calls[2],
-                [setup_main.sys.executable, "-m", "pip", "install", "--upgrade", "numpy==1.26.4"],
-            )
-            self.assertEqual(
-                run_calls[3],
-                [
-                    setup_main.sys.executable,
-                    "-m",
-                    "pip",
-                    "install",
-                    "--upgrade",
-                    "--index-url",
-                    "https://download.pytorch.org/whl/cu121",
-                    "--extra-index-url",
-                    "https://pypi.org/simple",
-                    "torch==2.5.*",
-                ],
+        with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
+            with patch("continuum.setup.main.import_module", return_value=fake_torch):
+                with patch("continuum.setup.main.platform.system", return_value="Linux"):
+                    with patch("continuum.setup.main._safe_dist_version", side_effect=lambda name: "1.0.0" if name == "numpy" else None):
+                        with self.assertRaises(BaseException) as cm:
+                            _run_setup(
+                                with_torch=True,
+                                torch_spec="torch==2.5.*",
+                                torch_index="https://download.pytorch.org/whl/cu121",
+                                numpy_spec="numpy==1.26.4",
+                                upgrade=True,
+                                requirements=req_path,
+                                dry_run=False,
+                                verbose=False,
+                            )
+
+        self._assert_exit_code(cm.exception, 0)
+        self.assertEqual(len(run_calls), 3)
+        self.assertEqual(run_calls[0], self.EXPECTED_PIP_BOOTSTRAP)
+        self.assertEqual(
+            run_calls[1],
+            (
+                *self.PIP,
+                "install",
+                "--upgrade",
+                "--index-url",
+                "https://download.pytorch.org/whl/cu121",
+                "--extra-index-url",
+                "https://pypi.org/simple",
+                "torch==2.5.*",
+            ),
+        )
+        self.assertEqual(run_calls[2], (*self.PIP, "install", "--upgrade", "numpy==1.26.4", "-r", str(req_path)))
+
+    def test_torch_joins_main_install_without_torch_index(self) -> None:
+        with patch("continuum.setup.main.platform.system", return_value="Darwin"):
+            commands = setup_main._build_install_commands(
+                numpy_spec="numpy",
+                with_torch=True,
+                torch_spec=None,
+                torch_index=None,
+                upgrade=False,
+                requirements=None,
             )
-            self.assertEqual(
-                run_calls[4],
-                [setup_main.sys.executable, "-m", "pip", "install", "--upgrade", "-r", str(req_path)],
+
+        self.assertEqual(commands, [[*self.PIP, "install", "numpy", "torch"]])
+
+    def test_torch_index_install_precedes_requirements_with_torch_dependents(self) -> None:
+        req_path = self.tmpdir / "req.txt"
+        req_path.write_text("torchvision\naccelerate\n", encoding="utf-8")
+        with patch("continuum.setup.main.platform.system", return_value="Windows"):
+            commands = setup_main._build_install_commands(
+                numpy_spec="numpy",
+                with_torch=True,
+                torch_spec=None,
+                torch_index="https://download.pytorch.org/whl/cu121",
+                upgrade=False,
+                requirements=req_path,
             )
 
+        # Without --upgrade, pip keeps whichever torch the first run installed, so the
+        # CUDA-index run has to come before the requirements that would pull torch from PyPI.
+        self.assertEqual(len(commands), 2)
+        self.assertIn("--index-url", commands[0])
+        self.assertEqual(commands[0][-1], "torch")
+        self.assertEqual(commands[1], [*self.PIP, "install", "numpy", "-r", str(req_path)])
+
     def test_dry_run_does_not_call_subprocess(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "env_manifest.json"
-            with patch("continuum.setup.main._resolve_manifest_path", return_value=manifest_path):
-                with patch("continuum.setup.main.subprocess.run") as mock_run:
-                    with self.assertRaises(BaseException) as cm:
-                        setup_main.setup_command(
-                            with_torch=False,
-                            dry_run=True,
-                            verbose=False,
-                        )
-
-            self._assert_exit_code(cm.exception, 0)
-            for call in mock_run.call_args_list:
-                cmd = call.args[0] if call.args else []
-                if isinstance(cmd, list) and cmd:
-                    self.assertFalse(
-                        cmd[:3] == [setup_main.sys.executable, "-m", "pip"],
-                        "Dry-run should not execute pip subprocess commands.",
-                    )
-            self.assertTrue(manifest_path.exists())
-            self.assertTrue((manifest_path.parent / "requirements.txt").exists())
-            self.assertTrue((manifest_path.parent / "README.md").exists())
+        manifest_path = self.manifest_path
+        with patch("continuum.setup.main.subprocess.run") as mock_run:
+            with self.assertRaises(BaseException) as cm:
+                _run_setup(
+                    with_torch=False,
+                    dry_run=True,
+                    verbose=False,
+                )
+
+        self._assert_exit_code(cm.exception, 0)
+        for call in mock_run.call_args_list:
+            cmd = call.args[0] if call.args else []
+            if isinstance(cmd, list) and cmd:
+                self.assertFalse(
+                    tuple(cmd[:3]) == self.PIP,
+                    "Dry-run should not execute pip subprocess commands.",
+                )
+        self.assertTrue(manifest_path.exists())
+        self.assertTrue((manifest_path.parent / "requirements.txt").exists())
+        self.assertTrue((manifest_path.parent / "README.md").exists())
 
     def test_manifest_structure(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "env_manifest.json"
+        manifest_path = self.manifest_path
 
-            def _fake_run(cmd, capture_output, text, check):  # noqa: ANN001, ANN202
-                return SimpleNamespace(returncode=0, stdout="", stderr="")
+        with patch("continuum.setup.main._safe_dist_version", side_effect=lambda name: "1.26.4" if name == "numpy" else "0.1.0"):
+            with self.assertRaises(BaseException) as cm:
+                _run_setup(dry_run=False, with_torch=False)
 
-            with patch("continuum.setup.main._resolve_manifest_path", return_value=manifest_path):
-                with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
-                    with patch("continuum.setup.main._safe_dist_version", side_effect=lambda name: "1.26.4" if name == "numpy" else "0.1.0"):
-                        with self.assertRaises(BaseException) as cm:
-                            setup_main.setup_command(dry_run=False, with_torch=False)
-
-            self._assert_exit_code(cm.exception, 0)
-            payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-            self.assertIn("python_version", payload)
-            self.assertIn("platform", payload)
-            self.assertIn("architecture", payload)
-            self.assertIn("venv", payload)
-            self.assertIn("installed", payload)
-            self.assertIn("timestamp", payload)
-            self.assertIn("continuum_version", payload)
-            installed = payload["installed"]
-            self.assertIn("numpy", installed)
-            self.assertIn("torch", installed)
-            self.assertIn("torch_cuda_available", installed)
-            self.assertIn("torch_cuda_version", installed)
-            self.assertTrue((manifest_path.parent / "requirements.txt").exists())
-            self.assertTrue((manifest_path.parent / "README.md").exists())
-            req_lines = (manifest_path.parent / "requirements.txt").read_text(encoding="utf-8").splitlines()
-            self.assertTrue(any(line.startswith("numpy") for line in req_lines))
+        self._assert_exit_code(cm.exception, 0)
+        payload = json.loads(manifest_path.read_bytes())
+        self.assertIn("python_version", payload)
+        self.assertIn("platform", payload)
+        self.assertIn("architecture", payload)
+        self.assertIn("venv", payload)
+        self.assertIn("installed", payload)
+        self.assertIn("timestamp", payload)
+        self.assertIn("continuum_version", payload)
+        installed = payload["installed"]
+        self.assertIn("numpy", installed)
+        self.assertIn("torch", installed)
+        self.assertIn("torch_cuda_available", installed)
+        self.assertIn("torch_cuda_version", installed)
+        self.assertTrue((manifest_path.parent / "requirements.txt").exists())
+        self.assertTrue((manifest_path.parent / "README.md").exists())
+        req_lines = (manifest_path.parent / "requirements.txt").read_text(encoding="utf-8").splitlines()
+        self.assertTrue(any(line.startswith("numpy") for line in req_lines))
 
     def test_torch_import_failure_is_non_fatal(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "env_manifest.json"
-
-            def _fake_run(cmd, capture_output, text, check):  # noqa: ANN001, ANN202
-                return SimpleNamespace(returncode=0, stdout="", stderr="")
-
-            with patch("continuum.setup.main._resolve_manifest_path", return_value=manifest_path):
-                with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
-                    with patch("continuum.setup.main.import_module", side_effect=ImportError("no torch")):
-                        with patch("continuum.setup.main.platform.system", return_value="Darwin"):
-                            with self.assertRaises(BaseException) as cm:
-                                setup_main.setup_command(with_torch=True)
-
-            self._assert_exit_code(cm.exception, 0)
-            payload = json.loads(manifest_path.read_text(encoding="utf-8"))
-            installed = payload["installed"]
-            self.assertIsNone(installed["torch"])
-            self.assertIsNone(installed["torch_cuda_available"])
-            self.assertIsNone(installed["torch_cuda_version"])
-            notes = payload.get("notes", [])
-            self.assertTrue(any("torch validation failed" in str(note).lower() for note in notes))
+        manifest_path = self.manifest_path
 
-    def test_non_cuda_torch_fails_on_linux(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "env_manifest.json"
+        with patch("continuum.setup.main.import_module", side_effect=ImportError("no torch")):
+            with patch("continuum.setup.main.platform.system", return_value="Darwin"):
+                with self.assertRaises(BaseException) as cm:
+                    _run_setup(with_torch=True)
 
-            def _fake_run(cmd, capture_output, text, check):  # noqa: ANN001, ANN202
-                return SimpleNamespace(returncode=0, stdout="", stderr="")
+        self._assert_exit_code(cm.exception, 0)
+        payload = json.loads(manifest_path.read_bytes())
+        installed = payload["installed"]
+        self.assertIsNone(installed["torch"])
+        self.assertIsNone(installed["torch_cuda_available"])
+        self.assertIsNone(installed["torch_cuda_version"])
+        notes = payload.get("notes", [])
+        self.assertTrue(any("torch validation failed" in str(note).lower() for note in notes))
 
-            fake_torch = SimpleNamespace(
-                __version__="2.5.0",
-                cuda=SimpleNamespace(is_available=lambda: False),
-                version=SimpleNamespace(cuda=None),
-            )
+    def test_non_cuda_torch_fails_on_linux(self) -> None:
+        manifest_path = self.manifest_path
+
+        fake_torch = SimpleNamespace(
+            __version__="2.5.0",
+            cuda=SimpleNamespace(is_available=lambda: False),
+            version=SimpleNamespace(cuda=None),
+        )
 
-            with patch("continuum.setup.main._resolve_manifest_path", return_value=manifest_path):
-                with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
-                    with patch("continuum.setup.main.import_module", return_value=fake_torch):
-                        with patch("continuum.setup.main.platform.system", return_value="Linux"):
-                            with self.assertRaises(BaseException) as cm:
-                                setup_main.setup_command(with_torch=True)
+        with patch("continuum.setup.main.import_module", return_value=fake_torch):
+            with patch("continuum.setup.main.platform.system", return_value="Linux"):
+                with self.assertRaises(BaseException) as cm:
+                    _run_setup(with_torch=True)
 
-            self._assert_exit_code(cm.exception, 4)
+        self._assert_exit_code(cm.exception, 4)
 
     def test_state_readme_contains_paths(self) -> None:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            manifest_path = Path(tmpdir) / "env_manifest.json"
-
-            def _fake_run(cmd, capture_output, text, check):  # noqa: ANN001, ANN202
-                return SimpleNamespace(returncode=0, stdout="", stderr="")
-
-            with patch("continuum.setup.main._resolve_manifest_path", return_value=manifest_path):
-                with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
-                    with self.assertRaises(BaseException) as cm:
-                        setup_main.setup_command(with_torch=False)
-
-            self._assert_exit_code(cm.exception, 0)
-            readme_path = manifest_path.parent / "README.md"
-            content = readme_path.read_text(encoding="utf-8")
-            self.assertIn("env_manifest.json", content)
-            self.assertIn("requirements.txt", content)
+        manifest_path = self.manifest_path
+
+        with self.assertRaises(BaseException) as cm:
+            _run_setup(with_torch=False)
+
+        self._assert_exit_code(cm.exception, 0)
+        readme_path = manifest_path.parent / "README.md"
+        content = readme_path.read_text(encoding="utf-8")
+        self.assertIn("env_manifest.json", content)
+        self.assertIn("requirements.txt", content)
+
+    def test_manifest_skips_cuda_probe_on_darwin(self) -> None:
+        def _no_cuda_probe() -> bool:
+            raise AssertionError("CUDA should not be probed on darwin")
+
+        fake_torch = SimpleNamespace(
+            __version__="2.5.0",
+            cuda=SimpleNamespace(is_available=_no_cuda_probe),
+            version=SimpleNamespace(cuda=None),
+        )
+        with patch("continuum.setup.main.import_module", return_value=fake_torch):
+            with patch("continuum.setup.main.platform.system", return_value="Darwin"):
+                manifest = setup_main._build_manifest(with_torch=True, dry_run=False)
+
+        self.assertEqual(manifest["installed"]["torch"], "2.5.0")
+        self.assertIsNone(manifest["installed"]["torch_cuda_available"])
+        self.assertIn("CUDA probe skipped on darwin.", manifest["notes"])
+
+    def test_quiet_command_runs_once_and_reports_stderr_on_failure(self) -> None:
+        calls: list[dict] = []
+
+        def _fake_run(cmd, **kwargs):  # noqa: ANN001, ANN003, ANN202
+            calls.append(kwargs)
+            return SimpleNamespace(returncode=1, stdout=None, stderr="resolver error")
+
+        with patch("continuum.setup.main.subprocess.run", side_effect=_fake_run):
+            with patch("continuum.setup.main.typer.echo") as mock_echo:
+                with self.assertRaises(RuntimeError):
+                    setup_main._run_command(["pip", "install", "x"], dry_run=False, verbose=False)
+
+        self.assertEqual(len(calls), 1)
+        self.assertIs(calls[0]["stdout"], setup_main.subprocess.DEVNULL)
+        self.assertIs(calls[0]["stderr"], setup_main.subprocess.PIPE)
+        mock_echo.assert_called_once_with("resolver error", err=True)
+
+    def test_manifest_dump_matches_stdlib_fallback(self) -> None:
+        manifest = {"platform": "Linux-x86_64", "installed": {"numpy": "1.26.4", "torch": None}, "notes": ["café"]}
+        fast = setup_main._dump_manifest(manifest)
+        with patch("continuum.setup.main.orjson", None):
+            fallback = setup_main._dump_manifest(manifest)
+
+        self.assertEqual(fast, fallback)
+        self.assertEqual(json.loads(fast), manifest)
 
 
 if __name__ == "__main__":
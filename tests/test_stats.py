@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import itertools
+import unittest
+from unittest.mock import patch
+
+from continuum.profiler import stats
+
+
+class TestStats(unittest.TestCase):
+    def test_summarize_matches_pure_python_fallback(self) -> None:
+        values = [3.0, 1.0, 4.0, 1.5, 9.0, 2.6, 5.0]
+        vectorized = stats.summarize(values)
+        with patch("continuum.profiler.stats._np", None):
+            fallback = stats.summarize(values)
+
+        for left, right in zip(vectorized, fallback):
+            self.assertAlmostEqual(left, right, places=9)
+
+    def test_single_sample_has_zero_spread(self) -> None:
+        with patch("continuum.profiler.stats._np", None):
+            mean, std, p50, p95 = stats.summarize([2.5])
+
+        self.assertEqual((mean, std, p50, p95), (2.5, 0.0, 2.5, 2.5))
+
+    def test_percentile_interpolates_linearly(self) -> None:
+        self.assertAlmostEqual(stats.percentile([10.0, 20.0, 30.0, 40.0], 50.0), 25.0)
+        self.assertAlmostEqual(stats.percentile([10.0, 20.0, 30.0, 40.0], 95.0), 38.5)
+
+    def test_adaptive_warmup_stops_once_timings_settle(self) -> None:
+        calls = []
+        ticks = itertools.count(step=1_000_000)
+        stats.warm_up(lambda: calls.append(1), 10.0, lambda: next(ticks), adaptive=True)
+        self.assertEqual(len(calls), 16)
+
+        calls.clear()
+        ticks = itertools.count(step=1_000_000)
+        stats.warm_up(lambda: calls.append(1), 0.01, lambda: next(ticks), adaptive=False)
+        self.assertEqual(len(calls), 9)
+
+    def test_positive_coercion_falls_back_to_default(self) -> None:
+        self.assertEqual(stats.as_positive_float("2.5", default=1.0), 2.5)
+        self.assertEqual(stats.as_positive_float(-1, default=1.0), 1.0)
+        self.assertEqual(stats.as_positive_int("x", default=256), 256)
+        self.assertIsNone(stats.as_positive_int(None, default=None))
+
+    def test_round_metrics_matches_scalar_rounding(self) -> None:
+        values = [1.23456789, 2.0, 1e-9]
+        expected = [stats.round_metric(value) for value in values]
+        self.assertEqual(stats.round_metrics(values), expected)
+        with patch("continuum.profiler.stats._np", None):
+            self.assertEqual(stats.round_metrics(values), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()